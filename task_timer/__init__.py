@@ -3,8 +3,19 @@ __init__.py
 Brodie Rogers <brodie.rogers@students.cune.edu>
 2025-01-23
 
-Imports main
+Imports main and TaskManager
+
+Both are imported the first time they are used, so importing task_timer as
+a library doesn't load click or any of the commands.
 """
-from task_timer.__main__ import main
 
-__all__ = ["main"]
\ No newline at end of file
+def __getattr__(name):
+    if name == "main":
+        from task_timer.cli import main
+        return main
+    if name == "TaskManager":
+        from task_timer.manager import TaskManager
+        return TaskManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ["main", "TaskManager"]
@@ -0,0 +1,404 @@
+"""
+bench.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Benchmarks for the task timer. Synthetic stores of several sizes are
+created for every storage backend, and loading, saving, rendering the
+display, a batch of TaskManager toggles and running each command end to
+end are timed. Results are printed as JSON so runs can be saved and
+compared.
+
+Run with:
+    python -m task_timer.bench
+    python -m task_timer.bench --sizes 10,1000 --backend sqlite --output results.json
+    python -m task_timer.bench --imports-only
+"""
+import csv
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import click
+from task_timer import render
+from task_timer.color import Fore
+from task_timer.manager import TaskManager
+from task_timer.storage import BACKENDS, get_store
+from task_timer.storage.csv_store import HEADER
+from task_timer.status import TRACE_ENVVARS
+from task_timer.task import NS_PER_SECOND, STATUSES, Task
+
+SIZES = (10, 1000, 100000, 1000000)
+
+# The directory holding the task_timer package, which the processes started by the benchmarks import it from
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tasks toggled through one TaskManager, twice each, by the manager_toggle benchmark
+MANAGER_TASKS = 1000
+
+# Commands run end to end against every synthetic store
+COMMANDS = {
+    "list": ["list"],
+    "create": ["create", "--name", "bench-new"],
+    "toggle": ["toggle", "--name", "task-0"],
+    "reset": ["reset", "--name", "task-0"],
+    "edit": ["edit", "--name", "task-1", "-n", "task-1-renamed"],
+    "delete": ["delete", "--name", "bench-new"],
+    "report": ["report"],
+    "save": ["save", "--filename", "export.csv"],
+    "load": ["load", "--filename", "export.csv"],
+}
+
+def make_tasks(count, seed=0):
+    """
+    Returns count tasks with a mix of statuses and times up to 20 hours.
+
+    Parameters:
+        count (int): Number of tasks
+        seed (int): Seed for the random times, so runs are comparable
+    """
+    generator = random.Random(seed)
+    tasks = []
+    for number in range(count):
+        task = Task(f"task-{number}")
+        task.status = generator.choice(STATUSES)
+        if task.status != "Off":
+            task.elapsed_ns = generator.randrange(20 * 3600 * NS_PER_SECOND)
+        if task.status == "Active":
+            task.start_time = time.time()
+            task.mono_start_ns = time.monotonic_ns()
+        task.dirty = False
+        task.events = []
+        tasks.append(task)
+    return tasks
+
+def synthetic_rows(count, seed=0):
+    """
+    Yields count task rows in the CSV column order, without building Tasks.
+    """
+    generator = random.Random(seed)
+    now = time.time()
+    for number in range(count):
+        status = generator.choice(STATUSES)
+        elapsed_ns = 0 if status == "Off" else generator.randrange(20 * 3600 * NS_PER_SECOND)
+        start_time = now if status == "Active" else None
+        end_time = now if status == "Paused" else None
+        yield [f"task-{number}", status, elapsed_ns / NS_PER_SECOND, start_time, end_time, elapsed_ns / NS_PER_SECOND, elapsed_ns, None, None]
+
+def write_store(backend, path, count):
+    """
+    Fills a new store with count synthetic tasks.
+
+    Rows are written straight to the backend's files, since saving a million
+    tasks through the store would take longer than the benchmark itself.
+
+    Parameters:
+        backend (str): One of the storage BACKENDS
+        path (str): The task file
+        count (int): Number of tasks
+    """
+    store = get_store(path, backend)
+    if backend == "sqlite":
+        from task_timer.storage.sqlite_store import COLUMNS
+        with store.connection:
+            store.connection.executemany(f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", synthetic_rows(count))
+        store.connection.close()
+        return
+
+    # The journal store starts out as just its CSV snapshot
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER)
+        writer.writerows(synthetic_rows(count))
+
+def legacy_row(task):
+    """
+    Formats a row the way Task.__str__ did before rows were cached, with
+    strftime for the time and the colored columns rebuilt every call.
+    """
+    if task.status == "Off":
+        status_str = f"{Fore.RED}{task.status}{Fore.RESET}"
+    elif task.status == "Paused":
+        status_str = f"{Fore.MAGENTA}{task.status}{Fore.RESET}"
+    elif task.status == "Active":
+        status_str = f"{Fore.GREEN}{task.status}{Fore.RESET}"
+
+    tot_time = task.elapsed()
+    if tot_time <= 60:
+        tot_time = f"{tot_time:.0f}"
+    elif tot_time > 60 and tot_time < 3600:
+        tot_time = time.strftime("%M:%S", time.gmtime(tot_time))
+    elif tot_time >= 3600:
+        tot_time = time.strftime("%H:%M:%S", time.gmtime(tot_time))
+    return f"{Fore.BLUE}{task.task_name}{Fore.RESET}{" " * (15 - len(task.task_name))}| {status_str}{" " * (12 - len(task.status))} | {tot_time}"
+
+def best_time(function, repeat):
+    """
+    Returns the fastest of repeat runs of function, in seconds.
+    """
+    return min(run_times(function, repeat))
+
+def run_times(function, repeat):
+    """
+    Returns how long each of repeat runs of function took, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+def bench_rows(count=10000, repeat=5):
+    """
+    Times formatting every row of a count task display frame.
+
+    Returns:
+        dict: Seconds per frame for the legacy and cached formatters, and the speedup.
+    """
+    tasks = make_tasks(count)
+    paused = [task for task in tasks if task.status != "Active"]
+    if [legacy_row(task) for task in paused] != [str(task) for task in paused]:
+        raise AssertionError("cached rows differ from the legacy rows")
+
+    legacy = best_time(lambda: [legacy_row(task) for task in tasks], repeat)
+    cached = best_time(lambda: [str(task) for task in tasks], repeat)
+    return {"rows": count, "legacy_seconds": legacy, "cached_seconds": cached, "speedup": legacy / cached}
+
+# Most seconds importing each module may take in a new interpreter, the
+# modules imported before the timing starts, and modules it must not load
+# (only the ones the import itself loads count, not the interpreter's own).
+# Importing the package as a library should cost next to nothing. The
+# command line entry point needs click, whose own import takes from 10 ms
+# (click 8.2) to over 60 ms (click 8.5, which loads inspect, typing and
+# uuid), so click is imported first and only what task-timer adds to it,
+# about 6 ms, is held to the budget.
+IMPORT_BUDGETS = {
+    "task_timer": (0.005, (), ("click", "colorama", "sqlite3", "csv", "task_timer.cli")),
+    "task_timer.cli": (0.015, ("click",), ("colorama", "sqlite3", "csv", "task_timer.storage", "task_timer.daemon", "task_timer.commands.list")),
+    "task_timer.status": (0.005, (), ("click", "colorama", "sqlite3", "csv", "json", "re", "functools", "task_timer.cli", "task_timer.storage", "task_timer.task")),
+}
+
+# Most seconds `task-timer status --active` may take in a new interpreter,
+# importing task_timer.status and answering from the status cache, and the
+# modules it must not load. Shell prompts run it every time they are drawn.
+STATUS_BUDGET = (0.005, ("click", "colorama", "sqlite3", "csv", "json", "re", "functools", "task_timer.cli", "task_timer.storage", "task_timer.task"))
+
+def environment(**variables):
+    """
+    Returns the environment for a process started by a benchmark, which
+    imports task_timer from this checkout wherever it runs.
+
+    Parameters:
+        variables: Environment variables to set on top of this process's
+    """
+    env = dict(os.environ, **variables)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (PACKAGE_ROOT, env.get("PYTHONPATH"))))
+    return env
+
+def run_python(args, keep_output=True, **kwargs):
+    """
+    Runs the Python interpreter with args, raising with its error output if it fails.
+
+    Parameters:
+        args (list): The interpreter's arguments
+        keep_output (bool): Whether to return stdout, which is thrown away otherwise
+
+    Returns:
+        str: What it printed to stdout, None if it wasn't kept.
+    """
+    stdout = subprocess.PIPE if keep_output else subprocess.DEVNULL
+    process = subprocess.run([sys.executable, *args], stdout=stdout, stderr=subprocess.PIPE, text=True, **kwargs)
+    if process.returncode != 0:
+        raise RuntimeError(f"'python {' '.join(args)}' failed with exit code {process.returncode}:\n{process.stderr}")
+    return process.stdout
+
+def bench_import(module="task_timer.cli", repeat=5):
+    """
+    Times importing a module in a new interpreter.
+
+    Returns:
+        dict: Seconds per run (not counting interpreter startup or the
+              modules imported first), the modules it must not load that it
+              did, and whether it met its budget.
+    """
+    budget, preloaded, forbidden = IMPORT_BUDGETS.get(module, (None, (), ()))
+    code = (
+        "".join(f"import {name}; " for name in preloaded)
+        + "import sys, time; before = set(sys.modules); start = time.perf_counter(); "
+        + f"import {module}; seconds = time.perf_counter() - start; "
+        + f"print(seconds); print(' '.join(name for name in {list(forbidden)!r} if name in sys.modules and name not in before))"
+    )
+    times = []
+    loaded = []
+    for _ in range(repeat):
+        output = run_python(["-c", code], env=environment()).splitlines()
+        times.append(float(output[0]))
+        loaded = output[1].split() if len(output) > 1 else []
+    within = not loaded and (budget is None or min(times) <= budget)
+    return {
+        "module": module,
+        "runs": times,
+        "budget_seconds": budget,
+        "imported_first": list(preloaded),
+        "unexpected_modules": loaded,
+        "within_budget": within,
+    }
+
+def bench_status(repeat=5):
+    """
+    Times the status fast path end to end in a new interpreter: importing
+    task_timer.status and answering `status --active` from the cache of a
+    store with one active task.
+
+    Returns:
+        dict: Seconds per run (not counting interpreter startup), the
+              modules it must not load that it did, and whether it met its
+              budget and answered from the cache.
+    """
+    budget, forbidden = STATUS_BUDGET
+    code = (
+        "import io, sys, time; before = set(sys.modules); stdout = sys.stdout; sys.stdout = io.StringIO(); "
+        + "start = time.perf_counter(); "
+        + "from task_timer.status import fast_path; code = fast_path(['--active']); "
+        + "seconds = time.perf_counter() - start; sys.stdout = stdout; "
+        + f"print(code); print(seconds); print(' '.join(name for name in {list(forbidden)!r} if name in sys.modules and name not in before))"
+    )
+    times = []
+    loaded = []
+    answered = True
+    with tempfile.TemporaryDirectory(prefix="task-timer-bench-") as directory:
+        path = os.path.join(directory, "tasks.csv")
+        with TaskManager(get_store(path, "csv")) as manager:
+            manager.create("bench")
+            manager.toggle("bench")
+
+        env = environment(TASK_TIMER_FILE=path, TASK_TIMER_BACKEND="csv")
+        for name in (*TRACE_ENVVARS, "TASK_TIMER_NAMESPACE"):
+            env.pop(name, None)
+        for _ in range(repeat):
+            output = run_python(["-c", code], env=env).splitlines()
+            answered = answered and output[0] == "0"
+            times.append(float(output[1]))
+            loaded = output[2].split() if len(output) > 2 else []
+    within = answered and not loaded and min(times) <= budget
+    return {
+        "module": "task_timer.status.fast_path",
+        "runs": times,
+        "budget_seconds": budget,
+        "answered_from_cache": answered,
+        "unexpected_modules": loaded,
+        "within_budget": within,
+    }
+
+def bench_store(backend, count, repeat=3):
+    """
+    Times the store operations, the display and every command against a
+    synthetic store of count tasks.
+
+    Returns:
+        list: One result dict per benchmark.
+    """
+    results = []
+
+    def result(name, times):
+        results.append({"benchmark": name, "backend": backend, "tasks": count, "seconds": min(times), "runs": times})
+
+    with tempfile.TemporaryDirectory(prefix="task-timer-bench-") as directory:
+        path = os.path.join(directory, "tasks.csv")
+        write_store(backend, path, count)
+
+        result("load_tasks", run_times(lambda: get_store(path, backend).load(), repeat))
+
+        store = get_store(path, backend)
+        task_list = store.load()
+
+        def save():
+            task_list[0].reset()
+            store.save(task_list)
+        result("save_tasks", run_times(save, repeat))
+
+        def update():
+            task = store.get("task-0")
+            task.reset()
+            store.update([task])
+        result("update_task", run_times(update, repeat))
+
+        def manager_toggle():
+            # Toggling twice leaves every task as it was, so each run does the same work
+            with TaskManager(store) as manager:
+                for name in names:
+                    manager.toggle(name)
+                    manager.toggle(name)
+        names = [f"task-{index}" for index in range(min(count, MANAGER_TASKS))]
+        result("manager_toggle", run_times(manager_toggle, repeat))
+
+        def frame():
+            screen = render.Screen(io.StringIO())
+            screen.draw([str(task) for task in task_list])
+        result("display_frame", run_times(frame, repeat))
+        del task_list
+
+        env = environment(TASK_TIMER_BACKEND=backend, TASK_TIMER_FILE=path, TASK_TIMER_SOCKET=os.path.join(directory, "none.sock"))
+        for name, args in COMMANDS.items():
+            def command():
+                run_python(["-m", "task_timer", *args], keep_output=False, cwd=directory, env=env)
+            # Commands that change the store run once, so every run starts from the same state
+            result(f"command_{name}", run_times(command, 1 if name in ("create", "edit", "delete", "load") else repeat))
+
+    return results
+
+@click.command()
+@click.option("--sizes", default=",".join(str(size) for size in SIZES), show_default=True, help="Comma separated store sizes.")
+@click.option("--backend", "backends", multiple=True, type=click.Choice(list(BACKENDS)), help="Backends to benchmark, all by default.")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True, help="Runs per benchmark, the fastest is reported.")
+@click.option("--output", type=click.File("w"), default="-", help="Where to write the JSON results.")
+@click.option("--imports-only", is_flag=True, help="Only check the import and status budgets, exiting with 1 if one is exceeded.")
+def main(sizes, backends, repeat, output, imports_only):
+    """
+    Runs the benchmark suite and writes the results as JSON.
+    """
+    if imports_only:
+        results = [bench_import(module, repeat) for module in IMPORT_BUDGETS]
+        results.append(bench_status(repeat))
+        json.dump(results, output, indent=2)
+        output.write("\n")
+        if not all(result["within_budget"] for result in results):
+            sys.exit(1)
+        return
+
+    sizes = [int(size) for size in sizes.split(",") if size.strip()]
+    backends = backends or list(BACKENDS)
+
+    results = []
+    row_result = bench_rows(repeat=repeat)
+    results.append({"benchmark": "format_rows_legacy", "tasks": row_result["rows"], "seconds": row_result["legacy_seconds"]})
+    results.append({"benchmark": "format_rows", "tasks": row_result["rows"], "seconds": row_result["cached_seconds"]})
+
+    for module in IMPORT_BUDGETS:
+        result = bench_import(module, repeat)
+        results.append({"benchmark": f"import_{module}", "seconds": min(result["runs"]), **result})
+    result = bench_status(repeat)
+    results.append({"benchmark": "status_fast_path", "seconds": min(result["runs"]), **result})
+
+    for backend in backends:
+        for size in sizes:
+            click.echo(f"Benchmarking {backend} with {size} tasks", err=True)
+            results.extend(bench_store(backend, size, repeat))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.time(),
+        "results": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+if __name__ == "__main__":
+    main()
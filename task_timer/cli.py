@@ -0,0 +1,293 @@
+"""
+cli.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The task-timer command group and the store helpers its commands share.
+
+Only the group is defined here. Each command lives in its own module in
+task_timer.commands and is imported when it is run (or listed by --help),
+so running one command never imports the code and dependencies of the rest.
+"""
+from task_timer import trace
+import click
+import functools
+import importlib
+import os
+import sys
+from task_timer import location
+from task_timer.color import Fore
+
+trace.mark_imported()
+
+# The store file, looked up by task_file() the first time it is needed
+TASK_FILE = None
+NAMESPACE = None
+
+# Options that trace this call, which then always runs in this process
+TRACE_OPTIONS = ("--profile", "--trace-file", "--profile-stats")
+TRACE_ENVVARS = ("TASK_TIMER_TRACE", "TASK_TIMER_TRACE_FILE", "TASK_TIMER_PROFILE_STATS")
+
+# Stands in for the store path when only a namespace is being checked
+DEFAULT_STORE = location.DEFAULT_FILE
+
+# Group options followed by a value, skipped when looking for the command name
+VALUE_OPTIONS = ("--trace-file", "--profile-stats", "--namespace", "-N")
+
+_store = None
+
+def task_file():
+    """
+    Returns the store file for NAMESPACE, looked up once per process.
+    
+    See task_timer.location for where stores are looked for.
+    """
+    global TASK_FILE
+    if TASK_FILE is None:
+        TASK_FILE = location.resolve(NAMESPACE)[0]
+    return TASK_FILE
+
+def open_store():
+    """
+    Returns the configured store for task_file(), created once per process.
+    
+    The store backend is selected with the TASK_TIMER_BACKEND environment
+    variable (csv, journal or sqlite).
+    """
+    global _store
+    if _store is None or _store.path != task_file():
+        from task_timer.storage import get_store
+        _store = get_store(task_file())
+    return _store
+
+def use_namespace(namespace):
+    """
+    Switches the commands that run next to the store of another namespace.
+    
+    Parameters:
+        namespace (str): The namespace, None for the default store
+    """
+    global NAMESPACE, TASK_FILE
+    if namespace != NAMESPACE:
+        NAMESPACE = namespace
+        TASK_FILE = None
+
+def task_manager():
+    """
+    Returns a TaskManager over the configured store, which the commands
+    make their changes through.
+
+    When the command's options were checked against every stored task,
+    the manager starts with those tasks instead of reading them again.
+    """
+    from task_timer.manager import TaskManager
+
+    # Tasks read to check the command's --name values, see params.task_names
+    ctx = click.get_current_context(silent=True)
+    tasks = ctx.obj.get("tasks") if ctx is not None and isinstance(ctx.obj, dict) else None
+    return TaskManager(open_store(), tasks=tasks)
+
+def save_changes(manager):
+    """
+    Saves the changes made through a TaskManager, reporting instead of raising on failure.
+    
+    Parameters:
+        manager (TaskManager): The manager holding the changes
+    """
+    try:
+        manager.flush()
+    except Exception as e:
+        click.echo(f"Failed to save tasks: {e}")
+
+def load_selected(manager, names, names_file=None, case_sensitive=True):
+    """
+    Loads every task chosen with --name and --names-file in one read of the store.
+    
+    Names that aren't stored are reported and skipped. Each task is only
+    returned once, however many times it was named or matched.
+    
+    Parameters:
+        manager (TaskManager): The manager to load the tasks through
+        names (tuple): Tuples of task names, as converted by TaskPattern
+        names_file (file, optional): A file with one task name per line
+        case_sensitive (bool): Whether names in names_file must match exactly
+    
+    Returns:
+        list: The Task objects, in the order they were named.
+    """
+    from task_timer.params import read_names
+
+    selected = [task_name for group in names for task_name in group]
+    if names_file is not None:
+        found, missing = read_names(names_file, open_store, case_sensitive)
+        for task_name in missing:
+            click.echo(f"{Fore.RED}Task {Fore.RESET}{Fore.MAGENTA}'{task_name}'{Fore.RESET}{Fore.RED} not found.{Fore.RESET}")
+        selected += found
+    elif not selected:
+        raise click.UsageError("Missing option '--name' or '--names-file'.")
+
+    selected = [*dict.fromkeys(selected)]
+    try:
+        tasks = manager.get_many(selected)
+    except Exception as e:
+        click.echo(f"Failed to load tasks: {e}")
+        return []
+    return [tasks[task_name] for task_name in selected if task_name in tasks]
+
+def forward(args, command):
+    """
+    Runs a command on the `task-timer serve` process for the store, if there is one.
+    
+    The daemon module is only imported when a server's socket exists.
+    
+    Parameters:
+        args (list): The command line arguments, without the program name
+        command (str): The name of the command being run
+    
+    Returns:
+        dict or None: The server's reply, or None if the command should run here.
+    """
+    path = location.socket_path(task_file())
+    if not os.path.exists(path):
+        return None
+    from task_timer import daemon
+    if command in daemon.LOCAL_COMMANDS:
+        return None
+    if NAMESPACE is not None:
+        # The namespace may come from this process's environment, which the server doesn't share
+        args = ["--namespace", NAMESPACE, *args]
+    return daemon.forward(args, path, task_file())
+
+def locked(command):
+    """
+    Runs a command inside a store transaction.
+    
+    Commands that read, change and save tasks are wrapped with this so
+    several task-timer processes running at once apply their changes one
+    after another instead of overwriting each other.
+    """
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs):
+        with open_store().transaction():
+            return command(*args, **kwargs)
+    return wrapper
+
+class TracedCommand(click.Command):
+    """
+    A command whose run is timed as the command phase when tracing is on.
+    """
+    def invoke(self, ctx):
+        with trace.span("command", self.name):
+            return super().invoke(ctx)
+
+# Commands that change tasks, which hold the store's lock from before their options are checked
+LOCKED_COMMANDS = ("create", "delete", "edit", "reset", "toggle")
+
+# Every command, each defined in the task_timer.commands module of the same name
+COMMANDS = ("create", "delete", "display", "edit", "init", "list", "load", "report", "reset", "save", "serve", "shard", "status", "toggle", "watch", "where")
+
+class TaskTimerGroup(click.Group):
+    """
+    The task-timer command group.
+    
+    Commands are imported from task_timer.commands the first time they are
+    looked up. When a `task-timer serve` process is running for the store,
+    commands are sent to it instead of being run here.
+    """
+    def list_commands(self, ctx):
+        return sorted({*self.commands, *COMMANDS})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in COMMANDS:
+            module = importlib.import_module(f"task_timer.commands.{cmd_name}")
+            self.add_command(getattr(module, cmd_name))
+            # Importing the command is part of the import phase when tracing
+            trace.mark_imported()
+        return self.commands.get(cmd_name)
+
+    def main(self, args=None, **extra):
+        if args is None:
+            args = sys.argv[1:]
+
+        # The server can't read this process's stdin, so those commands run here
+        reads_stdin = "--names-file=-" in args or any(
+            arg == "--names-file" and value == "-" for arg, value in zip(args, args[1:])
+        )
+        # A traced call has to run here to measure anything
+        traced = any(arg.split("=")[0] in TRACE_OPTIONS for arg in args) or any(
+            os.environ.get(name, "").lower() not in ("", "0", "false", "no") for name in TRACE_ENVVARS
+        )
+
+        # The group options are read here too, to find the server of the right store
+        namespace = os.environ.get("TASK_TIMER_NAMESPACE") or None
+        command = None
+        options = iter(args)
+        for arg in options:
+            if arg in VALUE_OPTIONS:
+                value = next(options, None)
+                if arg in ("--namespace", "-N"):
+                    namespace = value
+            elif arg.startswith("--namespace="):
+                namespace = arg.split("=", 1)[1]
+            elif not arg.startswith("-"):
+                command = arg
+                break
+
+        reply = None
+        if not (reads_stdin or traced):
+            try:
+                use_namespace(namespace)
+                reply = forward(args, command)
+            except ValueError:
+                # An invalid namespace, reported when the options are parsed
+                pass
+        if reply is not None:
+            sys.stdout.write(reply["output"])
+            sys.exit(reply["exit_code"])
+
+        return super().main(args, **extra)
+
+@click.group(cls=TaskTimerGroup)
+@click.option("--profile", is_flag=True, envvar="TASK_TIMER_TRACE", help="Print how long each phase of the command took to stderr.")
+@click.option("--trace-file", type=click.Path(dir_okay=False), envvar="TASK_TIMER_TRACE_FILE", help="Save the phase timings as a Chrome trace (JSON).")
+@click.option("--profile-stats", type=click.Path(dir_okay=False), envvar="TASK_TIMER_PROFILE_STATS", help="Run cProfile and save its stats to this file.")
+@click.option("--namespace", "-N", envvar="TASK_TIMER_NAMESPACE", help="Use the separate store of this namespace.")
+@click.pass_context
+def main(ctx, profile, trace_file, profile_stats, namespace):
+    """
+    Task Timer CLI: A command-line interface for managing task timers.
+    
+    Provides a suite of commands for creating, managing, and monitoring task timers.
+    Supports concurrent task tracking, time editing, and data persistence.
+    
+    Tracing:\n
+        - --profile (or TASK_TIMER_TRACE=1) prints the time spent importing,
+          reading the store, parsing, running the command, writing the store
+          and rendering\n
+        - --trace-file saves the same timings for chrome://tracing or Perfetto\n
+        - --profile-stats saves cProfile stats for pstats or snakeviz\n
+    
+    Store Location:\n
+        - $TASK_TIMER_FILE, the nearest .task-timer directory (see 'init'),
+          tasks.csv in the current directory, or the XDG data directory\n
+        - --namespace (or TASK_TIMER_NAMESPACE) uses a separate store beside it\n
+    """
+    try:
+        location.namespace_file(DEFAULT_STORE, namespace)
+    except ValueError as e:
+        raise click.BadParameter(str(e), ctx, param_hint="'--namespace'")
+    use_namespace(namespace)
+
+    if profile or trace_file or profile_stats:
+        trace.start(profile_stats)
+
+        def finish():
+            summary = trace.stop(trace_file)
+            if profile:
+                for line in summary:
+                    click.echo(line, err=True)
+        ctx.call_on_close(finish)
+
+    if ctx.invoked_subcommand in LOCKED_COMMANDS:
+        # Names are checked against the tasks the command then changes, which mustn't change in between
+        ctx.with_resource(open_store().transaction())
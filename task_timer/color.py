@@ -0,0 +1,62 @@
+"""
+color.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Terminal colors. Fore stands in for colorama.Fore: while stdout is a
+terminal it holds colorama's codes, otherwise every color is an empty
+string, so output sent to a pipe or file is plain and colorama is never
+imported.
+"""
+import sys
+
+NAMES = ("BLACK", "RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "WHITE", "RESET")
+
+class Palette():
+    """
+    The foreground colors, as attributes named like colorama.Fore's.
+
+    Attributes:
+        enabled (bool): Whether the colors are colorama's codes or empty strings
+    """
+
+    def __init__(self):
+        """
+        Initializes the palette with every color off.
+        """
+        self.enabled = False
+        for name in NAMES:
+            setattr(self, name, "")
+
+Fore = Palette()
+
+def _set(enabled):
+    if enabled:
+        import colorama
+        codes = {name: getattr(colorama.Fore, name) for name in NAMES}
+    else:
+        codes = dict.fromkeys(NAMES, "")
+    for name, code in codes.items():
+        setattr(Fore, name, code)
+    Fore.enabled = enabled
+
+def use(enabled):
+    """
+    Turns the colors on or off for everything printed from now on.
+
+    The server uses this to color each reply the way its client's terminal
+    wants, whatever the server's own stdout is.
+
+    Parameters:
+        enabled (bool): Whether to color output
+    """
+    enabled = bool(enabled)
+    if enabled == Fore.enabled:
+        return
+    _set(enabled)
+
+    # Rows are cached with the colors they were built with
+    from task_timer.task import row_prefix
+    row_prefix.cache_clear()
+
+_set(sys.stdout is not None and sys.stdout.isatty())
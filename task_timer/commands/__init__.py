@@ -0,0 +1,8 @@
+"""
+__init__.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The task-timer commands, one module per command. Modules are imported by
+the command group in task_timer.cli when their command is looked up.
+"""
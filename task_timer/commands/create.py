@@ -0,0 +1,40 @@
+"""
+create.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer create` command.
+"""
+import click
+from task_timer.cli import TracedCommand, locked, save_changes, task_manager
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=str, help="Create New Tasks.")
+@locked
+def create(name):
+    """
+    Creates a new task timer instance.
+    
+    If no name is provided, automatically generates a name in the format 'taskN'
+    where N is the next available number. Prevents duplicate task names to ensure
+    unique identification of each task.
+    
+    Parameters:\n
+        - name (str, optional): Custom name for the task\n
+    
+    Returns:\n
+        - Confirmation message indicating success or failure of task creation\n
+    
+    Error Handling:\n
+        - Prevents creation of tasks with duplicate names\n
+        - Provides feedback on creation status with color-coded output\n
+    """
+
+    manager = task_manager()
+    try:
+        task = manager.create(name)
+    except ValueError:
+        return click.echo(f"{Fore.MAGENTA}{name}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.RED} Couldn't be Created due to the name being in use!{Fore.RESET}")
+    save_changes(manager)
+    click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.GREEN} Successfully Created{Fore.RESET}")
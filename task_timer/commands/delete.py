@@ -0,0 +1,42 @@
+"""
+delete.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer delete` command.
+"""
+import click
+from task_timer.cli import TracedCommand, load_selected, locked, open_store, save_changes, task_manager
+from task_timer.params import TaskPattern
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskPattern(open_store, case_sensitive=False), multiple=True, help="Delete a given task. Can be repeated and can be a glob such as 'client-*'.")
+@click.option("--names-file", type=click.File("r"), help="File with one task name per line, '-' for stdin.")
+@locked
+def delete(name, names_file):
+    """
+    Removes the specified tasks from the task list.
+    
+    Permanently deletes the tasks and their associated timing data.
+    Automatically updates the persistent storage after deletion, once
+    for all of the selected tasks.
+    
+    Parameters:\n
+        - name (str): Names or glob patterns of the tasks to delete\n
+        - names_file (file): File with one task name per line\n
+    
+    Error Handling:\n
+        - Validates task existence before deletion\n
+        - Provides feedback on deletion status\n
+        - Updates CSV file to reflect changes\n
+    """
+    manager = task_manager()
+    task_list = load_selected(manager, name, names_file, case_sensitive=False)
+    if not task_list:
+        return
+    for task in task_list:
+        manager.delete(task.task_name)
+    save_changes(manager)
+    for task in task_list:
+        click.echo(f"{Fore.GREEN}Successfully removed task{Fore.RESET} {Fore.MAGENTA}'{task.task_name}'{Fore.RESET}{Fore.GREEN}!{Fore.RESET}") 
@@ -0,0 +1,126 @@
+"""
+display.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer display` command.
+"""
+import click
+import os
+import sys
+from task_timer import render
+from task_timer.cli import TracedCommand, open_store
+from task_timer.params import TaskName
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskName(open_store, case_sensitive=False), help="Real time display of the selected timer(s)")
+@click.option("--stream", is_flag=True, help="Print a JSON Lines snapshot, then the changes every tick, instead of the table.")
+@click.option("--full", is_flag=True, help="With --stream, print a full snapshot every tick instead of changes.")
+@click.option("--interval", type=click.FloatRange(min=0.05), default=1, show_default=True, help="Seconds between updates.")
+def display(name, stream, full, interval):
+    """
+    Provides real-time display of task timer information.
+    
+    Continuously updates the display showing current task status and elapsed time.
+    Supports viewing either a single specified task or all tasks simultaneously.
+    
+    Display Modes:\n
+        - Single Task: Shows detailed information for specified task\n
+        - All Tasks: Displays overview of all tasks when no name specified\n
+    
+    Parameters:\n
+        - name (str, optional): Name of specific task to display\n
+        - stream (bool): Print JSON Lines for scripts instead of the table\n
+        - full (bool): Stream a snapshot every tick instead of changes\n
+        - interval (float): Seconds between updates\n
+    
+    Stream Lines:\n
+        {"type": "snapshot", "time": ..., "tasks": [{"name", "status", "seconds", "started"}, ...]}\n
+        {"type": "diff", "time": ..., "changed": [...], "removed": [names]}\n
+    
+    User Interface:\n
+        - Updates every second, or every --interval seconds\n
+        - Picks up changes made from other terminals\n
+        - Provides clean display with task status and elapsed time\n
+        - Supports 'c' key to exit display mode\n
+        
+    Format:\n
+        Task Name      | Task Status  | Task Time\n
+        -----------------------------------------\n
+        [task entries]\n
+        -----------------------------------------\n
+    """
+    # Following one task only reads the shard it is in
+    store = open_store() if name is None else open_store().store_for(name)
+    try:
+        task_list = store.load()
+    except Exception as e:
+        click.echo(f"Failed to load tasks: {e}")
+        task_list = []
+    version = store.version()
+
+    def reload():
+        """
+        Picks up changes made to the store by other task-timer commands.
+        """
+        nonlocal task_list, version
+        current = store.version()
+        if current != version:
+            version = current
+            try:
+                task_list = store.refresh(task_list)
+            except Exception:
+                # The store is being written, try again next tick
+                version = None
+        return task_list
+
+    if stream:
+        from task_timer.output import stream_tasks
+
+        def load():
+            task_list = reload()
+            return task_list if name is None else [task for task in task_list if task.task_name == name]
+        try:
+            stream_tasks(load, interval=interval, full=full)
+        except KeyboardInterrupt:
+            pass
+        except BrokenPipeError:
+            # The reader went away, don't fail again flushing stdout on exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+
+    if name == None:
+        """
+        Displays all tasks in real-time, updating every second.
+        """
+        if len(task_list) == 0:
+            print(f"No current tasks. Use the {Fore.MAGENTA}'Create'{Fore.RESET} command to create tasks.")
+            return
+
+        def frame():
+            return [
+                f"Enter {Fore.BLUE}'c'{Fore.RESET} to exit display:",
+                f"{Fore.WHITE}Task Name      | Task Status  | Task Time{Fore.RESET}",
+                f"{Fore.WHITE}-----------------------------------------{Fore.RESET}",
+                *(str(task) for task in reload()),
+                f"{Fore.WHITE}-----------------------------------------{Fore.RESET}",
+            ]
+        render.live(frame, interval)
+
+    elif name in (task.task_name for task in task_list):
+        """
+        Displays a specific task in real-time, updating every second.
+        """
+        def frame():
+            return [
+                f"Enter {Fore.BLUE}'c'{Fore.RESET} to exit display:",
+                "Task Name      | Task Status  | Task Time",
+                "-----------------------------------------",
+                *(str(task) for task in reload() if task.task_name == name),
+                "-----------------------------------------",
+            ]
+        render.live(frame, interval)
+
+    else:
+        print(f"{Fore.MAGENTA}{name}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.RED} NOT A VALID TASK!!!{Fore.RESET}")
@@ -0,0 +1,64 @@
+"""
+edit.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer edit` command.
+"""
+import click
+from task_timer.cli import TracedCommand, locked, open_store, save_changes, task_manager
+from task_timer.params import TaskName
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskName(open_store), required=True, help="The name of the timer to edit.")
+@click.option("-n", type=str, help="Use this when wanting to change name.")
+@click.option("-t", type=int, help="Seconds to add use '-' value to subtract seconds. Must be toggled off!")
+@locked
+def edit(name, n, t):
+    """
+    Modifies properties of an existing task.
+    
+    Supports editing task names and adjusting accumulated time.
+    Provides atomic operations for name changes and time adjustments.
+    
+    Parameters:\n
+        - timer (str): Name of the task to edit\n
+        - n (str, optional): New name for the task\n
+        - t (int, optional): Time adjustment in seconds (positive to add, negative to subtract)
+    
+    Edit Operations:\n
+        - Name Change: Updates task identifier while preventing duplicates\n
+        - Time Adjustment: Modifies accumulated time while preserving task state\n
+    
+    Error Handling:\n
+        - Prevents duplicate names during rename\n
+        - Validates time adjustments\n
+        - Ensures task is in appropriate state for editing\n
+        - Provides detailed feedback on edit operations\n
+    """
+    manager = task_manager()
+    task = manager.get(name)
+    if task is None:
+        return
+
+    if n:
+        try:
+            manager.edit(name, new_name=n)
+        except ValueError:
+            return click.echo(f"{Fore.MAGENTA}{n}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.RED} Couldn't be Created due to the name being in use!{Fore.RESET}")
+        click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.GREEN} Successfully changed from {Fore.RESET}'{Fore.MAGENTA}{name}{Fore.RESET}'{Fore.RESET}")
+
+    if t:
+        try:
+            manager.edit(task.task_name, seconds=t)
+            if task.elapsed_ns == 0:
+                click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}:{Fore.RESET}{Fore.GREEN} Timer set to {Fore.MAGENTA}0{Fore.RED} seconds.{Fore.RESET}")
+            elif t > 0:
+                click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}:{Fore.RESET}{Fore.GREEN} Successfully added {Fore.RESET}{Fore.MAGENTA}{t}{Fore.RESET} seconds.{Fore.RESET}")
+            else:
+                click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}:{Fore.RESET}{Fore.GREEN} Successfully subtracted {Fore.RESET}{Fore.MAGENTA}{t*-1}{Fore.RESET} seconds.{Fore.RESET}")
+        except ValueError:
+            click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}:{Fore.RESET}{Fore.RED} time can't be edited {Fore.RESET}")
+
+    save_changes(manager)
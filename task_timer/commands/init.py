@@ -0,0 +1,30 @@
+"""
+init.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer init` command.
+"""
+import click
+import os
+from task_timer import location
+from task_timer.cli import TracedCommand
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+def init():
+    """
+    Starts a task store for the project in the current directory.
+    
+    Creates a .task-timer directory here. Commands run in this directory or
+    any directory below it then use the tasks kept in it, and namespaces of
+    the project are kept beside them.
+    """
+    directory = os.path.join(os.getcwd(), location.PROJECT_DIR)
+    if os.path.isdir(directory):
+        return click.echo(f"{Fore.BLUE}{directory}{Fore.RESET} {Fore.RED}already exists.{Fore.RESET}")
+    try:
+        os.mkdir(directory)
+    except Exception as e:
+        return click.echo(f"{Fore.RED}Failed to create {directory}. {e}{Fore.RESET}")
+    click.echo(f"{Fore.GREEN}Tasks for this project will be kept in{Fore.RESET} {Fore.BLUE}{directory}{Fore.RESET}")
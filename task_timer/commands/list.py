@@ -0,0 +1,65 @@
+"""
+list.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer list` command.
+"""
+import click
+import itertools
+import sys
+from task_timer import trace
+from task_timer.cli import TracedCommand, open_store
+from task_timer.output import OUTPUT_FORMATS, write_tasks
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--format", "fmt", type=click.Choice(OUTPUT_FORMATS), default="text", show_default=True, help="json, jsonl or tsv print uncolored records for scripts.")
+def list(fmt):
+    """
+    Displays all current tasks with their names, statuses, and run times.
+    
+    --format json, jsonl or tsv prints each task's name, status, seconds
+    and the time its current run started instead of the table, without
+    colors or padding. Errors go to stderr so the output stays parseable.
+    
+    Output Format:\n
+        Task Name      | Task Status  | Task Time\n
+        -----------------------------------------\n
+        [task entries]\n
+        -----------------------------------------\n
+    
+    Status Colors:\n
+        - Red: Off\n
+        - Magenta: Paused\n
+        - Green: Active\n
+    """
+    # Tasks are printed as they are read, so a sharded store is read one shard at a time
+    if fmt != "text":
+        with trace.span("render"):
+            try:
+                write_tasks(open_store().iter_tasks(), sys.stdout, fmt)
+            except Exception as e:
+                click.echo(f"Failed to load tasks: {e}", err=True)
+        return
+
+    try:
+        tasks = open_store().iter_tasks()
+        first = next(tasks, None)
+    except Exception as e:
+        click.echo(f"Failed to load tasks: {e}")
+        first = None
+    if first is None:
+        click.echo(f"No current tasks. Use the {Fore.MAGENTA}'create'{Fore.RESET} command to add tasks.")
+        return
+
+    with trace.span("render"):
+        click.echo("")
+        print(f"{Fore.WHITE}Task Name      | Task Status  | Task Time{Fore.RESET}")
+        print(f"{Fore.WHITE}-----------------------------------------{Fore.RESET}")
+        try:
+            for task in itertools.chain([first], tasks):
+                click.echo(task)
+        except Exception as e:
+            click.echo(f"Failed to load tasks: {e}")
+        print(f"{Fore.WHITE}-----------------------------------------{Fore.RESET}")
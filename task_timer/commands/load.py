@@ -0,0 +1,52 @@
+"""
+load.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer load` command.
+"""
+import click
+from task_timer import transfer
+from task_timer.cli import TracedCommand, open_store
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--filename", default='tasks.csv', help="Loads task data from a file written by save.")
+@click.option("--format", "fmt", type=click.Choice(transfer.EXPORT_FORMATS), help="File format, guessed from the file extension by default.")
+@click.option("--on-duplicate", type=click.Choice(transfer.MERGE_POLICIES), default="skip", show_default=True,
+              help="What to do with imported tasks whose name already exists.")
+@click.option("--batch-size", type=click.IntRange(min=1), default=transfer.BATCH_SIZE, show_default=True,
+              help="Number of tasks written to the store at a time.")
+def load(filename, fmt, on_duplicate, batch_size):
+    """
+    Imports task data from a CSV, JSON Lines or Parquet file.
+    
+    Reconstructs task objects from saved data, including all timing
+    information and status data, and adds them to the store.
+    
+    Parameters:\n
+        - filename (str): Source file name, defaults to 'tasks.csv'\n
+        - fmt (str): csv, jsonl or parquet (parquet needs pyarrow)\n
+        - on_duplicate (str): skip, overwrite or sum tasks that already exist\n
+        - batch_size (int): Number of tasks written at a time\n
+    
+    Data Handling:\n
+        - Rows are read one at a time and written in batches, so memory use
+          doesn't grow with the size of the file\n
+        - Tasks are matched by name, including names repeated in the file\n
+        - Preserves all task attributes from file\n
+    
+    Error Handling:\n
+        - Validates CSV format and data integrity\n
+        - Provides feedback on load operation status\n
+    """
+    try:
+        counts = transfer.import_tasks(open_store(), transfer.read_rows(filename, fmt), on_duplicate, batch_size)
+    except Exception as e:
+        click.echo(f"{Fore.RED}Faild to load tasks. {e}{Fore.RESET}")
+        return
+
+    click.echo(f"{Fore.MAGENTA}{counts['added']}{Fore.RESET} {Fore.GREEN}Tasks loaded from {filename}{Fore.RESET}")
+    for result in ("overwritten", "summed", "skipped"):
+        if counts[result]:
+            click.echo(f"{Fore.MAGENTA}{counts[result]}{Fore.RESET} duplicate tasks {result}")
@@ -0,0 +1,62 @@
+"""
+report.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer report` command.
+"""
+import click
+from task_timer import rollup, trace
+from task_timer.cli import TracedCommand, open_store
+from task_timer.task import format_time
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--by", type=click.Choice(rollup.PERIODS), default="day", show_default=True, help="Length of each report period.")
+@click.option("--since", type=click.DateTime(["%Y-%m-%d"]), help="First day to include (YYYY-MM-DD).")
+@click.option("--until", type=click.DateTime(["%Y-%m-%d"]), help="Last day to include (YYYY-MM-DD).")
+@click.option("--name", multiple=True, help="Only report on this task, can be repeated.")
+def report(by, since, until, name):
+    """
+    Shows the time tracked on each task per day, week or month.
+    
+    Reports are added up from daily totals that are updated every time a
+    task is paused, so long ranges don't read every run. Time added or
+    removed with 'edit -t' and time cleared with 'reset' isn't counted.
+    
+    Output Format:\n
+        Period     | Task Name      | Task Time\n
+        -----------------------------------------\n
+        [period entries]\n
+        -----------------------------------------\n
+        Total      |                | [total time]\n
+    """
+    try:
+        periods = rollup.report(
+            open_store(),
+            by,
+            since.date() if since else None,
+            until.date() if until else None,
+            name or None,
+        )
+    except Exception as e:
+        click.echo(f"{Fore.RED}Failed to build report. {e}{Fore.RESET}")
+        return
+
+    if not periods:
+        click.echo(f"No tracked time to report. Toggle a task with the {Fore.MAGENTA}'toggle'{Fore.RESET} command first.")
+        return
+
+    total = 0.0
+    with trace.span("render"):
+        click.echo("")
+        click.echo(f"{Fore.WHITE}Period     | Task Name      | Task Time{Fore.RESET}")
+        click.echo(f"{Fore.WHITE}-----------------------------------------{Fore.RESET}")
+        for period, totals in periods.items():
+            label = period
+            for task_name in sorted(totals):
+                click.echo(f"{label:<11}| {Fore.BLUE}{task_name}{Fore.RESET}{" " * (15 - len(task_name))}| {format_time(totals[task_name])}")
+                label = ""
+                total += totals[task_name]
+        click.echo(f"{Fore.WHITE}-----------------------------------------{Fore.RESET}")
+        click.echo(f"{"Total":<11}| {" " * 15}| {format_time(total)}")
@@ -0,0 +1,45 @@
+"""
+reset.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer reset` command.
+"""
+import click
+from task_timer.cli import TracedCommand, load_selected, locked, open_store, save_changes, task_manager
+from task_timer.params import TaskPattern
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskPattern(open_store), multiple=True, help="Reset a given timer. Can be repeated and can be a glob such as 'client-*'.")
+@click.option("--names-file", type=click.File("r"), help="File with one task name per line, '-' for stdin.")
+@locked
+def reset(name, names_file):   
+    """
+    Resets the specified task timers to initial state.
+    
+    Clears all timing data while preserving the task's existence.
+    Resets the accumulated time to zero, an active task keeps running from zero.
+    
+    Parameters:\n
+        - name (str): Names or glob patterns of the tasks to reset\n
+        - names_file (file): File with one task name per line\n
+    
+    Reset Actions:\n
+        - Clears start_time and end_time\n
+        - Resets elapsed_ns to zero\n
+        - Maintains task name and existence\n
+    
+    Error Handling:\n
+        - Validates task existence before reset\n
+        - Provides feedback on reset operation status\n
+    """
+    manager = task_manager()
+    task_list = load_selected(manager, name, names_file)
+    if not task_list:
+        return
+    for task in task_list:
+        manager.reset(task.task_name)
+    save_changes(manager)
+    for task in task_list:
+        click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}{Fore.WHITE}:{Fore.RESET}{Fore.GREEN} Successfully reset.{Fore.RESET}")
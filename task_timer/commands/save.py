@@ -0,0 +1,66 @@
+"""
+save.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer save` command.
+"""
+import click
+import itertools
+import sys
+from task_timer import transfer
+from task_timer.cli import TracedCommand, open_store
+from task_timer.storage.lock import atomic_write
+from task_timer.task import STATUSES
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option('--filename', default='tasks.csv', help="The name of the file to save task data to, '-' for stdout.")
+@click.option('--format', 'fmt', type=click.Choice(transfer.EXPORT_FORMATS), help="Export format, guessed from the file extension by default.")
+@click.option('--status', multiple=True, type=click.Choice(STATUSES, case_sensitive=False), help="Only save tasks with this status, can be repeated.")
+@click.option('--match', help="Only save tasks whose name matches this glob, such as 'client-*'.")
+def save(filename, fmt, status, match): 
+    """
+    Exports current task data to a CSV, JSON Lines or Parquet file.
+    
+    Saves all task information including status, timing data, and metadata
+    to a specified file for persistence or data transfer. Tasks are read
+    from the store and written one at a time.
+    
+    Parameters:\n
+        - filename (str): Target file name, defaults to 'tasks.csv', '-' writes to stdout\n
+        - fmt (str): csv, jsonl or parquet (parquet needs pyarrow)\n
+        - status (str): Only export tasks with these statuses\n
+        - match (str): Only export tasks whose name matches this glob\n
+    
+    File Format:\n
+        - CSV with headers for all task attributes, readable by load\n
+        - JSON Lines with one object per task\n
+        - Preserves complete task state including timing information\n
+    
+    Error Handling:\n
+        - Handles file write errors gracefully\n
+        - Provides feedback on save operation status\n
+    """
+    fmt = transfer.export_format(filename, fmt)
+    to_stdout = filename == "-"
+
+    try:
+        tasks = transfer.select_tasks(open_store().iter_tasks(), status, match)
+        first = next(tasks, None)
+        if first is None:
+            click.echo(f"{Fore.RED}No tasks to save.{Fore.RESET}", err=to_stdout)
+            return
+        tasks = itertools.chain([first], tasks)
+
+        if to_stdout:
+            stream = sys.stdout.buffer if fmt == "parquet" else sys.stdout
+            transfer.export_tasks(tasks, stream, fmt)
+            stream.flush()
+            return
+
+        with atomic_write(filename, mode="wb" if fmt == "parquet" else "w") as file:
+            count = transfer.export_tasks(tasks, file, fmt)
+        click.echo(f"{Fore.MAGENTA}{count}{Fore.RESET} {Fore.GREEN}Tasks saved to {filename}{Fore.RESET}")
+    except Exception as e:
+        click.echo(f"{Fore.RED}Faild to save tasks. {e}{Fore.RESET}", err=to_stdout)
@@ -0,0 +1,43 @@
+"""
+serve.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer serve` command.
+"""
+import click
+import signal
+from task_timer import cli, daemon, location
+from task_timer.cli import TracedCommand, task_file
+from task_timer.storage import get_store
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--socket", "socket_file", type=str, help="Socket to listen on, defaults to the task file with a .sock extension.")
+def serve(socket_file):
+    """
+    Runs a task timer server that keeps every task in memory.
+    
+    While the server runs, the other commands (except display) send their
+    arguments to it over a Unix domain socket and print its reply, so they
+    don't load or save the store themselves. The server writes every change
+    through to the store. Stop it with Ctrl-C.
+    
+    Parameters:\n
+        - socket_file (str, optional): Path of the Unix domain socket\n
+    """
+    path = socket_file or location.socket_path(task_file())
+
+    try:
+        store = cli._store = daemon.MemoryStore(get_store(task_file()))
+    except Exception as e:
+        return click.echo(f"{Fore.RED}Failed to load tasks. {e}{Fore.RESET}")
+
+    # Stop the same way as Ctrl-C when killed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    click.echo(f"{Fore.GREEN}Serving{Fore.RESET} {Fore.MAGENTA}{len(store.tasks)}{Fore.RESET} tasks on {Fore.BLUE}{path}{Fore.RESET}")
+    try:
+        daemon.serve(cli.main, path, store.path)
+    except KeyboardInterrupt:
+        pass
+    click.echo(f"{Fore.GREEN}Server stopped.{Fore.RESET}")
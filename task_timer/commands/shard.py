@@ -0,0 +1,49 @@
+"""
+shard.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer shard` command.
+"""
+import click
+from task_timer import cli, daemon
+from task_timer.cli import TracedCommand, open_store, task_file
+from task_timer.storage import backend_name
+from task_timer.storage.sharded import DEFAULT_HASH_SHARDS, DEFAULT_SEPARATOR, SHARD_MODES, reshard
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--by", type=click.Choice([*SHARD_MODES, "none"]), required=True, help="Shard by name prefix, by a hash of the name, or merge the shards back into one store.")
+@click.option("--separator", default=DEFAULT_SEPARATOR, show_default=True, help="Ends the prefix of a task name when sharding by prefix.")
+@click.option("--count", type=click.IntRange(min=1), default=DEFAULT_HASH_SHARDS, show_default=True, help="Number of shards when sharding by hash.")
+def shard(by, separator, count):
+    """
+    Splits the store into shards, or merges the shards back together.
+    
+    Commands that work on named tasks only read and write the shards those
+    tasks are in, and list and display read the shards one at a time, so
+    their cost stops growing with the tasks of every other project.
+    
+    Parameters:\n
+        - by (str): prefix, hash or none\n
+        - separator (str): With --by prefix, 'client/report' is kept in the 'client' shard\n
+        - count (int): With --by hash, the number of shards\n
+    
+    Notes:\n
+        - Stop a running 'serve' process first\n
+        - The backend in use is recorded and used for every shard from then on\n
+        - Interval history and reports are kept as they are\n
+    """
+    store = open_store()
+    if daemon.serving:
+        return click.echo(f"{Fore.RED}Stop the task-timer server before sharding the store.{Fore.RESET}")
+
+    try:
+        store = cli._store = reshard(store, backend_name(store), by, separator, count)
+    except Exception as e:
+        return click.echo(f"{Fore.RED}Failed to shard tasks. {e}{Fore.RESET}")
+
+    if by == "none":
+        click.echo(f"{Fore.GREEN}Merged the shards into{Fore.RESET} {Fore.BLUE}{task_file()}{Fore.RESET}")
+    else:
+        click.echo(f"{Fore.GREEN}Split{Fore.RESET} {Fore.MAGENTA}{len(store.names())}{Fore.RESET} {Fore.GREEN}tasks into{Fore.RESET} {Fore.MAGENTA}{len(store.manifest['shards'])}{Fore.RESET} {Fore.GREEN}shards{Fore.RESET}")
@@ -0,0 +1,40 @@
+"""
+status.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer status` command.
+"""
+import click
+from task_timer.cli import TracedCommand, open_store, task_file
+from task_timer.status import read_cache, rebuild, status_lines
+
+@click.command(cls=TracedCommand)
+@click.option("--active", is_flag=True, help="Print each active task and its time, one per line.")
+def status(active):
+    """
+    Prints how many tasks are active, or with --active which ones, for shell
+    prompts and status bars.
+    
+    Answered from a small cache of the active tasks kept beside the store
+    and updated by every command that changes tasks, usually before the
+    rest of task-timer (or click) is even imported. The cache is rebuilt
+    from the store when it is missing or out of date.
+    
+    Parameters:\n
+        - active (bool): List the active tasks instead of counting them\n
+    
+    Output Format:\n
+        status: 2\n
+        status --active: <name> <time>, one line per active task\n
+    """
+    data = read_cache(task_file())
+    if data is None:
+        store = open_store()
+        try:
+            with store.transaction():
+                data = rebuild(store)
+        except Exception as e:
+            return click.echo(f"Failed to load tasks: {e}", err=True)
+    for line in status_lines(data, active):
+        click.echo(line)
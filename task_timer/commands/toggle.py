@@ -0,0 +1,51 @@
+"""
+toggle.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer toggle` command.
+"""
+import click
+from task_timer.cli import TracedCommand, load_selected, locked, open_store, save_changes, task_manager
+from task_timer.params import TaskPattern
+from task_timer.color import Fore
+
+TOGGLE_MESSAGES = {
+    "start": "Started Successfully",
+    "pause": "Successfully Paused",
+    "resume": "Resumed Successfully",
+}
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskPattern(open_store, case_sensitive=False), multiple=True, help="Toggle selected timer on or off. Can be repeated and can be a glob such as 'client-*'.")
+@click.option("--names-file", type=click.File("r"), help="File with one task name per line, '-' for stdin.")
+@locked
+def toggle(name, names_file):
+    """
+    Toggles the state of the specified task timers.
+    
+    Manages the task's state transitions between Off, Active, and Paused states.
+    Each toggle action updates the task's timing information appropriately.
+    Every selected task is toggled and then saved together.
+    
+    State Transitions:\n
+        - Off -> Active: Starts the timer\n
+        - Paused -> Active: Resumes the timer\n
+        - Active -> Paused: Pauses the timer\n
+    
+    Parameters:\n
+        - name (str): Names or glob patterns of the tasks to toggle, must match existing tasks\n
+        - names_file (file): File with one task name per line\n
+    
+    Error Handling:\n
+        - Validates task existence before attempting state change\n
+        - Preserves accumulated time during pause/resume cycles\n
+    """
+    manager = task_manager()
+    for task in load_selected(manager, name, names_file, case_sensitive=False):
+        try:
+            event = manager.toggle(task.task_name)
+            click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}: {Fore.GREEN}{TOGGLE_MESSAGES[event]}{Fore.RESET}")
+        except Exception as e:
+            click.echo(f"{Fore.RED}Faild to toggle task. {e}{Fore.RESET}")
+    save_changes(manager)
@@ -0,0 +1,74 @@
+"""
+watch.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer watch` command.
+"""
+import asyncio
+import click
+import signal
+from task_timer.cli import TracedCommand, open_store
+from task_timer.params import Duration, TaskPattern
+from task_timer.task import format_time
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+@click.option("--name", type=TaskPattern(open_store, case_sensitive=False), multiple=True, help="Task to watch, every task by default. Can be repeated and can be a glob such as 'client-*'.")
+@click.option("--after", type=Duration(), required=True, help="Task time the alarm goes off at, such as 25m or 1h30m.")
+@click.option("--every", type=Duration(), help="Go off again every DURATION after that.")
+@click.option("--exec", "command", type=str, help="Shell command to run when the alarm goes off. $TASK_TIMER_TASK holds the task's name.")
+def watch(name, after, every, command):
+    """
+    Sets off an alarm when a task's time reaches a duration.
+    
+    Runs until Ctrl-C, following toggles, resets, edits, renames and deletes
+    made from other terminals. Without --name, tasks created while watching
+    are watched too. Alarms only count time while their task is active, and
+    one that went off goes off again after its task is reset.
+    
+    Parameters:\n
+        - name (str): Names or glob patterns of the tasks to watch\n
+        - after (duration): Task time the alarm goes off at\n
+        - every (duration, optional): Time between repeats of the alarm\n
+        - command (str, optional): Shell command to run when the alarm goes off\n
+    
+    Hook Environment:\n
+        - TASK_TIMER_TASK: The task's name\n
+        - TASK_TIMER_ELAPSED: The task's time in seconds\n
+        - TASK_TIMER_ALARM: The alarm's duration in seconds\n
+        - TASK_TIMER_FIRED: How many times the alarm went off\n
+    """
+    from task_timer.engine import TimerEngine
+
+    store = open_store()
+    try:
+        task_list = store.load()
+    except Exception as e:
+        return click.echo(f"{Fore.RED}Failed to load tasks. {e}{Fore.RESET}")
+    selected = {task_name for group in name for task_name in group}
+
+    def announce(task, alarm):
+        click.echo(f"{Fore.MAGENTA}{task.task_name}{Fore.RESET}: {Fore.YELLOW}Reached {format_time(task.elapsed())}{Fore.RESET}")
+
+    engine = TimerEngine()
+
+    def add(task):
+        engine.add_alarm(task, after, callback=announce, command=command, every=every)
+
+    for task in task_list:
+        if not selected or task.task_name in selected:
+            add(task)
+
+    async def run():
+        # Watching every task includes the ones created while watching
+        await asyncio.gather(engine.run(), engine.sync(store, task_list, added=None if selected else add))
+
+    # Stop the same way as Ctrl-C when killed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    click.echo(f"{Fore.GREEN}Watching{Fore.RESET} {Fore.MAGENTA}{len(engine._alarms)}{Fore.RESET} tasks, Ctrl-C to stop.")
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    click.echo(f"{Fore.GREEN}Stopped watching.{Fore.RESET}")
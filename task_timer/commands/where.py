@@ -0,0 +1,28 @@
+"""
+where.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The `task-timer where` command.
+"""
+import click
+from task_timer import cli, location
+from task_timer.cli import TracedCommand
+from task_timer.color import Fore
+
+@click.command(cls=TracedCommand)
+def where():
+    """
+    Shows which store commands run here use, and the namespaces beside it.
+    """
+    path, source = location.resolve(cli.NAMESPACE)
+    sources = {
+        "env": "TASK_TIMER_FILE",
+        "project": "the project's .task-timer directory",
+        "cwd": "the current directory",
+        "data": "the user data directory",
+    }
+    click.echo(f"{Fore.BLUE}{path}{Fore.RESET} (from {sources[source]})")
+    namespaces = location.namespaces(location.resolve()[0])
+    if namespaces:
+        click.echo(f"Namespaces: {', '.join(f'{Fore.MAGENTA}{name}{Fore.RESET}' for name in namespaces)}")
@@ -0,0 +1,257 @@
+"""
+daemon.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+A long running task timer server. `task-timer serve` keeps every task in
+memory and owns writing them to the store, and while it runs the other
+commands send their arguments over a Unix domain socket instead of
+loading and saving the store themselves.
+
+Protocol:
+    The client sends one JSON line: {"args": [...], "cwd": "...", "color": bool, "store": "..."}
+    The server answers with one JSON line: {"output": "...", "exit_code": int}
+
+    "store" is the store file the client resolved. The server refuses to
+    run a command meant for another store than its own.
+"""
+import copy
+import io
+import json
+import os
+import socket
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from task_timer.location import socket_path
+from task_timer.storage.base import Store
+
+# Commands that always run in the calling process
+LOCAL_COMMANDS = {"display", "serve", "watch"}
+
+# Set while this process is the server, so commands it runs aren't forwarded again
+serving = False
+
+def forward(args, path, store=None):
+    """
+    Runs a command on the server if one is listening.
+
+    Parameters:
+        args (list): The command line arguments, without the program name
+        path (str): The server's socket
+        store (str, optional): The store file the command is meant for
+
+    Returns:
+        dict or None: The server's reply, or None if the command should run
+                      locally because it is interactive or no server is running.
+    """
+    if serving or not args or args[0] in LOCAL_COMMANDS or not os.path.exists(path):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        client.close()
+        # The socket was left behind by a server that is no longer running
+        return None
+
+    with client:
+        request = {"args": list(args), "cwd": os.getcwd(), "color": sys.stdout.isatty(), "store": store}
+        try:
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("rb") as reply:
+                line = reply.readline()
+        except (BrokenPipeError, ConnectionResetError):
+            line = b""
+    if not line:
+        # The server closed the connection without answering, as a stale
+        # socket's listener that is shutting down does, so nothing was run
+        return None
+    return json.loads(line)
+
+class MemoryStore(Store):
+    """
+    A store that keeps every task in memory and writes changes through to
+    another store.
+
+    Tasks handed out are copies, so a command that fails half way through
+    never leaves the in-memory state different from what was saved.
+
+    Attributes:
+        backend (Store): The store changes are written to
+        tasks (dict): The current tasks by name, in store order
+    """
+
+    indexed = True
+
+    def __init__(self, backend):
+        """
+        Initializes the store by loading every task from the backend once.
+
+        Parameters:
+            backend (Store): The store changes are written to.
+        """
+        super().__init__(backend.path)
+        self.backend = backend
+        self._reload()
+
+    def _reload(self):
+        self.tasks = {task.task_name: task for task in self.backend.load()}
+        self._version = self.backend.version()
+
+    def _current(self):
+        # Commands run outside the server, such as traced ones, write the store directly
+        if self.backend.version() != self._version:
+            self._reload()
+        return self.tasks
+
+    def _copy(self, task):
+        task = copy.copy(task)
+        task.events = []
+        return task
+
+    def transaction(self):
+        return self.backend.transaction()
+
+    def transaction_id(self):
+        return self.backend.transaction_id()
+
+    def load(self):
+        return [self._copy(task) for task in self._current().values()]
+
+    def get(self, name):
+        task = self._current().get(name)
+        return None if task is None else self._copy(task)
+
+    def get_many(self, names):
+        tasks = self._current()
+        return {name: self._copy(tasks[name]) for name in names if name in tasks}
+
+    def find(self, name, case_sensitive=True):
+        tasks = self._current()
+        if name in tasks:
+            return name
+        if case_sensitive:
+            return None
+        return next((task_name for task_name in tasks if task_name.casefold() == name.casefold()), None)
+
+    def names(self):
+        return list(self._current())
+
+    def files(self):
+        return self.backend.files()
+
+    def settle(self):
+        self.backend.settle()
+
+    def save(self, task_list, removed=()):
+        with self.transaction():
+            self.backend.save(task_list, removed)
+            self._version = self.backend.version()
+        self.tasks = {task.task_name: self._copy(task) for task in task_list}
+
+    def update(self, changed, removed=()):
+        """
+        Applies the changes to the tasks in memory and saves the whole list
+        to the backend, which never has to read the store again.
+
+        Parameters:
+            changed (list): Task objects that were created or modified
+            removed (iterable): Names of tasks to delete
+        """
+        with self.transaction():
+            tasks = self._current()
+            renamed = {}
+            for task in changed:
+                old_names = [value for event, value in task.events if event == "rename"]
+                if old_names:
+                    renamed[old_names[0]] = task.task_name
+            if renamed:
+                tasks = {renamed.get(name, name): task for name, task in tasks.items()}
+
+            removed = [name for name in removed if name in tasks]
+            for name in removed:
+                del tasks[name]
+            for task in changed:
+                tasks[task.task_name] = task
+
+            # Only the changed tasks are dirty, so backends that write single rows still do
+            self.save(list(tasks.values()), removed)
+
+def _run(command, request, store_path=None):
+    """
+    Runs one forwarded command and captures everything it prints.
+    """
+    import click
+    from task_timer import color
+    from task_timer.params import invalidate_names
+
+    store = request.get("store")
+    if store_path is not None and store is not None and os.path.abspath(store) != os.path.abspath(store_path):
+        return {"output": f"Server for {store_path} can't run commands for {store}\n", "exit_code": 1}
+
+    output = io.StringIO()
+    exit_code = 0
+    cwd = os.getcwd()
+    invalidate_names()
+    # Colored the way the client's terminal wants, not the server's
+    color.use(request.get("color"))
+    try:
+        os.chdir(request.get("cwd", cwd))
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                command.main(request["args"], prog_name="task-timer", standalone_mode=False, color=request.get("color"))
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except click.exceptions.Abort:
+                click.echo("Aborted!", err=True)
+                exit_code = 1
+    except Exception as e:
+        output.write(f"Server failed to run command: {e}\n")
+        exit_code = 1
+    finally:
+        os.chdir(cwd)
+    return {"output": output.getvalue(), "exit_code": exit_code}
+
+def serve(command, path, store_path=None):
+    """
+    Answers forwarded commands until interrupted.
+
+    Requests are handled one at a time, so commands never interleave.
+
+    Parameters:
+        command (click.Group): The task-timer command group to run requests with
+        path (str): The socket to listen on
+        store_path (str, optional): The store file served, requests for other stores are refused
+    """
+    global serving
+    serving = True
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen()
+        while True:
+            client, _ = server.accept()
+            try:
+                with client, client.makefile("rb") as reader:
+                    line = reader.readline()
+                    if not line:
+                        continue
+                    reply = _run(command, json.loads(line), store_path)
+                    client.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+            except (OSError, ValueError):
+                # A client that hung up or sent garbage shouldn't stop the server
+                continue
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
+        serving = False
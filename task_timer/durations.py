@@ -0,0 +1,42 @@
+"""
+durations.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Formatting task times. Kept apart from task.py so `task-timer status` can
+format times without importing the Task class or the colors.
+"""
+
+# Number of formatted times kept before the cache is cleared
+CACHE_SIZE = 65536
+
+# Formatted whole seconds, a dict so `task-timer status` doesn't import functools
+_formatted = {}
+
+def format_time(seconds):
+    """
+    Formats a number of seconds the way task times are shown.
+    
+    Parameters:
+        seconds (float): The time to format
+    
+    Returns:
+        str: Whole seconds up to a minute, then MM:SS, then HH:MM:SS.
+    """
+    if seconds <= 60:
+        return f"{seconds:.0f}"
+    seconds = int(seconds)
+    text = _formatted.get(seconds)
+    if text is None:
+        if len(_formatted) >= CACHE_SIZE:
+            _formatted.clear()
+        text = _formatted[seconds] = _format_whole_seconds(seconds)
+    return text
+
+def _format_whole_seconds(seconds):
+    # Plain integer arithmetic, strftime was the slowest part of drawing a row
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes:02d}:{seconds:02d}"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
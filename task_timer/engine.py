@@ -0,0 +1,362 @@
+"""
+engine.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Runs many timers at once in asyncio and fires alarms when a task's time
+reaches a threshold, such as a Pomodoro after 25 minutes or a budget that
+is used up. Alarms wait in a single heap ordered by when they are due, so
+the engine sleeps until the next alarm instead of checking every task
+every second, however many tasks and alarms it holds.
+
+Example:
+    import asyncio
+    from task_timer import TaskManager
+    from task_timer.engine import TimerEngine
+
+    async def pomodoro():
+        with TaskManager() as tasks:
+            tasks.toggle("report")
+        engine = TimerEngine()
+        engine.add_alarm(tasks["report"], 25 * 60, callback=lambda task, alarm: engine.stop())
+        await engine.run()
+
+    asyncio.run(pomodoro())
+"""
+import asyncio
+import heapq
+import inspect
+import itertools
+import os
+import time
+from task_timer.task import NS_PER_SECOND
+
+class Alarm():
+    """
+    Fires once a task's total time reaches a number of seconds, and again
+    every `every` seconds after that if it repeats.
+
+    An alarm that fired is armed again when its task's time drops back
+    below the threshold, such as when the task is reset.
+
+    Attributes:
+        task (Task): The task the alarm follows, replaced by TimerEngine.update()
+        seconds (float): The task time the alarm first fires at
+        callback (callable): Called as callback(task, alarm), may be a coroutine function
+        command (str): A shell command run when the alarm fires
+        every (float): Seconds between repeats, None to fire once
+        fired (int): How many times the alarm has fired
+        due_ns (int): The task time, in nanoseconds, the alarm fires at next. None once a single alarm fired.
+    """
+
+    def __init__(self, task, seconds, callback=None, command=None, every=None):
+        """
+        Initializes the alarm.
+
+        Parameters:
+            task (Task): The task to follow
+            seconds (float): The task time to fire at
+            callback (callable, optional): Called as callback(task, alarm) when it fires
+            command (str, optional): A shell command to run when it fires
+            every (float, optional): Fire again every this many seconds
+        """
+        if every is not None and every <= 0:
+            raise ValueError("an alarm can only repeat after a positive number of seconds")
+        self.task = task
+        self.seconds = seconds
+        self.callback = callback
+        self.command = command
+        self.every = every
+        self.fired = 0
+        self.due_ns = round(seconds * NS_PER_SECOND)
+        # Bumped whenever the alarm is rescheduled, so older heap entries are skipped
+        self.generation = 0
+
+    def __repr__(self):
+        return f"Alarm({self.task.task_name!r}, {self.seconds}, every={self.every}, fired={self.fired})"
+
+    def _fire(self, elapsed_ns):
+        self.fired += 1
+        if self.every is None:
+            self.due_ns = None
+            return
+        step = round(self.every * NS_PER_SECOND)
+        # Alarms that were missed, such as after an edit added hours, fire once
+        while self.due_ns <= elapsed_ns:
+            self.due_ns += step
+
+    def _rearm(self, elapsed_ns):
+        first_ns = round(self.seconds * NS_PER_SECOND)
+        if elapsed_ns < first_ns:
+            self.due_ns = first_ns
+
+class TimerEngine():
+    """
+    Fires the alarms of many tasks from one asyncio loop.
+
+    Only active tasks have alarms in the heap. An alarm is due when its
+    task's time reaches it, so it is scheduled at now plus the time still
+    missing, and scheduled again whenever update() is told the task changed.
+    Rescheduled alarms leave their old heap entry behind to be skipped when
+    it comes up, instead of searching the heap for it.
+
+    Callbacks run in the loop, coroutine callbacks and shell commands as
+    their own asyncio tasks so a slow hook doesn't delay other alarms.
+    Errors from them go to the loop's exception handler.
+
+    Commands run with these environment variables set:
+        TASK_TIMER_TASK: The task's name
+        TASK_TIMER_ELAPSED: The task's time in whole seconds
+        TASK_TIMER_ALARM: The alarm's threshold in seconds
+        TASK_TIMER_FIRED: How many times the alarm has fired
+
+    Methods:
+        add_alarm(task, seconds, callback, command, every): Adds an alarm to a task
+        remove_alarm(alarm): Removes an alarm
+        update(task, old_name): Reschedules a task's alarms after it changed
+        alarms(name): Returns the alarms of a task, or of every task
+        run(): Fires alarms as they come due until stop()
+        sync(store, task_list, interval, added): Keeps the tasks up to date with a store
+        follow(old_list, task_list, renamed, added): Moves alarms to tasks read again from a store
+        stop(): Ends run() and sync()
+    """
+
+    def __init__(self):
+        """
+        Initializes an engine without alarms.
+        """
+        self._alarms = {}
+        # (due monotonic ns, sequence, generation, alarm)
+        self._heap = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+        self._running = set()
+
+    def __len__(self):
+        return sum(len(alarms) for alarms in self._alarms.values())
+
+    def alarms(self, name=None):
+        """
+        Returns the alarms of the task with the given name, or of every task.
+        """
+        if name is not None:
+            return list(self._alarms.get(name, []))
+        return [alarm for alarms in self._alarms.values() for alarm in alarms]
+
+    def add_alarm(self, task, seconds, callback=None, command=None, every=None):
+        """
+        Adds an alarm that fires when the task's time reaches seconds.
+
+        An alarm whose time has already passed fires as soon as the engine runs.
+
+        Parameters:
+            task (Task): The task to follow
+            seconds (float): The task time to fire at
+            callback (callable, optional): Called as callback(task, alarm)
+            command (str, optional): A shell command to run
+            every (float, optional): Fire again every this many seconds
+
+        Returns:
+            Alarm: The new alarm.
+        """
+        alarm = Alarm(task, seconds, callback, command, every)
+        self._alarms.setdefault(task.task_name, []).append(alarm)
+        self._schedule(alarm, task.elapsed_total_ns())
+        return alarm
+
+    def remove_alarm(self, alarm):
+        """
+        Removes an alarm. Its heap entry is skipped when it comes up.
+        """
+        name = alarm.task.task_name
+        alarms = self._alarms.get(name, [])
+        if alarm in alarms:
+            alarms.remove(alarm)
+            if not alarms:
+                del self._alarms[name]
+        alarm.generation += 1
+
+    def update(self, task, old_name=None):
+        """
+        Reschedules the alarms of a task that was started, paused, reset,
+        edited or read again from the store.
+
+        Parameters:
+            task (Task): The task as it is now, which may be a new object for the same task
+            old_name (str, optional): The task's name before it was renamed
+        """
+        alarms = self._alarms.pop(old_name or task.task_name, None)
+        if alarms is None:
+            return
+        alarms = self._alarms.setdefault(task.task_name, []) + alarms
+        self._alarms[task.task_name] = alarms
+
+        elapsed_ns = task.elapsed_total_ns()
+        for alarm in alarms:
+            alarm.task = task
+            alarm._rearm(elapsed_ns)
+            self._schedule(alarm, elapsed_ns)
+
+    def _schedule(self, alarm, elapsed_ns):
+        alarm.generation += 1
+        if alarm.due_ns is None or alarm.task.status != "Active":
+            return
+        due = time.monotonic_ns() + max(0, alarm.due_ns - elapsed_ns)
+        if not self._heap or due < self._heap[0][0]:
+            # The loop is sleeping until a later alarm
+            self._wakeup.set()
+        heapq.heappush(self._heap, (due, next(self._sequence), alarm.generation, alarm))
+
+    def _next_timeout(self):
+        """
+        Fires every alarm that is due and returns the seconds until the next one.
+        """
+        while self._heap:
+            due, _, generation, alarm = self._heap[0]
+            if generation != alarm.generation:
+                heapq.heappop(self._heap)
+                continue
+            now = time.monotonic_ns()
+            if due > now:
+                return (due - now) / NS_PER_SECOND
+
+            heapq.heappop(self._heap)
+            elapsed_ns = alarm.task.elapsed_total_ns()
+            if elapsed_ns < alarm.due_ns:
+                # The task's clock moved differently from the monotonic one, such as after a reboot
+                self._schedule(alarm, elapsed_ns)
+                continue
+            alarm._fire(elapsed_ns)
+            self._schedule(alarm, elapsed_ns)
+            self._notify(alarm, elapsed_ns)
+        return None
+
+    def _notify(self, alarm, elapsed_ns):
+        loop = asyncio.get_running_loop()
+        try:
+            if alarm.callback is not None:
+                result = alarm.callback(alarm.task, alarm)
+                if inspect.isawaitable(result):
+                    self._spawn(result)
+        except Exception as e:
+            loop.call_exception_handler({"message": f"alarm callback for task '{alarm.task.task_name}' failed", "exception": e})
+        if alarm.command:
+            self._spawn(self._run_command(alarm, elapsed_ns))
+
+    def _spawn(self, coroutine):
+        running = asyncio.ensure_future(coroutine)
+        self._running.add(running)
+        running.add_done_callback(self._running.discard)
+
+    async def _run_command(self, alarm, elapsed_ns):
+        env = dict(
+            os.environ,
+            TASK_TIMER_TASK=alarm.task.task_name,
+            TASK_TIMER_ELAPSED=str(elapsed_ns // NS_PER_SECOND),
+            TASK_TIMER_ALARM=f"{alarm.seconds:g}",
+            TASK_TIMER_FIRED=str(alarm.fired),
+        )
+        process = await asyncio.create_subprocess_shell(alarm.command, env=env)
+        await process.wait()
+
+    async def run(self):
+        """
+        Fires alarms as they come due until stop() is called, then waits
+        for the callbacks and commands still running.
+        """
+        self._stopped = False
+        while not self._stopped:
+            self._wakeup.clear()
+            timeout = self._next_timeout()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def sync(self, store, task_list=None, interval=1.0, added=None):
+        """
+        Follows changes other task-timer commands make to the store, such
+        as a toggle from another terminal, until stop() is called.
+
+        Only the store's version is checked every interval, which is a stat
+        of its files. When it changed the store is refreshed, and only the
+        tasks with alarms that came back as new objects are rescheduled
+        (see follow()). Renames are read from the log in the store's status
+        cache (see task_timer.status), together with the tasks while
+        holding the store's lock so the log can't be behind them.
+
+        Parameters:
+            store (Store): The store the tasks were loaded from
+            task_list (list, optional): The tasks as last loaded from the store, read again by default
+            interval (float): Seconds between checks of the store's version
+            added (callable, optional): Called as added(task) for every task created since
+        """
+        from task_timer import status
+
+        version = store.version()
+        renames = status.renames(store.path)
+        seen = renames[-1][0] if renames else 0
+        if task_list is None:
+            task_list = store.load()
+        while not self._stopped:
+            await asyncio.sleep(interval)
+            current = store.version()
+            if current == version:
+                continue
+            version = current
+            with store.transaction():
+                old_list, task_list = task_list, store.refresh(task_list)
+                renames = status.renames(store.path, after=seen)
+            if renames:
+                seen = renames[-1][0]
+            self.follow(old_list, task_list, [(old_name, new_name) for _, old_name, new_name in renames], added)
+
+    def follow(self, old_list, task_list, renamed=(), added=None):
+        """
+        Brings the alarms up to date with tasks read again from the store.
+
+        Alarms only move to another name along the renames given. A name
+        that is gone is never guessed to be a new name with the same state
+        or place in the store, so the alarms of any other name that is gone
+        are removed.
+
+        Parameters:
+            old_list (list): The tasks as they were read before
+            task_list (list): The tasks as they are now
+            renamed (iterable): (old, new) name pairs saved since old_list was read, in order
+            added (callable, optional): Called as added(task) for every new name that isn't a rename
+        """
+        tasks = {task.task_name: task for task in task_list}
+        old_names = {task.task_name for task in old_list}
+
+        for old_name, new_name in renamed:
+            alarms = self._alarms.pop(old_name, None)
+            if alarms is not None:
+                self._alarms.setdefault(new_name, []).extend(alarms)
+
+        for name in list(self._alarms):
+            task = tasks.get(name)
+            if task is None:
+                for alarm in self._alarms.pop(name):
+                    alarm.generation += 1
+            elif any(alarm.task is not task for alarm in self._alarms[name]):
+                self.update(task)
+
+        if added is not None:
+            # A name renamed away from may have been taken by a new task
+            sources = {old_name for old_name, _ in renamed}
+            targets = {new_name for _, new_name in renamed}
+            for task in task_list:
+                name = task.task_name
+                if (name not in old_names or name in sources) and name not in targets and name not in self._alarms:
+                    added(task)
+
+    def stop(self):
+        """
+        Ends run() and sync() once they next wake up, which run() does at once.
+        """
+        self._stopped = True
+        self._wakeup.set()
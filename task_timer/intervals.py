@@ -0,0 +1,315 @@
+"""
+intervals.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The interval history of every task. Each time a task is paused the run
+that just ended is saved as a (start, end) interval, so the time spent
+between any two moments can be worked out long after the task's totals
+have moved on.
+
+Intervals are kept in a binary file sorted by end time. A range query
+binary searches for the first interval that ends after the range starts
+and stops reading once no later interval can start before the range ends,
+so answering it reads a few records around the range no matter how many
+years of history come before or after it.
+"""
+import json
+import math
+import os
+import struct
+import time
+from task_timer.rollup import Rollups
+from task_timer.storage.lock import atomic_write
+from task_timer.task import NS_PER_SECOND
+
+MAGIC = b"TTIV"
+
+# magic, version, length of the longest interval in seconds
+HEADER = struct.Struct("<4sHd")
+
+# name id, start, end
+RECORD = struct.Struct("<Idd")
+
+# Records read per chunk when scanning
+CHUNK = 4096
+
+class IntervalIndex():
+    """
+    A sorted, append mostly file of task intervals.
+
+    Task names are stored once in a names file and intervals refer to them
+    by position, so a rename only rewrites the names file. Intervals are
+    appended as tasks are paused, which keeps them in end time order; an
+    interval that ends before the last one (after the system clock was set
+    back) is inserted in place instead.
+
+    Files:
+        <path>: the header and the interval records
+        <path>.names: JSON list of task names, indexed by name id
+        <path>.daily/: daily totals per task, one file per month, see task_timer.rollup
+
+    Attributes:
+        path (str): The interval file
+        names_path (str): The names file
+
+    Methods:
+        collect(task_list): Returns the runs and renames recorded on tasks
+        apply(changes): Saves what collect() returned
+        add(runs): Saves finished runs
+        rename(old_name, new_name): Moves a task's history to a new name
+        query(since, until, names): Yields the intervals overlapping a range
+        rollups(): Returns the daily totals, kept up to date by add()
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the index. Nothing is read until it is used.
+
+        Parameters:
+            path (str): The interval file, the names file is kept beside it.
+        """
+        self.path = path
+        self.names_path = path + ".names"
+        self._rollups = Rollups(path + ".daily")
+
+    def _read_names(self):
+        if not os.path.exists(self.names_path):
+            return []
+        with open(self.names_path, mode="r") as file:
+            return json.load(file)
+
+    def _write_names(self, names):
+        with atomic_write(self.names_path) as file:
+            json.dump(names, file)
+
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+        return max(0, size - HEADER.size) // RECORD.size
+
+    def collect(self, task_list):
+        """
+        Returns the finished runs and renames recorded on dirty tasks.
+
+        Stores call this before they write and clear the tasks' events, and
+        pass the result to apply() once the write succeeded.
+
+        Parameters:
+            task_list (list): The tasks being saved
+
+        Returns:
+            list: ("rename", old name, new name) and ("run", name, (start, end)) changes.
+        """
+        renames = []
+        runs = []
+        for task in task_list:
+            if not task.dirty:
+                continue
+            for event, value in task.events:
+                if event == "rename":
+                    renames.append(("rename", value, task.task_name))
+                elif event == "pause" and value is not None:
+                    runs.append(("run", task.task_name, value))
+        # Runs are recorded under the task's current name, so renames go first
+        return renames + runs
+
+    def apply(self, changes):
+        """
+        Saves changes returned by collect().
+        """
+        runs = []
+        for kind, name, value in changes:
+            if kind == "rename":
+                self.rename(name, value)
+            else:
+                runs.append((name, *value))
+        self.add(runs)
+
+    def rename(self, old_name, new_name):
+        """
+        Moves the history recorded under old_name to new_name.
+        """
+        names = self._read_names()
+        if old_name not in names:
+            return
+        self._write_names([new_name if name == old_name else name for name in names])
+        if self._rollups.exists():
+            self._rollups.rename(old_name, new_name)
+
+    def add(self, runs):
+        """
+        Saves finished runs.
+
+        Parameters:
+            runs (iterable): (name, start, end) tuples, start and end are Unix timestamps
+        """
+        runs = sorted(runs, key=lambda run: run[2])
+        if not runs:
+            return
+
+        names = self._read_names()
+        ids = {name: position for position, name in enumerate(names)}
+        added_names = False
+        records = []
+        for name, start, end in runs:
+            if name not in ids:
+                ids[name] = len(names)
+                names.append(name)
+                added_names = True
+            records.append((ids[name], start, max(start, end)))
+
+        if added_names:
+            self._write_names(names)
+
+        exists = os.path.exists(self.path)
+        with open(self.path, mode="r+b" if exists else "w+b") as file:
+            longest = self._read_header(file) if exists else 0.0
+            longest = max(longest, max(end - start for _, start, end in records))
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, 1, longest))
+
+            count = self._count(file)
+            last_end = self._record(file, count - 1)[2] if count else -math.inf
+
+            if records[0][2] >= last_end:
+                file.seek(HEADER.size + count * RECORD.size)
+                file.write(b"".join(RECORD.pack(*record) for record in records))
+            else:
+                # Keep the file sorted, rewriting everything after the first out of order run
+                position = self._first_ending_after(file, records[0][2], count)
+                file.seek(HEADER.size + position * RECORD.size)
+                tail = list(RECORD.iter_unpack(file.read()))
+                merged = sorted(tail + records, key=lambda record: record[2])
+                file.seek(HEADER.size + position * RECORD.size)
+                file.write(b"".join(RECORD.pack(*record) for record in merged))
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        if self._rollups.exists():
+            self._rollups.add(runs)
+        else:
+            self._rollups.rebuild(self.query())
+
+    def rollups(self):
+        """
+        Returns the daily totals of every saved interval.
+
+        History saved before daily totals were kept is added up once, the
+        first time they are needed.
+
+        Returns:
+            Rollups: The daily totals.
+        """
+        if not self._rollups.exists() and len(self):
+            self._rollups.rebuild(self.query())
+        return self._rollups
+
+    def _read_header(self, file):
+        file.seek(0)
+        data = file.read(HEADER.size)
+        if len(data) < HEADER.size:
+            return 0.0
+        magic, version, longest = HEADER.unpack(data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a task interval file")
+        return longest
+
+    def _count(self, file):
+        file.seek(0, os.SEEK_END)
+        return max(0, file.tell() - HEADER.size) // RECORD.size
+
+    def _record(self, file, position):
+        file.seek(HEADER.size + position * RECORD.size)
+        return RECORD.unpack(file.read(RECORD.size))
+
+    def _first_ending_after(self, file, when, count):
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(file, middle)[2] > when:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def query(self, since=None, until=None, names=None):
+        """
+        Yields every saved interval that overlaps since to until, oldest end first.
+
+        Intervals are returned whole, use clip() to cut them to the range.
+
+        Parameters:
+            since (float, optional): Unix timestamp the range starts at
+            until (float, optional): Unix timestamp the range ends at
+            names (iterable, optional): Only yield intervals of these tasks
+
+        Yields:
+            tuple: (name, start, end)
+        """
+        if not os.path.exists(self.path):
+            return
+
+        task_names = self._read_names()
+        wanted = None if names is None else set(names)
+
+        with open(self.path, mode="rb") as file:
+            longest = self._read_header(file)
+            count = self._count(file)
+            position = 0 if since is None else self._first_ending_after(file, since, count)
+
+            file.seek(HEADER.size + position * RECORD.size)
+            while True:
+                data = file.read(RECORD.size * CHUNK)
+                data = data[:len(data) - len(data) % RECORD.size]
+                if not data:
+                    return
+                for name_id, start, end in RECORD.iter_unpack(data):
+                    if until is not None and start >= until:
+                        if end - longest >= until:
+                            # Nothing further along can start before until
+                            return
+                        continue
+                    name = task_names[name_id]
+                    if wanted is None or name in wanted:
+                        yield name, start, end
+
+def clip(start, end, since=None, until=None):
+    """
+    Returns the seconds of start to end that fall between since and until.
+    """
+    if since is not None:
+        start = max(start, since)
+    if until is not None:
+        end = min(end, until)
+    return max(0.0, end - start)
+
+def activity(store, since=None, until=None, names=None, now=None):
+    """
+    Yields the saved intervals of a store plus the runs still in progress.
+
+    The current run of an active task is returned as ending now.
+
+    Parameters:
+        store (Store): The store to read
+        since (float, optional): Unix timestamp the range starts at
+        until (float, optional): Unix timestamp the range ends at
+        names (iterable, optional): Only yield intervals of these tasks
+        now (float, optional): The time running tasks are measured to
+
+    Yields:
+        tuple: (name, start, end)
+    """
+    names = None if names is None else set(names)
+    yield from store.intervals.query(since, until, names)
+
+    now = time.time() if now is None else now
+    for task in store.iter_tasks():
+        if task.status != "Active" or (names is not None and task.task_name not in names):
+            continue
+        start = now - task.running_ns() / NS_PER_SECOND
+        if (since is None or now > since) and (until is None or start < until):
+            yield task.task_name, start, now
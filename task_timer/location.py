@@ -0,0 +1,145 @@
+"""
+location.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Finds the task store a command should use, so the same tasks are used from
+any directory instead of whichever tasks.csv happens to be in the current
+one. The store is looked up once per process and namespace.
+
+Lookup order:
+    1. $TASK_TIMER_FILE
+    2. A .task-timer directory in the current directory or any parent (made with `task-timer init`)
+    3. A tasks.csv store in the current directory, made before stores were looked up
+    4. task-timer/ in $XDG_DATA_HOME, ~/.local/share by default
+
+Namespaces are separate stores kept beside the default one, so the
+"client" namespace of a project lives in .task-timer/client.csv.
+
+`task-timer status` looks up its store through this module before
+anything else is imported, so it only imports os.
+"""
+import os
+
+PROJECT_DIR = ".task-timer"
+DEFAULT_FILE = "tasks.csv"
+
+# Namespaces become file names, so they can't contain separators or start with a dot
+NAMESPACE_CHARACTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-")
+
+# resolve() results, by namespace
+_resolved = {}
+
+def data_dir():
+    """
+    Returns the user's task-timer data directory, following the XDG base directory spec.
+    """
+    base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "task-timer")
+
+def find_project(start=None):
+    """
+    Returns the nearest .task-timer directory at or above start, or None.
+
+    Parameters:
+        start (str, optional): Where to start looking, the current directory by default
+    """
+    directory = os.path.abspath(start or os.getcwd())
+    while True:
+        candidate = os.path.join(directory, PROJECT_DIR)
+        if os.path.isdir(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def has_store(path):
+    """
+    Returns whether any backend has stored tasks for path.
+    """
+    stem = os.path.splitext(path)[0]
+    return any(os.path.exists(candidate) for candidate in (path, path + ".journal", path + ".shards", stem + ".db"))
+
+def valid_namespace(name):
+    """
+    Returns whether name can be used as a namespace: letters, digits, '_',
+    '-' and '.', not starting with '.' or '-'.
+    """
+    return bool(name) and name[0] not in ".-" and NAMESPACE_CHARACTERS.issuperset(name)
+
+def namespace_file(path, namespace):
+    """
+    Returns the store file of a namespace kept beside the default store at path.
+
+    Parameters:
+        path (str): The default store file
+        namespace (str): The namespace name, None for the default store
+
+    Raises:
+        ValueError: If the namespace isn't a valid name.
+    """
+    if namespace is None:
+        return path
+    if not valid_namespace(namespace):
+        raise ValueError(f"invalid namespace '{namespace}', use letters, digits, '_', '-' and '.'")
+    return os.path.join(os.path.dirname(path), namespace + os.path.splitext(path)[1])
+
+def resolve(namespace=None):
+    """
+    Returns the store file to use and where it was found.
+
+    The result is cached, so the environment and directories are only
+    looked at once per process and namespace (see clear_cache()).
+
+    Parameters:
+        namespace (str, optional): A namespace, None for the default store
+
+    Returns:
+        tuple: (absolute path of the store file, "env", "project", "cwd" or "data")
+    """
+    if namespace in _resolved:
+        return _resolved[namespace]
+    if os.environ.get("TASK_TIMER_FILE"):
+        path, source = os.path.abspath(os.environ["TASK_TIMER_FILE"]), "env"
+    elif (project := find_project()) is not None:
+        path, source = os.path.join(project, DEFAULT_FILE), "project"
+    elif has_store(os.path.abspath(DEFAULT_FILE)):
+        path, source = os.path.abspath(DEFAULT_FILE), "cwd"
+    else:
+        os.makedirs(data_dir(), exist_ok=True)
+        path, source = os.path.join(data_dir(), DEFAULT_FILE), "data"
+    _resolved[namespace] = namespace_file(path, namespace), source
+    return _resolved[namespace]
+
+def clear_cache():
+    """
+    Forgets the stores resolve() found, so they are looked up again.
+    """
+    _resolved.clear()
+
+def namespaces(path):
+    """
+    Returns the namespaces that have a store beside the default store at path.
+    """
+    directory = os.path.dirname(path)
+    default, extension = os.path.splitext(os.path.basename(path))
+    if not os.path.isdir(directory):
+        return []
+
+    found = set()
+    for entry in os.listdir(directory):
+        stem = entry.removesuffix(".shards").removesuffix(".journal")
+        name, entry_extension = os.path.splitext(stem)
+        if entry_extension in (extension, ".db") and name != default and valid_namespace(name):
+            found.add(name)
+    return sorted(found)
+
+def socket_path(task_file):
+    """
+    Returns the socket the `task-timer serve` process for task_file listens on.
+
+    Defaults to the store path with a .sock extension, and can be set with
+    the TASK_TIMER_SOCKET environment variable.
+    """
+    return os.environ.get("TASK_TIMER_SOCKET") or os.path.abspath(task_file) + ".sock"
@@ -0,0 +1,372 @@
+"""
+manager.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The task timer as a Python library. TaskManager keeps every task it has
+read in a dict by name and holds on to changes until flush(), so scripts
+can make thousands of changes per second without starting a task-timer
+process for each one. The task-timer commands are built on it.
+
+Example:
+    from task_timer import TaskManager
+
+    with TaskManager() as tasks:
+        tasks.create("report")
+        tasks.toggle("report")
+        print(tasks["report"].elapsed())
+"""
+
+class TaskManager():
+    """
+    Reads, changes and saves the tasks of one store.
+
+    Tasks are read from the store the first time they are asked for and
+    then kept. Backends with a name index (sqlite) only read the tasks asked
+    for, the others are read once, or one shard at a time when the store is
+    sharded. Changes are kept in memory and written together by flush(), or
+    when a with block ends without an error.
+
+    A with block also holds the store's lock, so other task-timer processes
+    wait for it instead of overwriting its changes.
+
+    Attributes:
+        store (Store): The store tasks are read from and saved to
+
+    Methods:
+        get(name): Returns a task or None
+        get_many(names): Returns several tasks by name
+        find(name, case_sensitive): Returns the spelling of a task's name
+        names(): Returns the name of every task
+        query(statuses, pattern): Returns the tasks with a status or matching a glob
+        create(name): Adds a task
+        toggle(name): Starts, resumes or pauses a task
+        start(name): Starts or resumes a task
+        pause(name): Pauses a task
+        reset(name): Sets a task's time back to zero
+        edit(name, new_name, seconds): Renames a task or changes its time
+        delete(name): Removes a task
+        flush(): Saves every change made since the last flush
+    """
+
+    def __init__(self, store=None, namespace=None, tasks=None):
+        """
+        Initializes the manager. Nothing is read until a task is asked for.
+
+        Parameters:
+            store (Store, optional): The store to use, the one task-timer would use by default
+            namespace (str, optional): Use this namespace's store instead of the default one
+            tasks (list, optional): Every task in the store, already read while holding its lock
+        """
+        if store is None:
+            from task_timer import location
+            from task_timer.storage import get_store
+            store = get_store(location.resolve(namespace)[0])
+        self.store = store
+        # Every task read or created so far, by current name
+        self._index = {}
+        # Whether _index holds every task in the store
+        self._complete = False
+        # Keys of the shards read in full, for stores without a name index
+        self._read_shards = set()
+        # Tasks changed since the last flush, by id so renames don't matter
+        self._changed = {}
+        # Stored names to delete on flush
+        self._removed = set()
+        # Stored names that were renamed or deleted, and must not be read again
+        self._gone = set()
+        self._transaction = None
+
+        if tasks is not None:
+            self._index = {task.task_name: task for task in tasks}
+            self._complete = True
+
+    def __enter__(self):
+        self._transaction = self.store.transaction()
+        self._transaction.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            transaction, self._transaction = self._transaction, None
+            transaction.__exit__(exc_type, exc, traceback)
+        return False
+
+    def __len__(self):
+        return len(self.names())
+
+    def __iter__(self):
+        """
+        Yields every task, in store order followed by the tasks created since.
+        """
+        self._read_all()
+        return iter(list(self._index.values()))
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __getitem__(self, name):
+        task = self.get(name)
+        if task is None:
+            raise KeyError(name)
+        return task
+
+    def _read_all(self):
+        if self._complete:
+            return
+        index = {}
+        for task in self.store.load():
+            if task.task_name not in self._gone:
+                # Tasks already read may have unsaved changes, so they are kept
+                index[task.task_name] = self._index.get(task.task_name, task)
+        for name, task in self._index.items():
+            index.setdefault(name, task)
+        self._index = index
+        self._complete = True
+
+    def _read_shard(self, name):
+        key = self.store.shard_key(name)
+        if key in self._read_shards:
+            return
+        self._read_shards.add(key)
+        for task in self.store.load_shard(key):
+            if task.task_name not in self._gone:
+                self._index.setdefault(task.task_name, task)
+
+    def _changed_task(self, task):
+        self._changed[id(task)] = task
+        return task
+
+    def get(self, name):
+        """
+        Returns the task with the given name, or None if there isn't one.
+        """
+        task = self._index.get(name)
+        if task is not None or self._complete or name in self._gone:
+            return task
+        if not self.store.indexed:
+            self._read_shard(name)
+            return self._index.get(name)
+        task = self.store.get(name)
+        if task is not None:
+            self._index[name] = task
+        return task
+
+    def get_many(self, names):
+        """
+        Returns the tasks with the given names, reading the ones not read yet together.
+
+        Parameters:
+            names (iterable): The task names to look up
+
+        Returns:
+            dict: The tasks that exist, by name.
+        """
+        names = list(names)
+        unread = [name for name in names if name not in self._index and name not in self._gone]
+        if unread and not self._complete:
+            if self.store.indexed:
+                self._index.update(self.store.get_many(unread))
+            else:
+                for name in unread:
+                    self._read_shard(name)
+        return {name: self._index[name] for name in names if name in self._index}
+
+    def find(self, name, case_sensitive=True):
+        """
+        Returns the name of the task matching name, as it is spelled, or None.
+
+        Parameters:
+            name (str): The name to look for
+            case_sensitive (bool): Whether the name must match exactly
+        """
+        if name in self._index:
+            return name
+        if not self._complete:
+            if not self.store.indexed:
+                # Names differing only in case are kept in the same shard
+                self._read_shard(name)
+            elif (found := self.store.find(name, case_sensitive)) is not None and found not in self._gone:
+                return found
+
+        if name in self._index:
+            return name
+        if not case_sensitive:
+            folded = name.casefold()
+            for task_name in self._index:
+                if task_name.casefold() == folded:
+                    return task_name
+        return None
+
+    def names(self):
+        """
+        Returns the name of every task.
+        """
+        self._read_all()
+        return list(self._index)
+
+    def query(self, statuses=(), pattern=None):
+        """
+        Returns the tasks with one of the given statuses whose name matches pattern.
+
+        Parameters:
+            statuses (iterable): Statuses to keep, every status if empty
+            pattern (str, optional): A shell style glob such as "client-*"
+
+        Returns:
+            list: The matching tasks, in the order of iterating the manager.
+        """
+        from task_timer.transfer import select_tasks
+        return list(select_tasks(self, statuses, pattern))
+
+    def create(self, name=None):
+        """
+        Adds a new task.
+
+        Parameters:
+            name (str, optional): The task's name, taskN (N being the number of tasks plus one) by default
+
+        Returns:
+            Task: The new task.
+
+        Raises:
+            ValueError: If a task with that name already exists.
+        """
+        from task_timer.task import Task
+
+        if name is None:
+            name = f"task{len(self.names()) + 1}"
+        if self.get(name) is not None:
+            raise ValueError(f"a task named '{name}' already exists")
+
+        task = Task(name)
+        self._index[name] = task
+        return self._changed_task(task)
+
+    def toggle(self, name):
+        """
+        Starts a task that is off, resumes a paused one and pauses an active one.
+
+        Returns:
+            str: What was done, "start", "resume" or "pause".
+        """
+        task = self[name]
+        if task.status == "Active":
+            task.pause()
+            event = "pause"
+        elif task.status == "Paused":
+            task.resume()
+            event = "resume"
+        else:
+            task.start()
+            event = "start"
+        self._changed_task(task)
+        return event
+
+    def start(self, name):
+        """
+        Starts a task that is off, or resumes a paused one.
+
+        Raises:
+            ValueError: If the task is already active.
+        """
+        if self[name].status == "Active":
+            raise ValueError(f"task '{name}' is already active")
+        return self.toggle(name)
+
+    def pause(self, name):
+        """
+        Pauses an active task.
+
+        Raises:
+            ValueError: If the task isn't active.
+        """
+        if self[name].status != "Active":
+            raise ValueError(f"task '{name}' isn't active")
+        return self.toggle(name)
+
+    def reset(self, name):
+        """
+        Sets a task's time back to zero. An active task keeps running from zero.
+        """
+        task = self[name]
+        task.reset()
+        return self._changed_task(task)
+
+    def edit(self, name, new_name=None, seconds=None):
+        """
+        Renames a task and/or adds seconds to its time.
+
+        Parameters:
+            name (str): The task to edit
+            new_name (str, optional): The task's new name
+            seconds (int, optional): Seconds to add, negative to remove them.
+                                     Only paused tasks can have their time changed.
+
+        Returns:
+            Task: The edited task.
+
+        Raises:
+            ValueError: If new_name is taken or the time of a task that isn't paused is changed.
+        """
+        task = self[name]
+        if seconds and task.status != "Paused":
+            raise ValueError(f"the time of task '{name}' can only be changed while it is paused")
+
+        if new_name and new_name != name:
+            if self.find(new_name) is not None:
+                raise ValueError(f"a task named '{new_name}' already exists")
+            task.rename(new_name)
+            del self._index[name]
+            self._index[new_name] = task
+            self._gone.add(name)
+
+        if seconds:
+            task.adjust(seconds)
+        return self._changed_task(task)
+
+    def delete(self, name):
+        """
+        Removes a task.
+        """
+        task = self[name]
+        del self._index[name]
+        self._changed.pop(id(task), None)
+        self._gone.add(name)
+
+        created = any(event == "create" for event, _ in task.events)
+        if not created:
+            # Deleted under the name it is stored as, which a rename may have changed
+            old_names = [value for event, value in task.events if event == "rename"]
+            self._removed.add(old_names[0] if old_names else name)
+
+    def flush(self):
+        """
+        Saves every change made since the last flush in one write to the
+        store, and updates the store's status cache (see task_timer.status).
+        """
+        if not self._changed and not self._removed:
+            return
+        from task_timer import status
+
+        changed = list(self._changed.values())
+        # Saving clears the tasks' events, so the renames are noted first
+        renamed = []
+        for task in changed:
+            old_names = [value for event, value in task.events if event == "rename"]
+            if old_names and not any(event == "create" for event, _ in task.events):
+                renamed.append((old_names[0], task.task_name))
+        with self.store.transaction():
+            before = status.store_files(self.store)
+            self.store.update(changed, self._removed)
+            try:
+                status.record(self.store, before, changed, self._removed | self._gone, renamed)
+            except OSError:
+                # Left out of date, the next `task-timer status` rebuilds it
+                pass
+        self._changed = {}
+        self._removed = set()
+        self._gone = set()
@@ -0,0 +1,133 @@
+"""
+output.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Machine readable output for `list --format` and `display --stream`, for
+status bars and dashboards that would otherwise scrape the colored table.
+Nothing here uses colors or padding, and tasks are written one at a time.
+
+Every task is written as a record with these fields:
+    name: The task's name
+    status: Off, Active or Paused
+    seconds: The task's total time when it was written
+    started: Unix time the current run started, null unless the task is active
+
+An active task's time at a later moment is seconds plus the time since the
+record was written, so a consumer doesn't need a new record every second.
+"""
+import json
+import sys
+import time
+
+OUTPUT_FORMATS = ("text", "json", "jsonl", "tsv")
+
+FIELDS = ("name", "status", "seconds", "started")
+
+def task_record(task):
+    """
+    Returns a task as a dict of FIELDS.
+    """
+    return {
+        "name": task.task_name,
+        "status": task.status,
+        "seconds": round(task.elapsed(), 3),
+        "started": task.start_time if task.status == "Active" else None,
+    }
+
+def _tsv_field(value):
+    if value is None:
+        return ""
+    # Backslash escapes keep names with tabs or newlines on one line
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def write_tasks(tasks, file, fmt):
+    """
+    Writes tasks one at a time in a machine readable format.
+
+    Formats:
+        json: One array of records
+        jsonl: One record per line
+        tsv: A header line of FIELDS, then one line per task
+
+    Parameters:
+        tasks (iterable): The tasks to write
+        file (file): An open text file
+        fmt (str): One of OUTPUT_FORMATS other than "text"
+
+    Returns:
+        int: The number of tasks written.
+    """
+    count = 0
+    if fmt == "json":
+        file.write("[")
+        for task in tasks:
+            file.write(",\n" if count else "\n")
+            file.write(json.dumps(task_record(task)))
+            count += 1
+        file.write("\n]\n" if count else "]\n")
+    elif fmt == "jsonl":
+        for task in tasks:
+            file.write(json.dumps(task_record(task)))
+            file.write("\n")
+            count += 1
+    elif fmt == "tsv":
+        file.write("\t".join(FIELDS) + "\n")
+        for task in tasks:
+            file.write("\t".join(_tsv_field(value) for value in task_record(task).values()) + "\n")
+            count += 1
+    else:
+        raise ValueError(f"unknown output format '{fmt}', expected one of {', '.join(OUTPUT_FORMATS[1:])}")
+    return count
+
+def stream_tasks(load, file=None, interval=1, full=False, ticks=None):
+    """
+    Writes the tasks as JSON Lines every interval seconds: a snapshot of
+    every task first, then only what changed since the tick before.
+
+    A task has changed when load() returns a different object for it, which
+    Store.refresh() only does for tasks whose stored state changed, so
+    comparing two ticks doesn't look at the tasks' fields.
+
+    Lines:
+        {"type": "snapshot", "time": ..., "tasks": [record, ...]}
+        {"type": "diff", "time": ..., "changed": [record, ...], "removed": [name, ...]}
+
+    A diff is written every tick, empty when nothing changed, so consumers
+    can tell the stream is alive.
+
+    Parameters:
+        load (callable): Returns the current list of tasks
+        file (file, optional): Where to write, stdout by default
+        interval (float): Seconds between ticks
+        full (bool): Write a snapshot every tick instead of diffs
+        ticks (int, optional): Stop after this many lines, run until interrupted by default
+    """
+    file = file or sys.stdout
+    shown = None
+    written = 0
+    deadline = time.monotonic()
+    while ticks is None or written < ticks:
+        task_list = load()
+        current = {task.task_name: task for task in task_list}
+        if shown is None or full:
+            line = {"type": "snapshot", "time": time.time(), "tasks": [task_record(task) for task in task_list]}
+        else:
+            line = {
+                "type": "diff",
+                "time": time.time(),
+                "changed": [task_record(task) for name, task in current.items() if shown.get(name) is not task],
+                "removed": [name for name in shown if name not in current],
+            }
+        shown = current
+        file.write(json.dumps(line) + "\n")
+        file.flush()
+        written += 1
+
+        if ticks is not None and written >= ticks:
+            break
+        deadline += interval
+        now = time.monotonic()
+        if deadline <= now:
+            deadline = now + interval
+        time.sleep(deadline - now)
@@ -0,0 +1,228 @@
+"""
+params.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Custom click parameter types used by the task timer commands.
+Task names are only looked up when a command actually runs, and the full
+list of names is read at most once per process, however many names are given.
+"""
+import difflib
+import fnmatch
+import re
+import click
+from click.shell_completion import CompletionItem
+
+_cached_names = None
+# Stored names by their casefolded spelling, made from _cached_names when needed
+_cached_folded = None
+
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)([hms]?)")
+DURATION_UNITS = {"h": 3600, "m": 60, "s": 1, "": 1}
+
+def task_names(store, ctx=None):
+    """
+    Returns the names of all stored tasks, reading the store on first use only.
+
+    When a command is being run, stores without a name index read every
+    task to list the names anyway, so the tasks are kept in the command's
+    ctx.obj["tasks"] and the command doesn't read the store again (see
+    cli.task_manager).
+
+    Parameters:
+        store (callable): Function returning the task Store.
+        ctx (click.Context, optional): The context of the command being run
+
+    Returns:
+        list: The task names, in store order.
+    """
+    global _cached_names
+    if _cached_names is None:
+        if ctx is not None and not store().indexed:
+            tasks = store().load_all()
+            ctx.ensure_object(dict)["tasks"] = tasks
+            _cached_names = [task.task_name for task in tasks]
+        else:
+            _cached_names = store().names()
+    return _cached_names
+
+def invalidate_names():
+    """
+    Drops the cached task names so the next lookup reads the store again.
+    """
+    global _cached_names, _cached_folded
+    _cached_names = None
+    _cached_folded = None
+
+def find_name(store, value, case_sensitive=True, ctx=None):
+    """
+    Returns the stored name matching value, as it is spelled, or None.
+
+    Stores with a name index look the one name up. Other stores would read
+    every task for each lookup, so the value is matched against the names
+    read once by task_names() instead, and validating many names still
+    reads the store once.
+
+    Parameters:
+        store (callable): Function returning the task Store.
+        value (str): The name to look for
+        case_sensitive (bool): Whether the name must match exactly
+        ctx (click.Context, optional): The context of the command being run, see task_names()
+    """
+    global _cached_folded
+    if _cached_names is None and store().indexed:
+        return store().find(value, case_sensitive)
+
+    if _cached_folded is None:
+        _cached_folded = {}
+        for task_name in task_names(store, ctx):
+            _cached_folded.setdefault(task_name.casefold(), []).append(task_name)
+    matches = _cached_folded.get(value.casefold(), [])
+    if value in matches:
+        return value
+    return None if case_sensitive or not matches else matches[0]
+
+class TaskName(click.ParamType):
+    """
+    A click parameter type that validates and completes existing task names.
+
+    Behaves like click.Choice over the stored task names, but names are
+    looked up in the store when the command runs instead of when it is
+    defined. Validation asks a store with a name index for the one name it
+    needs, and matches against the names read once otherwise (see find_name).
+
+    Attributes:
+        store (callable): Function returning the task Store.
+        case_sensitive (bool): Whether names must match exactly.
+    """
+    name = "task"
+
+    def __init__(self, store, case_sensitive=True):
+        """
+        Initializes the parameter type.
+
+        Parameters:
+            store (callable): Function returning the task Store.
+            case_sensitive (bool): Whether names must match exactly.
+        """
+        self.store = store
+        self.case_sensitive = case_sensitive
+
+    def _normalize(self, value):
+        return value if self.case_sensitive else value.casefold()
+
+    def convert(self, value, param, ctx):
+        """
+        Returns the stored task name matching the given value.
+
+        Case-insensitive matching returns the name as it is stored, the same
+        way click.Choice returns the original choice.
+        """
+        task_name = find_name(self.store, value, self.case_sensitive, ctx)
+        if task_name is not None:
+            return task_name
+
+        # Only the stored names closest to the value, a store may hold thousands
+        stored = {}
+        for task_name in task_names(self.store, ctx):
+            stored.setdefault(self._normalize(task_name), task_name)
+        matches = difflib.get_close_matches(self._normalize(value), stored, n=3)
+        if matches:
+            suggestions = ", ".join(repr(stored[match]) for match in matches)
+            self.fail(f"{value!r} is not a task. Did you mean {suggestions}?", param, ctx)
+        self.fail(f"{value!r} is not a task.", param, ctx)
+
+    def shell_complete(self, ctx, param, incomplete):
+        """
+        Completes task names that start with the incomplete value.
+        """
+        prefix = self._normalize(incomplete)
+        return [
+            CompletionItem(task_name)
+            for task_name in task_names(self.store)
+            if self._normalize(task_name).startswith(prefix)
+        ]
+
+    def get_metavar(self, param, ctx=None):
+        return "TASK"
+
+class TaskPattern(TaskName):
+    """
+    A task name or a glob pattern matching several task names.
+
+    Values with *, ? or [ in them are matched against every stored name,
+    anything else is validated like TaskName. The converted value is always
+    a tuple of stored names, so a multiple option gives a tuple of tuples.
+    """
+    name = "task pattern"
+
+    def convert(self, value, param, ctx):
+        """
+        Returns the stored task names matching the given name or pattern.
+        """
+        if isinstance(value, tuple):
+            return value
+        if not any(character in value for character in "*?["):
+            return (super().convert(value, param, ctx),)
+
+        pattern = self._normalize(value)
+        matches = tuple(task_name for task_name in task_names(self.store, ctx) if fnmatch.fnmatchcase(self._normalize(task_name), pattern))
+        if not matches:
+            self.fail(f"{value!r} doesn't match any task.", param, ctx)
+        return matches
+
+    def get_metavar(self, param, ctx=None):
+        return "TASK|GLOB"
+
+class Duration(click.ParamType):
+    """
+    A length of time such as 90, 45s, 25m or 1h30m, converted to seconds.
+    """
+    name = "duration"
+
+    def convert(self, value, param, ctx):
+        """
+        Returns the duration in seconds.
+        """
+        if isinstance(value, (int, float)):
+            return value
+        text = value.strip().lower()
+        parts = DURATION_PATTERN.findall(text)
+        if not text or "".join(number + unit for number, unit in parts) != text:
+            self.fail(f"{value!r} isn't a duration such as 90, 45s, 25m or 1h30m.", param, ctx)
+        return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+    def get_metavar(self, param, ctx=None):
+        return "DURATION"
+
+def read_names(file, store, case_sensitive=True):
+    """
+    Reads task names from a file, one per line.
+
+    Blank lines and lines starting with # are skipped. Names are matched
+    against the stored names read once, not looked up line by line.
+
+    Parameters:
+        file (file): An open text file
+        store (callable): Function returning the task Store
+        case_sensitive (bool): Whether names must match exactly
+
+    Returns:
+        tuple: (stored names that were found, names that weren't)
+    """
+    normalize = (lambda value: value) if case_sensitive else str.casefold
+    stored = {}
+    for task_name in task_names(store):
+        stored.setdefault(normalize(task_name), task_name)
+
+    found = []
+    missing = []
+    for line in file:
+        value = line.strip()
+        if not value or value.startswith("#"):
+            continue
+        if normalize(value) in stored:
+            found.append(stored[normalize(value)])
+        else:
+            missing.append(value)
+    return found, missing
@@ -0,0 +1,204 @@
+"""
+render.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Terminal rendering for the real time display. Lines are redrawn in place
+with ANSI cursor movement, and only the lines that changed since the last
+frame are written. Frames are cut to the terminal's size, since a line
+that wraps or a row past the bottom would overwrite the rows around it.
+"""
+import os
+import re
+import select
+import shutil
+import sys
+import time
+from task_timer.trace import span
+
+try:
+    import termios
+    import tty
+except ImportError:
+    # Not available on Windows, keypresses are then read a line at a time
+    termios = None
+
+CSI = "\x1b["
+
+# Color and other escape sequences, which take no room on screen
+ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+def clip(line, width):
+    """
+    Cuts a line to width visible characters, not counting escape sequences.
+
+    Parameters:
+        line (str): The line, which may contain colors
+        width (int): The most characters to keep
+
+    Returns:
+        str: The line, with colors reset after the cut if it was cut.
+    """
+    if len(line) <= width:
+        return line
+    parts = []
+    visible = 0
+    position = 0
+    for match in ESCAPE.finditer(line):
+        text = line[position:match.start()]
+        if visible + len(text) > width:
+            break
+        parts.append(text)
+        parts.append(match.group())
+        visible += len(text)
+        position = match.end()
+    else:
+        if visible + len(line) - position <= width:
+            return line
+    parts.append(line[position:position + width - visible])
+    parts.append(f"{CSI}0m")
+    return "".join(parts)
+
+class Screen():
+    """
+    Draws a list of lines at the top of the terminal, rewriting only the
+    lines that differ from what is already shown.
+
+    Lines are cut to the terminal's width. A frame with more lines than the
+    terminal has rows shows the first ones and a "+N more" line instead of
+    the rest, keeping the last row free for the cursor.
+
+    Attributes:
+        stream (file): Where the frames are written
+        shown (list): The lines currently on screen
+        size (callable): Returns the terminal's os.terminal_size
+    """
+
+    def __init__(self, stream=None, size=None):
+        """
+        Initializes the screen.
+
+        Parameters:
+            stream (file, optional): Where to write frames, defaults to stdout.
+            size (callable, optional): Returns the terminal's size, shutil.get_terminal_size by default
+        """
+        self.stream = stream or sys.stdout
+        self.size = size or shutil.get_terminal_size
+        self.shown = []
+        self._shown_size = None
+
+    def start(self):
+        """
+        Clears the terminal once and hides the cursor.
+        """
+        if os.name == "nt":
+            import colorama
+            colorama.just_fix_windows_console()
+        self.stream.write(f"{CSI}2J{CSI}H{CSI}?25l")
+        self.stream.flush()
+        self.shown = []
+        self._shown_size = None
+
+    def fit(self, lines, size):
+        """
+        Returns the lines of a frame as they fit in a terminal of the given size.
+        """
+        columns, rows = max(size.columns, 1), max(size.lines - 1, 1)
+        if len(lines) > rows:
+            hidden = len(lines) - rows + 1
+            lines = [*lines[:rows - 1], f"+{hidden} more"]
+        return [clip(line, columns) for line in lines]
+
+    def draw(self, lines):
+        """
+        Shows the given lines, writing only the ones that changed.
+
+        Parameters:
+            lines (list): The lines of the new frame, without newlines
+        """
+        size = self.size()
+        lines = self.fit(lines, size)
+        output = []
+        if size != self._shown_size:
+            # Lines shown at the old size may have wrapped or been cut elsewhere
+            if self._shown_size is not None:
+                output.append(f"{CSI}2J")
+            self.shown = []
+            self._shown_size = size
+        for row, line in enumerate(lines):
+            if row >= len(self.shown) or self.shown[row] != line:
+                output.append(f"{CSI}{row + 1};1H{line}{CSI}K")
+
+        if len(lines) < len(self.shown):
+            output.append(f"{CSI}{len(lines) + 1};1H{CSI}J")
+
+        if output:
+            output.append(f"{CSI}{len(lines) + 1};1H")
+            self.stream.write("".join(output))
+            self.stream.flush()
+        self.shown = list(lines)
+
+    def stop(self):
+        """
+        Shows the cursor again and leaves it below the last frame.
+        """
+        self.stream.write(f"{CSI}{len(self.shown) + 1};1H{CSI}?25h")
+        self.stream.flush()
+
+def live(frame, interval=1, exit_key="c", stdin=None):
+    """
+    Redraws frame() every interval seconds until exit_key is pressed.
+
+    Ticks are scheduled on the monotonic clock so the refresh rate doesn't
+    drift, and the time between ticks is spent waiting on stdin so a
+    keypress is handled as soon as it arrives. When stdin is a terminal it
+    is put in cbreak mode, so the key doesn't need to be followed by Enter.
+
+    Parameters:
+        frame (callable): Returns the list of lines to show
+        interval (float): Seconds between redraws
+        exit_key (str): The key that stops the display
+        stdin (file, optional): Where keypresses are read from, defaults to stdin
+    """
+    stdin = stdin or sys.stdin
+    screen = Screen()
+    interactive = termios is not None and stdin.isatty()
+    watch_input = True
+
+    if interactive:
+        saved = termios.tcgetattr(stdin.fileno())
+        tty.setcbreak(stdin.fileno())
+
+    screen.start()
+    try:
+        deadline = time.monotonic()
+        while True:
+            with span("render", "frame"):
+                screen.draw(frame())
+
+            deadline += interval
+            now = time.monotonic()
+            if deadline <= now:
+                # Drawing took longer than a tick, start counting again from now
+                deadline = now + interval
+
+            while now < deadline:
+                if not watch_input:
+                    time.sleep(deadline - now)
+                    break
+
+                ready, _, _ = select.select([stdin], [], [], deadline - now)
+                if ready:
+                    key = os.read(stdin.fileno(), 1024).decode(errors="ignore") if interactive else stdin.readline()
+                    if not key:
+                        # stdin was closed, keep drawing until interrupted
+                        watch_input = False
+                    elif exit_key in key.lower():
+                        return
+                now = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        screen.stop()
+        if interactive:
+            termios.tcsetattr(stdin.fileno(), termios.TCSADRAIN, saved)
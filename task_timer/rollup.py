@@ -0,0 +1,257 @@
+"""
+rollup.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Daily totals of tracked time per task. The totals are updated as runs are
+added to the interval history, so a report over a year only adds up a few
+hundred days instead of every run that happened in them. Weeks and months
+are made from the days they contain.
+
+The totals are kept in one file per month, so pausing a task only rewrites
+the current month and a report only reads the months it covers, however
+long the history is.
+"""
+import json
+import os
+import shutil
+import time
+from datetime import date, datetime, timedelta
+from task_timer.storage.lock import atomic_write
+from task_timer.task import NS_PER_SECOND
+
+PERIODS = ("day", "week", "month")
+
+class Rollups():
+    """
+    Seconds tracked per task per local calendar day, kept in a directory
+    with one JSON file per month.
+
+    Files:
+        <path>/2026-10.json: {"2026-10-17": {"task name": seconds, ...}, ...}
+
+    Attributes:
+        path (str): The directory
+
+    Methods:
+        exists(): Whether the totals have been written yet
+        add(runs): Adds finished runs to their days
+        rename(old_name, new_name): Moves a task's totals to a new name
+        rebuild(runs): Replaces every total with ones made from runs
+        days(since, until): Returns the totals of a range of days
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the rollups. Nothing is read until they are used.
+
+        Parameters:
+            path (str): The directory.
+        """
+        self.path = path
+
+    def exists(self):
+        # Totals from before they were split by month were one file, and are rebuilt
+        return os.path.isdir(self.path)
+
+    def _month_path(self, month):
+        return os.path.join(self.path, f"{month}.json")
+
+    def _months(self):
+        """
+        Returns the months that have totals, oldest first.
+        """
+        if not self.exists():
+            return []
+        return sorted(entry[:-5] for entry in os.listdir(self.path) if entry.endswith(".json"))
+
+    def _read(self, month):
+        try:
+            with open(self._month_path(month), mode="r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, month, days, directory=None):
+        path = os.path.join(directory or self.path, f"{month}.json")
+        with atomic_write(path) as file:
+            json.dump(days, file, sort_keys=True)
+
+    def add(self, runs):
+        """
+        Adds finished runs to the totals of the days they fall on, only
+        reading and writing the months those days are in.
+
+        Parameters:
+            runs (iterable): (name, start, end) tuples
+        """
+        for month, added in _by_month(runs).items():
+            days = self._read(month)
+            for day, totals in added.items():
+                _merge(days.setdefault(day, {}), totals)
+            self._write(month, days)
+
+    def rename(self, old_name, new_name):
+        """
+        Moves the totals recorded under old_name to new_name.
+        """
+        for month in self._months():
+            days = self._read(month)
+            renamed = False
+            for totals in days.values():
+                if old_name in totals:
+                    totals[new_name] = totals.get(new_name, 0.0) + totals.pop(old_name)
+                    renamed = True
+            if renamed:
+                self._write(month, days)
+
+    def rebuild(self, runs):
+        """
+        Replaces every total with ones added up from runs.
+
+        The new totals are written to a directory beside the old ones and
+        then moved in place, so an interrupted rebuild leaves no totals
+        behind, which starts another rebuild, instead of partial ones.
+
+        Parameters:
+            runs (iterable): Every saved (name, start, end) run
+        """
+        new_directory = f"{self.path}.{os.getpid()}.tmp"
+        shutil.rmtree(new_directory, ignore_errors=True)
+        os.mkdir(new_directory)
+        for month, days in _by_month(runs).items():
+            self._write(month, days, new_directory)
+
+        if os.path.isdir(self.path):
+            old_directory = f"{self.path}.{os.getpid()}.old"
+            os.rename(self.path, old_directory)
+            shutil.rmtree(old_directory)
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(new_directory, self.path)
+
+    def days(self, since=None, until=None):
+        """
+        Returns the totals of every day from since to until, both included.
+
+        Only the months the range covers are read.
+
+        Parameters:
+            since (date, optional): The first day
+            until (date, optional): The last day
+
+        Returns:
+            dict: {date: {name: seconds}}, only days with tracked time are included.
+        """
+        first = None if since is None else since.strftime("%Y-%m")
+        last = None if until is None else until.strftime("%Y-%m")
+        days = {}
+        for month in self._months():
+            if (first is not None and month < first) or (last is not None and month > last):
+                continue
+            for key, totals in self._read(month).items():
+                day = date.fromisoformat(key)
+                if (since is None or day >= since) and (until is None or day <= until):
+                    days[day] = totals
+        return days
+
+def _merge(totals, added):
+    for name, seconds in added.items():
+        totals[name] = totals.get(name, 0.0) + seconds
+
+def _by_month(runs):
+    """
+    Returns the daily totals of runs as {month: {day: {name: seconds}}}.
+    """
+    days = {}
+    _add_runs(days, runs)
+    months = {}
+    for day, totals in days.items():
+        months.setdefault(day[:7], {})[day] = totals
+    return months
+
+def _add_runs(days, runs):
+    for name, start, end in runs:
+        for day, seconds in split_days(start, end):
+            totals = days.setdefault(day.isoformat(), {})
+            totals[name] = totals.get(name, 0.0) + seconds
+
+def split_days(start, end):
+    """
+    Splits start to end at local midnights.
+
+    Parameters:
+        start (float): Unix timestamp
+        end (float): Unix timestamp
+
+    Yields:
+        tuple: (date, seconds) for every day the span covers.
+    """
+    while start < end:
+        day = date.fromtimestamp(start)
+        midnight = datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+        stop = min(end, midnight)
+        yield day, stop - start
+        start = stop
+
+def period(day, by):
+    """
+    Returns the name of the period day belongs to.
+
+    Parameters:
+        day (date): The day
+        by (str): One of PERIODS
+
+    Returns:
+        str: 2026-10-17 for a day, 2026-W42 for an ISO week, 2026-10 for a month.
+    """
+    if by == "day":
+        return day.isoformat()
+    if by == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if by == "month":
+        return day.strftime("%Y-%m")
+    raise ValueError(f"unknown period '{by}', expected one of {', '.join(PERIODS)}")
+
+def report(store, by="day", since=None, until=None, names=None, now=None):
+    """
+    Adds up the time tracked per task in every period from since to until.
+
+    Saved runs come from the store's daily rollups, and the current run of
+    every active task is added on top.
+
+    Parameters:
+        store (Store): The store to report on
+        by (str): One of PERIODS
+        since (date, optional): The first day to include
+        until (date, optional): The last day to include
+        names (iterable, optional): Only include these tasks
+        now (float, optional): The time running tasks are measured to
+
+    Returns:
+        dict: {period: {name: seconds}}, in period order.
+    """
+    names = None if names is None else set(names)
+    now = time.time() if now is None else now
+
+    days = store.intervals.rollups().days(since, until)
+
+    running = []
+    for task in store.iter_tasks():
+        if task.status == "Active":
+            running.append((task.task_name, now - task.running_ns() / NS_PER_SECOND, now))
+    for name, start, end in running:
+        for day, seconds in split_days(start, end):
+            if (since is None or day >= since) and (until is None or day <= until):
+                totals = days.setdefault(day, {})
+                totals[name] = totals.get(name, 0.0) + seconds
+
+    periods = {}
+    for day in sorted(days):
+        for name, seconds in days[day].items():
+            if names is not None and name not in names:
+                continue
+            totals = periods.setdefault(period(day, by), {})
+            totals[name] = totals.get(name, 0.0) + seconds
+    return periods
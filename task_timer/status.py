@@ -0,0 +1,270 @@
+"""
+status.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The status cache: a small file beside the store listing the active tasks
+and when their current runs started, kept up to date whenever tasks are
+saved through a TaskManager (which every command that changes tasks uses).
+`task-timer status` answers from it before click is imported and without
+reading the store, so it is cheap enough to run on every shell prompt.
+
+File (<task file>.status), tab separated so reading it needs no parser:
+    task-timer-status   1
+    file    <store file>    <inode> <mtime_ns>  <size>      (or just the path if it doesn't exist)
+    active  <name>  <ns before the current run> <unix start of the run>
+    rename  <sequence number>   <old name>  <new name>
+
+The rename lines are a log of the last RENAME_LOG renames, numbered in
+the order they were saved, so `task-timer watch` can tell a renamed task
+from one deleted while another was created (see TimerEngine.sync()).
+
+The file lines hold the store's files as they were when the cache was
+written. A cache whose store files changed since, such as after
+`task-timer load` or a write by an older version, isn't used and is
+rebuilt from the store. Tabs, newlines and backslashes in names and paths
+are escaped with a backslash.
+"""
+import os
+import sys
+import time
+
+CACHE_VERSION = "1"
+
+ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+NS_PER_SECOND = 1_000_000_000
+
+# Number of renames kept in the cache's log
+RENAME_LOG = 100
+
+# Arguments of `task-timer status` the fast path understands, anything else goes to click
+FAST_OPTIONS = {"--active"}
+
+# Set when a call is traced, which only the click command line does
+TRACE_ENVVARS = ("TASK_TIMER_TRACE", "TASK_TIMER_TRACE_FILE", "TASK_TIMER_PROFILE_STATS")
+
+def cache_path(task_file):
+    """
+    Returns the status cache file of the store at task_file.
+    """
+    return task_file + ".status"
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if stat.st_size == 0:
+        # An empty file holds no more than a missing one, like SQLite's log after a checkpoint
+        return None
+    return [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+def store_files(store):
+    """
+    Returns the stat of every file of a store, as kept in the cache's "files".
+    Call store.settle() first after a write.
+    """
+    return {path: _stat(path) for path in store.files()}
+
+def _escape(text):
+    for character, escaped in ESCAPES.items():
+        text = text.replace(character, escaped)
+    return text
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    parts = []
+    characters = iter(text)
+    for character in characters:
+        parts.append(UNESCAPES.get(next(characters, ""), "") if character == "\\" else character)
+    return "".join(parts)
+
+def _read(task_file):
+    """
+    Returns the cache as {"files": {path: stat}, "active": [[name, ns, start]],
+    "renames": [[sequence, old, new]]}, or None.
+    """
+    try:
+        with open(cache_path(task_file), mode="r", encoding="utf-8", newline="\n") as file:
+            lines = file.read().split("\n")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if lines[0] != f"task-timer-status\t{CACHE_VERSION}":
+        return None
+
+    files = {}
+    active = []
+    renames = []
+    try:
+        for line in lines[1:]:
+            kind, _, rest = line.partition("\t")
+            fields = rest.split("\t")
+            if kind == "file":
+                files[_unescape(fields[0])] = [int(value) for value in fields[1:]] or None
+            elif kind == "active":
+                active.append([_unescape(fields[0]), int(fields[1]), float(fields[2]) if fields[2] else None])
+            elif kind == "rename":
+                renames.append([int(fields[0]), _unescape(fields[1]), _unescape(fields[2])])
+    except (IndexError, ValueError):
+        return None
+    return {"files": files, "active": active, "renames": renames}
+
+def read_cache(task_file):
+    """
+    Returns the status cache of the store at task_file, or None if there
+    isn't one or the store changed since it was written.
+    """
+    data = _read(task_file)
+    if data is None or not data.get("files"):
+        return None
+    for path, stat in data["files"].items():
+        if _stat(path) != stat:
+            return None
+    return data
+
+def _write(store, active, renames):
+    store.settle()
+    data = {"files": store_files(store), "active": active, "renames": renames[-RENAME_LOG:]}
+
+    lines = [f"task-timer-status\t{CACHE_VERSION}"]
+    for file_path, stat in data["files"].items():
+        lines.append("\t".join(["file", _escape(file_path), *(str(value) for value in stat or ())]))
+    for name, elapsed_ns, start_time in active:
+        lines.append(f"active\t{_escape(name)}\t{elapsed_ns}\t{'' if start_time is None else repr(start_time)}")
+    for sequence, old_name, new_name in data["renames"]:
+        lines.append(f"rename\t{sequence}\t{_escape(old_name)}\t{_escape(new_name)}")
+
+    path = cache_path(store.path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    # Not synced to disk like the store, a cache lost in a crash is rebuilt
+    with open(temp_path, mode="w", encoding="utf-8", newline="\n") as file:
+        file.write("\n".join(lines) + "\n")
+    os.replace(temp_path, path)
+    return data
+
+def _entry(task):
+    return [task.task_name, task.elapsed_ns, task.start_time]
+
+def _logged(renames, new_renames):
+    """
+    Returns the rename log with (old, new) pairs added after its last entry.
+    """
+    sequence = renames[-1][0] if renames else 0
+    added = [[sequence + number, old_name, new_name] for number, (old_name, new_name) in enumerate(new_renames, 1)]
+    return renames + added
+
+def rebuild(store, renamed=()):
+    """
+    Writes the status cache of a store from every stored task.
+
+    The rename log of the old cache is kept, when it can be read.
+
+    Parameters:
+        store (Store): The store to write the cache of
+        renamed (iterable): (old, new) name pairs saved since the cache was written
+
+    Returns:
+        dict: The cache written.
+    """
+    data = _read(store.path)
+    renames = _logged([] if data is None else data["renames"], renamed)
+    return _write(store, [_entry(task) for task in store.iter_tasks() if task.status == "Active"], renames)
+
+def renames(task_file, after=0):
+    """
+    Returns the renames logged in the status cache of the store at task_file.
+
+    Parameters:
+        task_file (str): The store file
+        after (int): Only return renames with a higher sequence number
+
+    Returns:
+        list: [sequence, old name, new name] lists, oldest first.
+    """
+    data = _read(task_file)
+    return [] if data is None else [entry for entry in data["renames"] if entry[0] > after]
+
+def record(store, before, changed, removed=(), renamed=()):
+    """
+    Brings the status cache up to date after store.update(changed, removed),
+    only reading the cache, not the store. Falls back to rebuild() when the
+    cache was already out of date before the update.
+
+    Called while holding the store's lock, so no other write comes between
+    the update and the cache.
+
+    Parameters:
+        store (Store): The store that was updated
+        before (dict): store_files(store) from before the update
+        changed (iterable): The tasks that were saved
+        removed (iterable): Stored names that no longer exist, including the old names of renamed tasks
+        renamed (iterable): (stored name, new name) pairs of the renamed tasks, in the order they were saved
+    """
+    data = _read(store.path)
+    if data is None or data.get("files") != before:
+        rebuild(store, renamed)
+        return
+
+    active = {entry[0]: entry for entry in data["active"]}
+    for name in removed:
+        active.pop(name, None)
+    for task in changed:
+        active.pop(task.task_name, None)
+        if task.status == "Active":
+            active[task.task_name] = _entry(task)
+    _write(store, list(active.values()), _logged(data["renames"], renamed))
+
+def status_lines(data, active=False, now=None):
+    """
+    Returns what `task-timer status` prints for a status cache.
+
+    Parameters:
+        data (dict): The status cache
+        active (bool): One "<name> <time>" line per active task instead of their number
+        now (float, optional): Unix time to measure the runs up to, now by default
+
+    Returns:
+        list: The lines to print.
+    """
+    if not active:
+        return [str(len(data["active"]))]
+
+    from task_timer.durations import format_time
+
+    now = time.time() if now is None else now
+    lines = []
+    for name, elapsed_ns, start_time in data["active"]:
+        seconds = elapsed_ns / NS_PER_SECOND + max(0.0, now - (start_time or now))
+        lines.append(f"{name} {format_time(seconds)}")
+    return lines
+
+def fast_path(args):
+    """
+    Answers `task-timer status` from the status cache without click.
+
+    Parameters:
+        args (list): The arguments after "status"
+
+    Returns:
+        int or None: The exit code, or None when the full command line has
+                     to answer (unknown arguments, tracing, no usable cache).
+    """
+    if not set(args) <= FAST_OPTIONS or any(os.environ.get(name) for name in TRACE_ENVVARS):
+        return None
+
+    from task_timer import location
+    try:
+        task_file = location.resolve(os.environ.get("TASK_TIMER_NAMESPACE") or None)[0]
+    except ValueError:
+        return None
+    data = read_cache(task_file)
+    if data is None:
+        return None
+
+    lines = status_lines(data, "--active" in args)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return 0
@@ -0,0 +1,89 @@
+"""
+__init__.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Storage backends for tasks. The backend is chosen with the
+TASK_TIMER_BACKEND environment variable (csv, journal or sqlite)
+and defaults to csv. A store that has been split into shards keeps using
+the backend recorded in its manifest.
+
+Backends are only imported once a store of their kind is opened, so a
+command using the csv store never loads sqlite3.
+"""
+import importlib
+import os
+import sys
+
+# Backend name -> (module, class)
+BACKENDS = {
+    "csv": ("task_timer.storage.csv_store", "CSVStore"),
+    "journal": ("task_timer.storage.journal", "JournalStore"),
+    "sqlite": ("task_timer.storage.sqlite_store", "SQLiteStore"),
+}
+
+# Classes importable from this package, loaded on first use
+_EXPORTS = {
+    "Store": ("task_timer.storage.base", "Store"),
+    "ShardedStore": ("task_timer.storage.sharded", "ShardedStore"),
+    **{cls: (module, cls) for module, cls in BACKENDS.values()},
+}
+
+def backend_class(name):
+    """
+    Returns the Store class of a backend, importing it if needed.
+
+    Parameters:
+        name (str): One of BACKENDS
+
+    Raises:
+        ValueError: If there is no backend with that name.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"unknown storage backend '{name}', choose from {', '.join(BACKENDS)}")
+    module, cls = BACKENDS[name]
+    return getattr(importlib.import_module(module), cls)
+
+def backend_name(store):
+    """
+    Returns the name of the backend a store uses.
+    """
+    from task_timer.storage.sharded import ShardedStore
+
+    if isinstance(store, ShardedStore):
+        return store.manifest["backend"]
+    for name, (module, cls) in BACKENDS.items():
+        # A store's backend has been imported, so no other module is loaded here
+        if module in sys.modules and isinstance(store, getattr(sys.modules[module], cls)):
+            return name
+    raise ValueError(f"{type(store).__name__} isn't one of the storage backends")
+
+def get_store(path, backend=None):
+    """
+    Returns the store for the given path.
+
+    Parameters:
+        path (str): The file the store keeps its data in
+        backend (str, optional): Backend name, defaults to $TASK_TIMER_BACKEND or csv
+
+    Returns:
+        Store: An instance of the selected backend, or a ShardedStore of it
+               when the store has a shard manifest.
+    """
+    from task_timer.storage.sharded import ShardedStore, read_manifest
+
+    manifest = read_manifest(path)
+    if manifest is not None:
+        backend = manifest["backend"]
+    backend = backend_class(backend or os.environ.get("TASK_TIMER_BACKEND", "csv"))
+    if manifest is not None:
+        return ShardedStore(path, backend)
+    return backend(path)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module, cls = _EXPORTS[name]
+        return getattr(importlib.import_module(module), cls)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ["Store", "CSVStore", "JournalStore", "SQLiteStore", "ShardedStore", "BACKENDS", "backend_class", "backend_name", "get_store"]
@@ -0,0 +1,351 @@
+"""
+base.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+The storage interface every task store backend implements.
+"""
+import itertools
+import os
+from contextlib import contextmanager
+from task_timer.storage.lock import file_lock
+from task_timer.trace import traced
+
+# Numbers every transaction taken in this process, see Store.transaction_id()
+_transactions = itertools.count(1)
+
+class Store():
+    """
+    Base class for the places tasks can be persisted to.
+
+    Backends must implement load() and save(). The single task helpers fall
+    back to loading every task, backends with an index can override them.
+
+    Attributes:
+        path (str): The file the backend keeps its data in
+
+    Methods:
+        load(): Returns every stored task
+        iter_tasks(): Yields every stored task one at a time
+        save(task_list, removed): Persists changed tasks and removals
+        get(name): Returns one stored task by name
+        get_many(names): Returns several stored tasks by name
+        find(name, case_sensitive): Returns the stored spelling of a task name
+        names(): Returns the names of every stored task
+        update(changed, removed): Persists some tasks without loading the rest
+        transaction(): Locks the store for a read-modify-write
+        transaction_id(): Identifies the transaction the store is in, if any
+        files(): The files the store keeps its data in
+        version(): A cheap value that changes whenever the stored tasks change
+        settle(): Finishes a write so the store files stay as they are until the next one
+        refresh(task_list): Brings a loaded task list up to date with the store
+        table(): Returns every stored task as a columnar TaskTable
+        store_for(name): The store a single task is read from
+        shard_key(name): The part of the store a task is kept in
+        load_shard(key): Returns every task in one part of the store
+        load_all(): Returns every task, kept for the next update()
+        intervals: The interval history of every task
+    """
+
+    # Whether get() and find() read only the named task instead of every task
+    indexed = False
+
+    def __init__(self, path):
+        """
+        Initializes the store.
+
+        Parameters:
+            path (str): The file the backend keeps its data in.
+        """
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._loaded = None
+        # The transaction _loaded was read in, None when read without the lock
+        self._loaded_in = None
+        self._lock_depth = 0
+        self._transaction_id = None
+        self._intervals = None
+
+    @property
+    def intervals(self):
+        """
+        The IntervalIndex holding every finished run of the store's tasks.
+
+        Backends add the runs of paused tasks to it whenever they save.
+        """
+        if self._intervals is None:
+            from task_timer.intervals import IntervalIndex
+            self._intervals = IntervalIndex(self.path + ".intervals")
+        return self._intervals
+
+    @contextmanager
+    def transaction(self):
+        """
+        Holds the store's lock so a load, change and save can't interleave
+        with another process doing the same.
+
+        Transactions can be nested, only the outermost one takes the lock.
+        """
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield self
+            finally:
+                self._lock_depth -= 1
+            return
+
+        with file_lock(self.lock_path):
+            self._lock_depth = 1
+            self._transaction_id = next(_transactions)
+            try:
+                yield self
+            finally:
+                self._lock_depth = 0
+                self._transaction_id = None
+
+    def transaction_id(self):
+        """
+        Returns a number identifying the outermost transaction the store is
+        in, or None when it isn't in one.
+
+        Stores that share another store's lock, such as the shards of a
+        sharded store, share this method with it too.
+        """
+        return self._transaction_id
+
+    def _keep(self, task_list):
+        """
+        Keeps loaded tasks for the next update(), noting the transaction they were read in.
+
+        Returns:
+            list: task_list
+        """
+        self._loaded = task_list
+        self._loaded_in = self.transaction_id()
+        return task_list
+
+    def load(self):
+        """
+        Returns a list of every stored Task. Loading never writes.
+        """
+        raise NotImplementedError
+
+    def iter_tasks(self):
+        """
+        Yields every stored Task in store order.
+
+        Backends that can read one task at a time override this so exports
+        never hold the whole store in memory.
+        """
+        yield from self.load()
+
+    def save(self, task_list, removed=()):
+        """
+        Persists the given tasks.
+
+        Only tasks marked dirty need to be written, and nothing should be
+        written when no task is dirty and nothing was removed. Runs and
+        renames recorded on the tasks are passed on to self.intervals.
+
+        Parameters:
+            task_list (list): The current Task objects
+            removed (iterable): Names of tasks deleted since they were loaded
+        """
+        raise NotImplementedError
+
+    @traced("store.read")
+    def get(self, name):
+        """
+        Returns the stored Task with the given name, or None.
+
+        The loaded tasks are kept until the next update() so a get followed
+        by an update in the same transaction only reads the store once.
+        """
+        task_list = self._keep(self.load())
+        return next((task for task in task_list if task.task_name == name), None)
+
+    @traced("store.read")
+    def get_many(self, names):
+        """
+        Returns the stored tasks with the given names, reading the store once.
+
+        Like get(), the loaded tasks are kept until the next update().
+
+        Parameters:
+            names (iterable): The task names to look up
+
+        Returns:
+            dict: The tasks that exist, by name.
+        """
+        names = set(names)
+        task_list = self._keep(self.load())
+        return {task.task_name: task for task in task_list if task.task_name in names}
+
+    @traced("store.read")
+    def find(self, name, case_sensitive=True):
+        """
+        Returns the stored task name matching name, or None.
+
+        Parameters:
+            name (str): The name to look for
+            case_sensitive (bool): Whether the name must match exactly
+        """
+        for task_name in self.names():
+            if task_name == name or (not case_sensitive and task_name.casefold() == name.casefold()):
+                return task_name
+        return None
+
+    @traced("store.read")
+    def names(self):
+        """
+        Returns the names of every stored task.
+        """
+        return [task.task_name for task in self.load()]
+
+    @traced("store.write")
+    def update(self, changed, removed=()):
+        """
+        Persists changed tasks and removals without the caller loading every task.
+
+        Changed tasks replace the stored task with the same name (or the name
+        they were renamed from), tasks that aren't stored yet are added.
+
+        Parameters:
+            changed (list): Task objects that were created or modified
+            removed (iterable): Names of tasks to delete
+        """
+        with self.transaction():
+            self._update(changed, removed)
+
+    def _update(self, changed, removed):
+        # Tasks read before the lock was taken may have been changed by
+        # another process since, so only the ones read under it are reused
+        current = self.transaction_id()
+        if self._loaded is not None and current is not None and self._loaded_in == current:
+            task_list = self._loaded
+        else:
+            task_list = self.load()
+        self._loaded = None
+
+        index = {task.task_name: position for position, task in enumerate(task_list)}
+        loaded = {id(task) for task in task_list}
+        for task in changed:
+            if id(task) in loaded:
+                # Returned by get(), so it is already in the list
+                continue
+            old_names = [value for event, value in task.events if event == "rename"]
+            stored_name = old_names[0] if old_names else task.task_name
+            if stored_name in index:
+                task_list[index[stored_name]] = task
+            else:
+                task_list.append(task)
+
+        removed = {name for name in removed if name in index}
+        task_list = [task for task in task_list if task.task_name not in removed or task in changed]
+        self.save(task_list, removed)
+
+    @traced("store.read")
+    def table(self):
+        """
+        Returns every stored task as a TaskTable.
+
+        Backends that can read rows without building Task objects override
+        this, so large stores can be added up in a fraction of the memory.
+        """
+        from task_timer.table import TaskTable
+        return TaskTable.from_tasks(self.load())
+
+    def store_for(self, name):
+        """
+        Returns the store the task with the given name is kept in.
+
+        This is the store itself, a sharded store returns the task's shard
+        so following one task doesn't read the others.
+        """
+        return self
+
+    def shard_key(self, name):
+        """
+        Returns the key of the part of the store a task name is kept in.
+
+        A store that isn't sharded is a single part, so every name has the same key.
+        """
+        return ""
+
+    def load_shard(self, key):
+        """
+        Returns every task in the part of the store with the given key.
+
+        Like get(), the loaded tasks are kept until the next update().
+
+        Parameters:
+            key (str): The part's key, see shard_key()
+        """
+        return self._keep(self.load())
+
+    def load_all(self):
+        """
+        Returns every stored task.
+
+        Like get(), the loaded tasks are kept until the next update(), so
+        changing some of them and saving in the same transaction reads the
+        store once.
+        """
+        return self._keep(self.load())
+
+    def files(self):
+        """
+        Returns the files the store keeps its data in.
+        """
+        return [self.path]
+
+    def version(self):
+        """
+        Returns a value that changes whenever the stored tasks change.
+
+        Only the store files are stat'ed, nothing is read, so this is cheap
+        enough to call on every display tick.
+        """
+        version = []
+        for path in self.files():
+            try:
+                stat = os.stat(path)
+                version.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                version.append(None)
+        return tuple(version)
+
+    def settle(self):
+        """
+        Finishes writing, so files() stay unchanged until the tasks change again.
+
+        Most backends are finished once save() returns. Used before noting
+        the version of the store, as the status cache does.
+        """
+
+    @traced("store.read")
+    def refresh(self, task_list):
+        """
+        Returns task_list brought up to date with the store.
+
+        Tasks whose stored state didn't change are kept as the same objects,
+        so anything cached about them stays valid.
+
+        Parameters:
+            task_list (list): Tasks loaded from this store earlier
+
+        Returns:
+            list: The current tasks, in store order.
+        """
+        current = {task.task_name: task for task in task_list}
+        refreshed = []
+        for task in self.load():
+            old = current.get(task.task_name)
+            if old is not None and _state(old) == _state(task):
+                refreshed.append(old)
+            else:
+                refreshed.append(task)
+        return refreshed
+
+def _state(task):
+    return (task.status, task.elapsed_ns, task.start_time, task.mono_start_ns, task.end_time)
@@ -0,0 +1,197 @@
+"""
+csv_store.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Stores every task as one row of a CSV file. This is the original storage
+format. Saves rewrite the whole file, except for new tasks, which are
+appended to it.
+"""
+import csv
+import io
+import os
+from task_timer.task import Task
+from task_timer.storage.base import Store
+from task_timer.storage.lock import atomic_write
+from task_timer.trace import span, traced
+
+HEADER = ["Task Name", "Status", "Time", "Start_time", "End_time", "Pre_pause_time", "Elapsed_ns", "Monotonic_start_ns", "Clock"]
+
+def _whole_row(line):
+    row = next(csv.reader([line]), [])
+    # Rows are written with six columns or all of HEADER, whose last column is an 8 character clock id or empty
+    return len(row) == 6 or (len(row) == len(HEADER) and len(row[-1]) in (0, 8))
+
+def complete_lines(file):
+    """
+    Yields the lines of an open CSV file, leaving out a torn last row.
+
+    A last line without a newline is usually a row torn by a crash, or an
+    append that is still being written, and is left out like the journal's
+    short records. It is kept when it holds a whole row, as in files saved
+    by hand without a final newline.
+    """
+    for line in file:
+        if line.endswith("\n") or _whole_row(line):
+            yield line
+
+class CSVStore(Store):
+    """
+    A store that keeps all tasks in a single CSV file.
+
+    CSV Structure:
+        Headers: Task Name, Status, Time, Start_time, End_time, Pre_pause_time,
+                 Elapsed_ns, Monotonic_start_ns, Clock
+        Each row contains the corresponding values for one task. Files
+        written before the last three columns existed are still read.
+
+    New tasks are appended to the file by update(), so readers leave out a
+    last row that isn't finished yet (see complete_lines).
+    """
+
+    @traced("store.read")
+    def load(self):
+        """
+        Reads every row of the CSV file into Task objects.
+
+        Returns:
+            list: The stored tasks, or an empty list if the file doesn't exist.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, mode="r", newline="") as file:
+            reader = csv.reader(complete_lines(file))
+            next(reader, None)
+            rows = list(reader)
+
+        with span("parse"):
+            return [Task.from_row(row) for row in rows]
+
+    @traced("store.read")
+    def iter_tasks(self):
+        """
+        Reads the CSV file one row at a time.
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, mode="r", newline="") as file:
+            reader = csv.reader(complete_lines(file))
+            next(reader, None)
+            for row in reader:
+                yield Task.from_row(row)
+
+    @traced("store.read")
+    def table(self):
+        """
+        Streams the CSV rows straight into a TaskTable.
+        """
+        from task_timer.table import TaskTable
+        if not os.path.exists(self.path):
+            return TaskTable()
+
+        with open(self.path, mode="r", newline="") as file:
+            reader = csv.reader(complete_lines(file))
+            next(reader, None)
+            return TaskTable.from_rows(reader)
+
+    @traced("store.write")
+    def save(self, task_list, removed=()):
+        """
+        Rewrites the CSV file if any task changed or was removed.
+
+        Parameters:
+            task_list (list): The current Task objects
+            removed (iterable): Names of tasks deleted since they were loaded
+        """
+        if not removed and not any(task.dirty for task in task_list):
+            return
+        with self.transaction():
+            history = self.intervals.collect(task_list)
+            self.write(task_list)
+            self.intervals.apply(history)
+
+    @traced("store.write")
+    def update(self, changed, removed=()):
+        """
+        Appends tasks that are new to the store to the end of the CSV file,
+        so adding tasks, such as an import's batches, doesn't rewrite the
+        whole file every time. Any other change rewrites it like save().
+
+        A task is new when it was created since the store was read. Callers
+        check its name isn't stored while holding the store's lock, as
+        TaskManager and transfer.import_tasks do.
+
+        Parameters:
+            changed (list): Task objects that were created or modified
+            removed (iterable): Names of tasks to delete
+        """
+        with self.transaction():
+            new = all(any(event == "create" for event, _ in task.events) for task in changed)
+            if removed or not changed or not new or not self._appendable():
+                self._update(changed, removed)
+                return
+
+            self._loaded = None
+            history = self.intervals.collect(changed)
+            self.append(changed)
+            self.intervals.apply(history)
+
+    def _appendable(self):
+        """
+        Returns whether rows can be appended, which needs a file whose last row is complete.
+        """
+        try:
+            with open(self.path, mode="rb") as file:
+                file.seek(-1, os.SEEK_END)
+                return file.read(1) == b"\n"
+        except OSError:
+            # Missing or empty, write() creates it with a header
+            return False
+
+    @traced("store.write")
+    def append(self, task_list):
+        """
+        Adds rows for the given tasks to the end of the CSV file and marks them clean.
+
+        The rows are written with a single write and synced to disk. Readers
+        that see only part of them skip the unfinished last row.
+
+        Parameters:
+            task_list (list): The Task objects to add, none of them stored yet
+        """
+        rows = io.StringIO(newline="")
+        writer = csv.writer(rows)
+        for task in task_list:
+            writer.writerow(task.to_row())
+
+        with self.transaction(), open(self.path, mode="a", newline="") as file:
+            file.write(rows.getvalue())
+            file.flush()
+            os.fsync(file.fileno())
+
+        for task in task_list:
+            task.dirty = False
+            task.events = []
+
+    @traced("store.write")
+    def write(self, task_list):
+        """
+        Rewrites the CSV file with the given tasks and marks them clean.
+
+        The rows are written to a temporary file that then replaces the CSV
+        file, so a crash or a concurrent reader never sees a half written file.
+
+        Parameters:
+            task_list (list): The Task objects to write
+        """
+        with self.transaction(), atomic_write(self.path) as file:
+            writer = csv.writer(file)
+            writer.writerow(HEADER)
+            for task in task_list:
+                writer.writerow(task.to_row())
+
+        for task in task_list:
+            task.dirty = False
+            task.events = []
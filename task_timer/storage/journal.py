@@ -0,0 +1,283 @@
+"""
+journal.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+An append-only journal store. Every state transition is appended to a
+journal file as a fixed-size record, so saving a change costs the same no
+matter how many tasks exist. The journal is periodically compacted into a
+CSV snapshot, and compacted records are kept in a history file.
+"""
+import math
+import os
+import struct
+import time
+from task_timer.task import STATUSES, Task
+from task_timer.storage.base import Store
+from task_timer.storage.csv_store import CSVStore
+from task_timer.trace import span, traced
+
+EVENTS = ("create", "start", "pause", "resume", "reset", "rename", "adjust", "update", "delete")
+
+# event, status, when, elapsed_ns, start_time, mono_start_ns, end_time, value, clock, name, old name
+RECORD = struct.Struct("<BBdqdqdd8s64s64s")
+NAME_BYTES = 64
+
+COMPACT_AFTER = 1000
+
+def _pack_time(value):
+    return math.nan if value is None else float(value)
+
+def _unpack_time(value):
+    return None if math.isnan(value) else value
+
+def _pack_ns(value):
+    # Monotonic readings are never negative, so -1 stands for None
+    return -1 if value is None else value
+
+def _unpack_ns(value):
+    return None if value < 0 else value
+
+def _pack_name(name):
+    data = name.encode("utf-8")
+    if len(data) > NAME_BYTES:
+        raise ValueError(f"task name '{name}' is longer than {NAME_BYTES} bytes")
+    return data
+
+class JournalStore(Store):
+    """
+    A store made of a CSV snapshot plus a journal of changes made since.
+
+    Each record holds the event that happened and the task's full state
+    after it, so replaying the journal over the snapshot is idempotent and
+    a crash half way through a compaction can't lose or double apply work.
+
+    Files:
+        <path>: CSV snapshot, readable by the CSV backend
+        <path>.journal: records appended since the last compaction
+        <path>.history: every record that has been compacted
+
+    Attributes:
+        compact_after (int): Number of journal records that triggers a compaction
+    """
+
+    def __init__(self, path, compact_after=COMPACT_AFTER):
+        """
+        Initializes the store.
+
+        Parameters:
+            path (str): The CSV snapshot file; journal files are kept beside it.
+            compact_after (int): Journal records allowed before compacting.
+        """
+        super().__init__(path)
+        self.snapshot = CSVStore(path)
+        # The snapshot shares this store's lock so compaction doesn't lock twice
+        self.snapshot.transaction = self.transaction
+        self.snapshot.transaction_id = self.transaction_id
+        self.journal_path = path + ".journal"
+        self.history_path = path + ".history"
+        self.compact_after = compact_after
+
+    def _read_records(self, path, start=0, end=None):
+        if not os.path.exists(path):
+            return
+        with open(path, mode="rb") as file:
+            file.seek(start)
+            position = start
+            while end is None or position < end:
+                data = file.read(RECORD.size)
+                if len(data) < RECORD.size:
+                    # A short read is a record torn by a crash, ignore it
+                    return
+                position += len(data)
+                yield RECORD.unpack(data)
+
+    def files(self):
+        """
+        Returns the snapshot and the journal.
+        """
+        return [self.path, self.journal_path]
+
+    def _replay(self, tasks, records):
+        for event, status, when, elapsed_ns, start_time, mono_start_ns, end_time, value, clock, name, old_name in records:
+            event = EVENTS[event]
+            name = name.rstrip(b"\0").decode("utf-8")
+
+            if event == "delete":
+                tasks.pop(name, None)
+                continue
+
+            if event == "rename":
+                old_name = old_name.rstrip(b"\0").decode("utf-8")
+                if old_name in tasks and name not in tasks:
+                    tasks = {name if key == old_name else key: task for key, task in tasks.items()}
+
+            task = Task(name)
+            task.status = STATUSES[status]
+            task.elapsed_ns = elapsed_ns
+            task.start_time = _unpack_time(start_time)
+            task.mono_start_ns = _unpack_ns(mono_start_ns)
+            task.clock = clock.rstrip(b"\0").decode("ascii") or None
+            task.end_time = _unpack_time(end_time)
+            task.dirty = False
+            task.events = []
+            tasks[name] = task
+        return tasks
+
+    def _journal_position(self):
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return None, 0
+        return stat.st_ino, stat.st_size - stat.st_size % RECORD.size
+
+    @traced("store.read")
+    def load(self):
+        """
+        Reads the snapshot and replays the journal on top of it.
+
+        Returns:
+            list: The stored tasks, in creation order.
+        """
+        self._snapshot_version = self.snapshot.version()
+        self._journal_inode, self._journal_offset = self._journal_position()
+
+        tasks = {task.task_name: task for task in self.snapshot.load()}
+        with span("parse", "replay journal"):
+            tasks = self._replay(tasks, self._read_records(self.journal_path, end=self._journal_offset))
+        return list(tasks.values())
+
+    @traced("store.read")
+    def refresh(self, task_list):
+        """
+        Returns task_list brought up to date by replaying only the journal
+        records appended since it was loaded.
+
+        Falls back to a full load when the journal was compacted since.
+        """
+        inode, offset = self._journal_position()
+        if (
+            getattr(self, "_snapshot_version", None) != self.snapshot.version()
+            or inode != self._journal_inode
+            or offset < self._journal_offset
+        ):
+            return super().refresh(task_list)
+
+        start, self._journal_offset = self._journal_offset, offset
+        tasks = {task.task_name: task for task in task_list}
+        tasks = self._replay(tasks, self._read_records(self.journal_path, start=start, end=offset))
+        return list(tasks.values())
+
+    def _record(self, event, task, when, value=None):
+        old_name = b""
+        amount = math.nan
+        if event == "rename":
+            old_name = _pack_name(value)
+        elif event == "adjust":
+            amount = float(value)
+
+        return RECORD.pack(
+            EVENTS.index(event),
+            STATUSES.index(task.status),
+            when,
+            task.elapsed_ns,
+            _pack_time(task.start_time),
+            _pack_ns(task.mono_start_ns),
+            _pack_time(task.end_time),
+            amount,
+            (task.clock or "").encode("ascii"),
+            _pack_name(task.task_name),
+            old_name,
+        )
+
+    @traced("store.write")
+    def save(self, task_list, removed=()):
+        """
+        Appends one record per recorded event of every dirty task, and one
+        delete record per removed name.
+
+        Parameters:
+            task_list (list): The current Task objects
+            removed (iterable): Names of tasks deleted since they were loaded
+        """
+        when = time.time()
+        records = []
+        for name in removed:
+            records.append(self._record("delete", Task(name), when))
+
+        for task in task_list:
+            if not task.dirty:
+                continue
+            for event, value in task.events or [("update", None)]:
+                records.append(self._record(event, task, when, value))
+
+        if not records:
+            return
+
+        with self.transaction():
+            history = self.intervals.collect(task_list)
+            with open(self.journal_path, mode="ab") as file:
+                file.write(b"".join(records))
+                file.flush()
+                os.fsync(file.fileno())
+            self.intervals.apply(history)
+
+            for task in task_list:
+                task.dirty = False
+                task.events = []
+
+            if os.path.getsize(self.journal_path) >= self.compact_after * RECORD.size:
+                self.compact()
+
+    def update(self, changed, removed=()):
+        """
+        Same as save(), appending never needs the other tasks.
+        """
+        self.save(changed, removed)
+
+    @traced("store.write")
+    def compact(self):
+        """
+        Folds the journal into the CSV snapshot.
+
+        The snapshot is written first and the journal is only cleared after,
+        so an interrupted compaction just replays the same records again.
+        """
+        with self.transaction():
+            if not os.path.exists(self.journal_path):
+                return
+
+            self.snapshot.write(self.load())
+
+            with open(self.journal_path, mode="rb") as journal, open(self.history_path, mode="ab") as history:
+                history.write(journal.read())
+                history.flush()
+                os.fsync(history.fileno())
+            os.remove(self.journal_path)
+
+    def history(self, name=None):
+        """
+        Yields every recorded state transition, oldest first.
+
+        Parameters:
+            name (str, optional): Only yield transitions of this task
+
+        Yields:
+            dict: The event, task name, time it was saved and the task's state after it.
+        """
+        for path in (self.history_path, self.journal_path):
+            for event, status, when, elapsed_ns, start_time, mono_start_ns, end_time, value, clock, task_name, old_name in self._read_records(path):
+                task_name = task_name.rstrip(b"\0").decode("utf-8")
+                if name is not None and task_name != name:
+                    continue
+                yield {
+                    "event": EVENTS[event],
+                    "name": task_name,
+                    "old_name": old_name.rstrip(b"\0").decode("utf-8") or None,
+                    "time": when,
+                    "status": STATUSES[status],
+                    "elapsed_ns": elapsed_ns,
+                    "start_time": _unpack_time(start_time),
+                    "end_time": _unpack_time(end_time),
+                    "adjusted": _unpack_time(value),
+                }
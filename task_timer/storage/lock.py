@@ -0,0 +1,87 @@
+"""
+lock.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Advisory file locking and atomic file replacement, so task-timer processes
+started at the same time (cron jobs, editor hooks, several shells) change
+the store one after another instead of overwriting each other.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl, locking is skipped there
+    fcntl = None
+
+_umask = None
+
+def _file_mode(path):
+    """
+    Returns the permissions a replacement for path should have: those of
+    the existing file, or what open() would give a new file.
+    """
+    global _umask
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+    if _umask is None:
+        # The umask can only be read by setting it, so it is read once
+        _umask = os.umask(0o022)
+        os.umask(_umask)
+    return 0o666 & ~_umask
+
+@contextmanager
+def file_lock(path):
+    """
+    Holds an exclusive advisory lock on path for the duration of the block.
+
+    Other processes asking for the same lock wait until it is released.
+    The lock file is created if it doesn't exist and is never removed.
+
+    Parameters:
+        path (str): The lock file
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, mode="a") as file:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def atomic_write(path, mode="w", newline=""):
+    """
+    Opens a temporary file next to path and replaces path with it once the
+    block finishes, so readers only ever see the old or the new contents.
+
+    The temporary file is synced to disk before the replace and removed if
+    the block raises. It is given the permissions of the file it replaces,
+    since mkstemp() creates it readable by its owner only.
+
+    Parameters:
+        path (str): The file to replace
+        mode (str): "w" for text or "wb" for bytes
+        newline (str): Passed to open() in text mode
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, newline=None if "b" in mode else newline) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,400 @@
+"""
+sharded.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Splits one task store into shards, so a command that works on one task
+only reads and writes the shard holding it instead of every task of every
+project. Tasks are assigned to shards by the part of their name before a
+separator ("client/report" goes in the "client" shard) or by a hash of
+their name. A small manifest lists the shards that exist.
+"""
+import json
+import os
+import shutil
+import zlib
+from task_timer.storage.base import Store
+from task_timer.storage.lock import atomic_write
+from task_timer.trace import traced
+
+SHARD_MODES = ("prefix", "hash")
+
+DEFAULT_SEPARATOR = "/"
+DEFAULT_HASH_SHARDS = 16
+
+def shard_directory(path):
+    """
+    Returns the directory the shards of the store at path are kept in.
+    """
+    return path + ".shards"
+
+def read_manifest(path):
+    """
+    Returns the shard manifest of the store at path, or None if it isn't sharded.
+
+    Parameters:
+        path (str): The task file
+    """
+    try:
+        with open(os.path.join(shard_directory(path), "manifest.json"), mode="r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+class ShardedStore(Store):
+    """
+    A store made of several stores of one backend, one per shard.
+
+    The shard a task is in depends only on its name (case folded, so a case
+    insensitive lookup also only reads one shard). Single task reads and
+    writes go to that shard alone, lookups of several tasks read each shard
+    involved once, and reading every task streams the shards one after
+    another. Shards are created the first time a task is written to them.
+
+    Every shard shares this store's lock and interval history, so history
+    recorded before a store was sharded is kept and renames across shards
+    move their history with them.
+
+    Files:
+        <path>.shards/manifest.json: how names are assigned and the file of every shard
+        <path>.shards/<number><extension>: one store of the backend per shard
+
+    Manifest:
+        {"version": 1, "backend": "csv", "by": "prefix", "separator": "/",
+         "count": null, "shards": {"client": "0000.csv", ...}}
+
+    Attributes:
+        backend (type): The Store class every shard uses
+        directory (str): Where the shards are kept
+        manifest (dict): The manifest as last read
+    """
+
+    def __init__(self, path, backend, directory=None):
+        """
+        Initializes the store from its manifest.
+
+        Parameters:
+            path (str): The task file the store stands in for
+            backend (type): The Store class of every shard
+            directory (str, optional): Where the shards are kept, <path>.shards by default
+        """
+        super().__init__(path)
+        self.backend = backend
+        self.directory = directory or shard_directory(path)
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self.manifest = None
+        self._shards = {}
+        # Version of each shard when its tasks were last loaded, see refresh()
+        self._versions = {}
+        self._read_manifest()
+
+    @classmethod
+    def create(cls, path, backend, name, by="prefix", separator=DEFAULT_SEPARATOR, count=DEFAULT_HASH_SHARDS, directory=None):
+        """
+        Writes a new, empty manifest and returns the store it describes.
+
+        Parameters:
+            path (str): The task file the store stands in for
+            backend (type): The Store class of every shard
+            name (str): The backend's name in BACKENDS
+            by (str): One of SHARD_MODES
+            separator (str): Ends the prefix of a name when sharding by prefix
+            count (int): Number of shards when sharding by hash
+            directory (str, optional): Where the shards are kept
+        """
+        if by not in SHARD_MODES:
+            raise ValueError(f"unknown shard mode '{by}', expected one of {', '.join(SHARD_MODES)}")
+        if by == "prefix" and not separator:
+            raise ValueError("sharding by prefix needs a separator")
+        if by == "hash" and count < 1:
+            raise ValueError("sharding by hash needs at least 1 shard")
+
+        directory = directory or shard_directory(path)
+        os.makedirs(directory, exist_ok=True)
+        manifest = {
+            "version": 1,
+            "backend": name,
+            "by": by,
+            "separator": separator if by == "prefix" else None,
+            "count": count if by == "hash" else None,
+            "shards": {},
+        }
+        with atomic_write(os.path.join(directory, "manifest.json")) as file:
+            json.dump(manifest, file, indent=2)
+        return cls(path, backend, directory)
+
+    def _read_manifest(self):
+        with open(self.manifest_path, mode="r") as file:
+            self.manifest = json.load(file)
+
+    def shard_key(self, name):
+        """
+        Returns the key of the shard a task name belongs in.
+
+        Parameters:
+            name (str): The task name
+
+        Returns:
+            str: The name's prefix ("" for names without the separator), or
+                 the number of its hash bucket.
+        """
+        folded = name.casefold()
+        if self.manifest["by"] == "hash":
+            return str(zlib.crc32(folded.encode("utf-8")) % self.manifest["count"])
+        prefix, separator, _ = folded.partition(self.manifest["separator"])
+        return prefix if separator else ""
+
+    def shard(self, key, create=False):
+        """
+        Returns the store of a shard, or None if it doesn't exist yet.
+
+        Parameters:
+            key (str): The shard key, see shard_key()
+            create (bool): Add the shard to the manifest if it doesn't exist.
+                           Only done while holding the store's lock.
+        """
+        store = self._shards.get(key)
+        if store is not None:
+            return store
+
+        if key not in self.manifest["shards"]:
+            # Another process may have added it since the manifest was read
+            self._read_manifest()
+        if key not in self.manifest["shards"]:
+            if not create:
+                return None
+            extension = os.path.splitext(self.path)[1]
+            self.manifest["shards"][key] = f"{len(self.manifest['shards']):04d}{extension}"
+            with atomic_write(self.manifest_path) as file:
+                json.dump(self.manifest, file, indent=2)
+
+        store = self.backend(os.path.join(self.directory, self.manifest["shards"][key]))
+        # Every write already holds this store's lock, and the history is shared
+        store.transaction = self.transaction
+        store.transaction_id = self.transaction_id
+        store._intervals = self.intervals
+        self._shards[key] = store
+        return store
+
+    def shards(self):
+        """
+        Returns (key, store) for every shard, in the order they were created.
+        """
+        self._read_manifest()
+        return [(key, self.shard(key)) for key in self.manifest["shards"]]
+
+    @property
+    def indexed(self):
+        return self.backend.indexed
+
+    def load_shard(self, key):
+        """
+        Returns the tasks of one shard, an empty list if it doesn't exist yet.
+        """
+        store = self.shard(key)
+        return [] if store is None else store.load_shard("")
+
+    def load_all(self):
+        """
+        Returns the tasks of every shard, each shard keeping its own for the next update().
+        """
+        return [task for _, store in self.shards() for task in store.load_all()]
+
+    def store_for(self, name):
+        """
+        Returns the shard holding the task with the given name.
+        """
+        return self.shard(self.shard_key(name)) or self
+
+    def load(self):
+        """
+        Returns the tasks of every shard, one shard after another.
+        """
+        task_list = []
+        for key, store in self.shards():
+            self._versions[key] = store.version()
+            task_list.extend(store.load())
+        return task_list
+
+    @traced("store.read")
+    def iter_tasks(self):
+        """
+        Yields the tasks of every shard, only reading a shard once the one
+        before it is done.
+        """
+        for _, store in self.shards():
+            yield from store.iter_tasks()
+
+    def _group(self, changed, removed):
+        groups = {}
+        for task in changed:
+            key = self.shard_key(task.task_name)
+            groups.setdefault(key, ([], []))[0].append(task)
+            old_names = [value for event, value in task.events if event == "rename"]
+            if old_names and self.shard_key(old_names[0]) != key:
+                # Renamed into another shard, so it is deleted from the old one
+                groups.setdefault(self.shard_key(old_names[0]), ([], []))[1].append(old_names[0])
+        for name in removed:
+            groups.setdefault(self.shard_key(name), ([], []))[1].append(name)
+
+        # Shards gaining tasks are written before shards losing them, so a
+        # crash in between leaves a renamed task in both shards instead of neither
+        return sorted(groups.items(), key=lambda group: not group[1][0])
+
+    def save(self, task_list, removed=()):
+        """
+        Saves each shard's part of a full task list.
+
+        Parameters:
+            task_list (list): Every task, as returned by load()
+            removed (iterable): Names of tasks deleted since they were loaded
+        """
+        removed = list(removed)
+        if not removed and not any(task.dirty for task in task_list):
+            return
+
+        with self.transaction():
+            for key, (shard_tasks, shard_removed) in self._group(task_list, removed):
+                if not shard_removed and not any(task.dirty for task in shard_tasks):
+                    continue
+                store = self.shard(key, create=bool(shard_tasks))
+                if store is not None:
+                    store.save(shard_tasks, shard_removed)
+
+    def get(self, name):
+        """
+        Returns the stored Task with the given name, reading only its shard.
+        """
+        store = self.shard(self.shard_key(name))
+        return None if store is None else store.get(name)
+
+    def get_many(self, names):
+        """
+        Returns the stored tasks with the given names, reading each of their shards once.
+        """
+        keys = {}
+        for name in names:
+            keys.setdefault(self.shard_key(name), []).append(name)
+
+        tasks = {}
+        for key, shard_names in keys.items():
+            store = self.shard(key)
+            if store is not None:
+                tasks.update(store.get_many(shard_names))
+        return tasks
+
+    def find(self, name, case_sensitive=True):
+        """
+        Returns the stored spelling of a task name, looking only in its shard.
+        """
+        store = self.shard(self.shard_key(name))
+        return None if store is None else store.find(name, case_sensitive)
+
+    def names(self):
+        """
+        Returns the names of the tasks in every shard.
+        """
+        return [name for _, store in self.shards() for name in store.names()]
+
+    def update(self, changed, removed=()):
+        """
+        Passes each shard the changes and removals of its own tasks.
+
+        A task renamed into another shard is added to the new shard and
+        deleted from its old one.
+        """
+        with self.transaction():
+            for key, (shard_changed, shard_removed) in self._group(changed, removed):
+                store = self.shard(key, create=bool(shard_changed))
+                if store is None:
+                    continue
+                if shard_removed and not shard_changed:
+                    # Tasks read from this shard may have been renamed away, read it again
+                    store._loaded = None
+                store.update(shard_changed, shard_removed)
+
+    def settle(self):
+        """
+        Settles every shard that was opened.
+        """
+        for store in self._shards.values():
+            store.settle()
+
+    def files(self):
+        """
+        Returns the manifest and the files of every shard.
+        """
+        return [self.manifest_path] + [path for _, store in self.shards() for path in store.files()]
+
+    def refresh(self, task_list):
+        """
+        Returns task_list brought up to date, only reading the shards that
+        changed since they were last read.
+        """
+        grouped = {}
+        for task in task_list:
+            grouped.setdefault(self.shard_key(task.task_name), []).append(task)
+
+        refreshed = []
+        for key, store in self.shards():
+            version = store.version()
+            if key in self._versions and version == self._versions[key]:
+                refreshed.extend(grouped.get(key, []))
+            else:
+                self._versions[key] = version
+                refreshed.extend(store.refresh(grouped.get(key, [])))
+        return refreshed
+
+def reshard(source, name, by, separator=DEFAULT_SEPARATOR, count=DEFAULT_HASH_SHARDS):
+    """
+    Moves every task of a store into a new set of shards, or back into a
+    single store when by is "none".
+
+    The new store is written before the old one is removed, and the
+    interval history stays where it is.
+
+    Parameters:
+        source (Store): The store as it is now, sharded or not
+        name (str): The backend's name in BACKENDS
+        by (str): One of SHARD_MODES, or "none"
+        separator (str): Ends the prefix of a name when sharding by prefix
+        count (int): Number of shards when sharding by hash
+
+    Returns:
+        Store: The new store.
+    """
+    sharded = isinstance(source, ShardedStore)
+    if by == "none" and not sharded:
+        raise ValueError("the store isn't sharded")
+    path = source.path
+    backend = source.backend if sharded else type(source)
+
+    with source.transaction():
+        task_list = source.load()
+        for task in task_list:
+            task.dirty = True
+            task.events = []
+
+        old_directory = None
+        if sharded:
+            # Kept until the new store is written, in case anything fails
+            old_directory = source.directory + ".old"
+            shutil.rmtree(old_directory, ignore_errors=True)
+            os.rename(source.directory, old_directory)
+
+        if by == "none":
+            target = backend(path)
+        else:
+            target = ShardedStore.create(path, backend, name, by, separator, count)
+        target.transaction = source.transaction
+        target.transaction_id = source.transaction_id
+        target.save(task_list)
+
+        if old_directory is not None:
+            shutil.rmtree(old_directory)
+        else:
+            for file in source.files():
+                if os.path.exists(file):
+                    os.remove(file)
+
+    return target
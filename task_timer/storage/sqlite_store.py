@@ -0,0 +1,225 @@
+"""
+sqlite_store.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Stores tasks in an SQLite database with a unique index on the task name,
+so commands that work on one task only read and write that task's row.
+"""
+import os
+import sqlite3
+from task_timer.task import Task
+from task_timer.storage.base import Store
+from task_timer.trace import span, traced
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    time REAL,
+    start_time REAL,
+    end_time REAL,
+    pre_paused_time REAL,
+    elapsed_ns INTEGER,
+    mono_start_ns INTEGER,
+    clock TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS tasks_name ON tasks (name);
+CREATE INDEX IF NOT EXISTS tasks_name_nocase ON tasks (name COLLATE NOCASE);
+"""
+
+COLUMNS = "name, status, time, start_time, end_time, pre_paused_time, elapsed_ns, mono_start_ns, clock"
+
+# Columns added after the first version of the schema, added to older databases on open
+ADDED_COLUMNS = {"elapsed_ns": "INTEGER", "mono_start_ns": "INTEGER", "clock": "TEXT"}
+
+class SQLiteStore(Store):
+    """
+    A store that keeps one row per task in an SQLite database.
+
+    The database sits beside the task file with a .db extension, so the
+    default tasks.csv is stored in tasks.db. It runs in WAL mode so readers
+    never block the single writer.
+
+    Attributes:
+        db_path (str): The SQLite database file
+    """
+
+    indexed = True
+
+    def __init__(self, path):
+        """
+        Initializes the store. The database is opened on first use.
+
+        Parameters:
+            path (str): The task file, its extension is replaced with .db.
+        """
+        super().__init__(path)
+        self.db_path = os.path.splitext(path)[0] + ".db"
+        self._connection = None
+
+    @property
+    def connection(self):
+        """
+        The open database connection, created along with the schema on first use.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+            existing = {row[1] for row in self._connection.execute("PRAGMA table_info(tasks)")}
+            with self._connection:
+                for column, kind in ADDED_COLUMNS.items():
+                    if column not in existing:
+                        self._connection.execute(f"ALTER TABLE tasks ADD COLUMN {column} {kind}")
+        return self._connection
+
+    def files(self):
+        """
+        Returns the database and its write-ahead log.
+        """
+        return [self.db_path, self.db_path + "-wal"]
+
+    def settle(self):
+        """
+        Moves the write-ahead log into the database and empties it. Otherwise
+        the database changes when the last connection closes, long after the
+        write, and the log disappears.
+        """
+        if self._connection is not None:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    @traced("store.read")
+    def load(self):
+        """
+        Returns every stored task in creation order.
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        rows = self.connection.execute(f"SELECT {COLUMNS} FROM tasks ORDER BY id").fetchall()
+        with span("parse"):
+            return [Task.from_row(row) for row in rows]
+
+    @traced("store.read")
+    def iter_tasks(self):
+        """
+        Yields every stored task in creation order as rows are fetched.
+        """
+        if not os.path.exists(self.db_path):
+            return
+        for row in self.connection.execute(f"SELECT {COLUMNS} FROM tasks ORDER BY id"):
+            yield Task.from_row(row)
+
+    @traced("store.read")
+    def table(self):
+        """
+        Streams the rows straight into a TaskTable.
+        """
+        from task_timer.table import TaskTable
+        if not os.path.exists(self.db_path):
+            return TaskTable()
+        return TaskTable.from_rows(self.connection.execute(f"SELECT {COLUMNS} FROM tasks ORDER BY id"))
+
+    @traced("store.read")
+    def get(self, name):
+        """
+        Returns the stored Task with the given name using the name index, or None.
+        """
+        if not os.path.exists(self.db_path):
+            return None
+        row = self.connection.execute(f"SELECT {COLUMNS} FROM tasks WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        return Task.from_row(row)
+
+    @traced("store.read")
+    def get_many(self, names):
+        """
+        Returns the stored tasks with the given names using the name index.
+        """
+        if not os.path.exists(self.db_path):
+            return {}
+        names = list(names)
+        tasks = {}
+        # Stay below SQLite's limit on the number of query parameters
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self.connection.execute(f"SELECT {COLUMNS} FROM tasks WHERE name IN ({placeholders})", chunk):
+                task = Task.from_row(row)
+                tasks[task.task_name] = task
+        return tasks
+
+    @traced("store.read")
+    def find(self, name, case_sensitive=True):
+        """
+        Returns the stored task name matching name using the name indexes, or None.
+        """
+        if not os.path.exists(self.db_path):
+            return None
+        if case_sensitive:
+            query = "SELECT name FROM tasks WHERE name = ?"
+        else:
+            query = "SELECT name FROM tasks WHERE name = ? COLLATE NOCASE ORDER BY id LIMIT 1"
+        row = self.connection.execute(query, (name,)).fetchone()
+        return row[0] if row else None
+
+    @traced("store.read")
+    def names(self):
+        """
+        Returns the names of every stored task without reading their timing data.
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        return [row[0] for row in self.connection.execute("SELECT name FROM tasks ORDER BY id")]
+
+    @traced("store.write")
+    def save(self, task_list, removed=()):
+        """
+        Writes only the rows of dirty tasks and deletes removed tasks, in one transaction.
+
+        Parameters:
+            task_list (list): Task objects, only the dirty ones are written
+            removed (iterable): Names of tasks to delete
+        """
+        changed = [task for task in task_list if task.dirty]
+        if not changed and not removed:
+            return
+
+        with self.transaction():
+            history = self.intervals.collect(changed)
+            with self.connection:
+                for name in removed:
+                    self.connection.execute("DELETE FROM tasks WHERE name = ?", (name,))
+
+                for task in changed:
+                    row = task.to_row()
+                    old_names = [value for event, value in task.events if event == "rename"]
+                    stored_name = old_names[0] if old_names else task.task_name
+                    cursor = self.connection.execute(
+                        "UPDATE tasks SET name = ?, status = ?, time = ?, start_time = ?, end_time = ?, pre_paused_time = ?, "
+                        "elapsed_ns = ?, mono_start_ns = ?, clock = ? WHERE name = ?",
+                        (*row, stored_name),
+                    )
+                    if cursor.rowcount == 0:
+                        self.connection.execute(
+                            f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                            "ON CONFLICT (name) DO UPDATE SET status = excluded.status, time = excluded.time, "
+                            "start_time = excluded.start_time, end_time = excluded.end_time, pre_paused_time = excluded.pre_paused_time, "
+                            "elapsed_ns = excluded.elapsed_ns, mono_start_ns = excluded.mono_start_ns, clock = excluded.clock",
+                            row,
+                        )
+            self.intervals.apply(history)
+
+        for task in changed:
+            task.dirty = False
+            task.events = []
+
+    def update(self, changed, removed=()):
+        """
+        Same as save(), every write already only touches the rows it needs.
+        """
+        self.save(changed, removed)
@@ -0,0 +1,161 @@
+"""
+table.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+A columnar task table for loading and adding up very large task archives.
+Instead of one Task object per task, names are kept in a list and the
+status and timestamps in parallel typed arrays. Totals are computed with
+NumPy when it is installed, and with plain loops over the arrays otherwise.
+"""
+import math
+import time
+from array import array
+from task_timer.task import NS_PER_SECOND, STATUSES, Task, parse_row
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TaskTable():
+    """
+    Tasks stored column by column.
+
+    Missing timestamps are stored as NaN and missing monotonic readings as
+    -1, since typed arrays can't hold None.
+
+    Attributes:
+        names (list): Task names
+        status (array): Index into STATUSES for every task
+        elapsed_ns (array): Time accumulated before the current run, in nanoseconds
+        start_time (array): Unix timestamp when the current run started
+        mono_start_ns (array): time.monotonic_ns() when the current run started
+        clock (list): clock_id() the monotonic reading was taken on
+        end_time (array): Unix timestamp when each task was last paused
+
+    Methods:
+        from_tasks(tasks): Builds a table from Task objects
+        from_rows(rows): Builds a table from CSV rows without creating Tasks
+        append(task): Adds a task to the end of the table
+        elapsed(now): Returns every task's run time in seconds
+        total(now): Returns the run time of all tasks added together
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty table.
+        """
+        self.names = []
+        self.status = array("b")
+        self.elapsed_ns = array("q")
+        self.start_time = array("d")
+        self.mono_start_ns = array("q")
+        self.clock = []
+        self.end_time = array("d")
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """
+        Builds a table from an iterable of Task objects.
+        """
+        table = cls()
+        for task in tasks:
+            table.append(task)
+        return table
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds a table from rows in the CSV column order, one row at a time.
+
+        Parameters:
+            rows (iterable): Rows in the column order of Task.to_row (see parse_row)
+        """
+        table = cls()
+        for row in rows:
+            table._append(*parse_row(row))
+        return table
+
+    def _append(self, task_name, status, elapsed_ns, start_time, end_time, mono_start_ns, clock):
+        self.names.append(task_name)
+        self.status.append(STATUSES.index(status))
+        self.elapsed_ns.append(elapsed_ns)
+        self.start_time.append(_to_float(start_time))
+        self.mono_start_ns.append(-1 if mono_start_ns is None else mono_start_ns)
+        self.clock.append(clock)
+        self.end_time.append(_to_float(end_time))
+
+    def append(self, task):
+        """
+        Adds a task to the end of the table.
+
+        Parameters:
+            task (Task): The task to add
+        """
+        self._append(task.task_name, task.status, task.elapsed_ns, task.start_time, task.end_time, task.mono_start_ns, task.clock)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Returns the task at index as a Task object.
+        """
+        task = Task(self.names[index])
+        task.status = STATUSES[self.status[index]]
+        task.elapsed_ns = self.elapsed_ns[index]
+        task.start_time = _from_float(self.start_time[index])
+        task.mono_start_ns = None if self.mono_start_ns[index] < 0 else self.mono_start_ns[index]
+        task.clock = self.clock[index]
+        task.end_time = _from_float(self.end_time[index])
+        task.dirty = False
+        task.events = []
+        return task
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def elapsed(self, now=None):
+        """
+        Returns every task's total time in seconds.
+
+        The current run of active tasks is measured from its wall clock start
+        time, which is what lets a whole column be added up at once. Use
+        Task.elapsed() where a single task needs the monotonic reading.
+
+        Parameters:
+            now (float, optional): Unix timestamp to measure running tasks to
+
+        Returns:
+            numpy.ndarray or array: Total time per task, in table order.
+        """
+        now = time.time() if now is None else now
+
+        if numpy is not None:
+            elapsed = numpy.frombuffer(self.elapsed_ns, dtype=numpy.int64) / NS_PER_SECOND
+            start = numpy.frombuffer(self.start_time, dtype=numpy.float64)
+            running = numpy.where(numpy.isnan(start), 0.0, numpy.maximum(now - start, 0.0))
+            return elapsed + running
+
+        elapsed = array("d")
+        for elapsed_ns, start in zip(self.elapsed_ns, self.start_time):
+            running = 0.0 if math.isnan(start) else max(now - start, 0.0)
+            elapsed.append(elapsed_ns / NS_PER_SECOND + running)
+        return elapsed
+
+    def total(self, now=None):
+        """
+        Returns the total time of every task added together, in seconds.
+        """
+        elapsed = self.elapsed(now)
+        if numpy is not None and isinstance(elapsed, numpy.ndarray):
+            return float(elapsed.sum())
+        return float(sum(elapsed))
+
+def _to_float(value):
+    return math.nan if value in ("", None) else float(value)
+
+def _from_float(value):
+    return None if math.isnan(value) else value
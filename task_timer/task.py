@@ -7,8 +7,95 @@ This is the task class that im using to create and manage tasks,
 and their indicidual processes.
 """
 
+import functools
 import time
-from colorama import Fore
+from task_timer.color import Fore
+from task_timer.durations import format_time
+
+STATUSES = ("Off", "Active", "Paused")
+
+NS_PER_SECOND = 1_000_000_000
+
+_clock_id = False
+
+def clock_id():
+    """
+    Identifies the monotonic clock of the running system.
+    
+    Monotonic readings are only comparable between processes started since
+    the same boot, so they are saved along with this id. On Linux it is the
+    start of the kernel boot id, elsewhere it is None and monotonic readings
+    from another process are trusted as long as they aren't in the future.
+    
+    Returns:
+        str or None: The clock id.
+    """
+    global _clock_id
+    if _clock_id is False:
+        try:
+            with open("/proc/sys/kernel/random/boot_id") as file:
+                _clock_id = file.read(8)
+        except OSError:
+            _clock_id = None
+    return _clock_id
+
+def parse_row(row):
+    """
+    Parses a saved CSV row into the task's stored fields.
+    
+    Rows saved before durations were kept in nanoseconds only have the first
+    six columns. Their time is converted the way it used to be shown: the
+    time between start and end for paused tasks, and a run that began at the
+    start time for active ones.
+    
+    Parameters:
+        row (list): Task Name, Status, Time, Start_time, End_time, Pre_pause_time,
+                    and optionally Elapsed_ns, Monotonic_start_ns, Clock
+    
+    Returns:
+        tuple: (task_name, status, elapsed_ns, start_time, end_time, mono_start_ns, clock)
+    """
+    task_name, status, _, start_time, end_time = row[:5]
+    start_time = _parse_float(start_time)
+    end_time = _parse_float(end_time)
+
+    if len(row) >= 9 and row[6] not in ("", None):
+        elapsed_ns = int(row[6])
+        mono_start_ns = int(row[7]) if row[7] not in ("", None) else None
+        clock = row[8] or None
+        return task_name, status, elapsed_ns, start_time, end_time, mono_start_ns, clock
+
+    elapsed_ns = 0
+    if status == "Paused" and start_time is not None and end_time is not None:
+        elapsed_ns = round((end_time - start_time) * NS_PER_SECOND)
+        start_time = None
+    elif status != "Active":
+        start_time = None
+    return task_name, status, elapsed_ns, start_time, end_time, None, None
+
+def _parse_float(value):
+    return float(value) if value not in ("", None) else None
+
+# Names of the Fore colors, looked up when a row is built so colors can be turned off
+STATUS_COLORS = {"Off": "RED", "Paused": "MAGENTA", "Active": "GREEN"}
+
+@functools.lru_cache(maxsize=65536)
+def row_prefix(task_name, status):
+    """
+    Returns the colored name and status columns of a task's row.
+    
+    They only change when the task is renamed or toggled, so they are built
+    once and only the time column is formatted on every redraw.
+    
+    Parameters:
+        task_name (str): The task's name
+        status (str): The task's status
+    
+    Returns:
+        str: The row up to and including the separator before the time.
+    """
+    status_str = f"{getattr(Fore, STATUS_COLORS[status])}{status}{Fore.RESET}"
+    return f"{Fore.BLUE}{task_name}{Fore.RESET}{" " * (15 - len(task_name))}| {status_str}{" " * (12 - len(status))} | "
 
 class Task():
     """
@@ -16,21 +103,38 @@ class Task():
     
     This class provides functionality to start, pause, resume, and monitor task durations.
     It handles time tracking with various states (Off, Active, Paused) and provides
-    formatted time output.
+    formatted time output. Tasks use __slots__ so large task lists stay small
+    in memory, see task_timer.table.TaskTable for a columnar alternative.
+    
+    Durations are measured with the monotonic clock in integer nanoseconds,
+    so changes to the system clock don't affect them and totals don't pick
+    up rounding errors over many pauses. The wall clock start time is kept
+    as well, for processes that can't use the monotonic reading.
     
     Attributes:
         task_name (str): The name of the task
-        task_len (float): The total length of the task
-        start_time (float): Unix timestamp when task was started
-        end_time (float): Unix timestamp when task was ended/paused
-        current_time (float): Current Unix timestamp for calculations
         status (str): Current status of the task ("Off", "Active", "Paused")
-        pre_paused_time (float): Accumulated time before pauses
+        elapsed_ns (int): Time accumulated before the current run, in nanoseconds
+        start_time (float): Unix timestamp when the current run started
+        mono_start_ns (int): time.monotonic_ns() when the current run started
+        clock (str): clock_id() of the system mono_start_ns was read on
+        end_time (float): Unix timestamp when the task was last paused
+        dirty (bool): True when the task has changes that haven't been saved
+        events (list): (event, value) pairs recorded since the task was last saved
     
     Methods:
+        from_row(row): Rebuilds a saved task from a CSV row
+        to_row(): Returns the task's saved state as a CSV row
+        record(event, value): Marks the task dirty and remembers what changed
         start(): Initiates the task timer
         pause(): Temporarily stops the task timer
         resume(): Continues the task timer from where it was paused
+        rename(new_name): Changes the task's name
+        reset(): Sets the task's time back to zero
+        adjust(seconds): Adds or removes time from the task
+        running_ns(): Returns the length of the current run in nanoseconds
+        elapsed_total_ns(): Returns the task's total time in nanoseconds
+        elapsed(): Returns the task's total time in seconds
         calc_time(start, end): Calculates and formats the elapsed time
         __str__(): Returns a string representation of the task's current state
     
@@ -41,6 +145,7 @@ class Task():
         task.resume()
         print(task)  # Output: My Task | Active | MM:SS
     """
+    __slots__ = ("task_name", "status", "elapsed_ns", "start_time", "mono_start_ns", "clock", "end_time", "dirty", "events")
     
     def __init__(self, task_name):
         """
@@ -50,42 +155,185 @@ class Task():
             task_name (str): The name of the task being created.
         """
         self.task_name = task_name
-        self.task_len = 0
+        self.status = "Off"
+        self.elapsed_ns = 0
         self.start_time = None
+        self.mono_start_ns = None
+        self.clock = None
+        self.end_time = None
+        self.dirty = True
+        self.events = [("create", None)]
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Rebuilds a task from a saved CSV row.
+        
+        The returned task is clean, since its state matches what is stored.
+        
+        Parameters:
+            row (list): A row in the column order written by to_row, or one of
+                        the older six column rows (see parse_row)
+        
+        Returns:
+            Task: The task with its saved state restored.
+        """
+        task_name, status, elapsed_ns, start_time, end_time, mono_start_ns, clock = parse_row(row)
+        task = cls(task_name)
+        task.status = status
+        task.elapsed_ns = elapsed_ns
+        task.start_time = start_time
+        task.end_time = end_time
+        task.mono_start_ns = mono_start_ns
+        task.clock = clock
+        task.dirty = False
+        task.events = []
+        return task
+
+    def to_row(self):
+        """
+        Returns the task's saved state in the same column order read by from_row.
+        
+        Columns:
+            Task Name, Status, Time (total seconds when saved), Start_time, End_time,
+            Pre_pause_time (seconds before the current run), Elapsed_ns,
+            Monotonic_start_ns, Clock
+        """
+        return [
+            self.task_name,
+            self.status,
+            self.elapsed(),
+            self.start_time,
+            self.end_time,
+            self.elapsed_ns / NS_PER_SECOND,
+            self.elapsed_ns,
+            self.mono_start_ns,
+            self.clock,
+        ]
+
+    def record(self, event, value=None):
+        """
+        Marks the task as changed and records the state transition.
+        
+        Storage backends that keep a history (such as the journal) write one
+        entry per recorded event, others only look at the dirty flag.
+        
+        Parameters:
+            event (str): One of start, pause, resume, reset, rename or adjust
+            value (optional): The old name for a rename, the seconds adjusted,
+                              or the (start, end) timestamps of the run a pause ended
+        """
+        self.dirty = True
+        self.events.append((event, value))
+
+    def _begin_run(self):
+        self.start_time = time.time()
+        self.mono_start_ns = time.monotonic_ns()
+        self.clock = clock_id()
         self.end_time = None
-        self.current_time = 0
-        self.status = "Off"
-        self.pre_paused_time = 0
 
     def start(self):
         """
         Starts the task timer by recording the current time as the start time.
         Sets the status of the task to 'Active'.
         """
-        self.start_time = time.time()
+        self._begin_run()
         self.status = "Active"
-        print(f"{Fore.MAGENTA}{self.task_name}{Fore.RESET}: {Fore.GREEN}Started Successfully{Fore.RESET}")
+        self.record("start")
     
     def pause(self):
         """
-        Pauses the task timer by recording the current time as the end time.
-        The elapsed time before the pause is added to the pre-paused time.
+        Pauses the task timer by adding the length of the current run to the
+        elapsed time and recording the current time as the end time.
+        The run is recorded so stores can add it to the interval history.
         Sets the task status to 'Paused'.
         """
+        running = self.running_ns()
+        self.elapsed_ns += running
         self.end_time = time.time()
-        self.pre_paused_time += self.end_time - (self.start_time + self.pre_paused_time)
+        run = (self.end_time - running / NS_PER_SECOND, self.end_time)
+        self.start_time = None
+        self.mono_start_ns = None
+        self.clock = None
         self.status = "Paused"
-        print(f"{Fore.MAGENTA}{self.task_name}{Fore.RESET}: {Fore.GREEN}Successfully Paused{Fore.RESET}")
+        self.record("pause", run)
 
     def resume(self):
         """
-        Resumes the task timer by resetting the start time and subtracting the pre-paused time.
+        Resumes the task timer by starting a new run on top of the elapsed time.
         Sets the task status to 'Active'.
         """
-        self.end_time = None
-        self.start_time = time.time() - self.pre_paused_time
+        self._begin_run()
         self.status = "Active"
-        print(f"{Fore.MAGENTA}{self.task_name}{Fore.RESET}: {Fore.GREEN}Resumed Successfully{Fore.RESET}")
+        self.record("resume")
+
+    def rename(self, new_name):
+        """
+        Changes the task's name.
+        
+        Parameters:
+            new_name (str): The new name
+        """
+        old_name = self.task_name
+        self.task_name = new_name
+        self.record("rename", old_name)
+
+    def reset(self):
+        """
+        Sets the task's time back to zero. An active task keeps running from zero.
+        """
+        self.elapsed_ns = 0
+        self.end_time = None
+        if self.status == "Active":
+            self._begin_run()
+        else:
+            self.start_time = None
+            self.mono_start_ns = None
+            self.clock = None
+        self.record("reset")
+
+    def adjust(self, seconds):
+        """
+        Adds seconds to the task's elapsed time, or removes them if negative.
+        The elapsed time never goes below zero.
+        
+        Parameters:
+            seconds (int): The seconds to add
+        """
+        self.elapsed_ns = max(0, self.elapsed_ns + seconds * NS_PER_SECOND)
+        self.record("adjust", seconds)
+
+    def running_ns(self):
+        """
+        Returns how long the current run has lasted, in nanoseconds.
+        
+        Uses the monotonic clock when the run was started since this boot,
+        and falls back to the wall clock start time otherwise.
+        
+        Returns:
+            int: The length of the current run, 0 if the task isn't active.
+        """
+        if self.status != "Active" or self.start_time is None:
+            return 0
+
+        if self.mono_start_ns is not None and self.clock == clock_id():
+            running = time.monotonic_ns() - self.mono_start_ns
+            if running >= 0:
+                return running
+
+        return max(0, round((time.time() - self.start_time) * NS_PER_SECOND))
+
+    def elapsed_total_ns(self):
+        """
+        Returns the task's total time, including the current run, in nanoseconds.
+        """
+        return self.elapsed_ns + self.running_ns()
+
+    def elapsed(self):
+        """
+        Returns the task's total time, including the current run, in seconds.
+        """
+        return self.elapsed_total_ns() / NS_PER_SECOND
 
     def calc_time(self, start, end):
         """
@@ -98,14 +346,7 @@ class Task():
         Returns:
             str: The formatted elapsed time as a string in HH:MM:SS or MM:SS format.
         """
-        tot_time = end - start
-        if tot_time <= 60:
-            tot_time = f"{tot_time:.0f}"
-        elif tot_time > 60 and tot_time < 3600:
-            tot_time = time.strftime("%M:%S", time.gmtime(tot_time))
-        elif tot_time >= 3600:
-            tot_time = time.strftime("%H:%M:%S", time.gmtime(tot_time))
-        return tot_time
+        return format_time(end - start)
 
     def __str__(self):
         """
@@ -115,22 +356,4 @@ class Task():
         Returns:
             str: A formatted string representing the task's status and run time.
         """
-        self.current_time = time.time()
-
-        if self.status == "Off":
-            status_str = f"{Fore.RED}{self.status}{Fore.RESET}"
-        elif self.status == "Paused":
-            status_str = f"{Fore.MAGENTA}{self.status}{Fore.RESET}"
-        elif self.status == "Active":
-            status_str = f"{Fore.GREEN}{self.status}{Fore.RESET}"
-
-        if self.end_time is not None:
-            timer_time = self.calc_time(self.start_time, self.end_time)
-            return f"{Fore.BLUE}{self.task_name}{Fore.RESET}{" " * (15 - len(self.task_name))}| {status_str}{" " * (12 - len(self.status))} | {timer_time}"
-        
-        elif self.start_time is not None:
-            timer_time = self.calc_time(self.start_time, self.current_time)
-            return f"{Fore.BLUE}{self.task_name}{Fore.RESET}{" " * (15 - len(self.task_name))}| {status_str}{" " * (12 - len(self.status))} | {timer_time}"
-          
-        else:
-            return f"{Fore.BLUE}{self.task_name}{Fore.RESET}{" " * (15 - len(self.task_name))}| {status_str}{" " * (12 - len(self.status))} | {0}"
+        return row_prefix(self.task_name, self.status) + format_time(self.elapsed())
@@ -0,0 +1,249 @@
+"""
+trace.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Phase timings for a single task-timer call. When tracing is turned on
+(`task-timer --profile ...` or TASK_TIMER_TRACE=1) the time spent importing,
+reading the store, parsing tasks, running the command, writing the store
+and rendering output is recorded, summarised on stderr, and optionally
+saved as a Chrome trace (chrome://tracing, Perfetto) or as cProfile stats.
+
+When tracing is off every span is a shared no-op context manager.
+"""
+import functools
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+# Taken when the task_timer package starts importing, the start of the import phase
+STARTED = time.perf_counter()
+
+# Set by mark_imported() once the command line modules are imported
+IMPORTED = None
+
+PHASES = ("import", "store.read", "parse", "command", "store.write", "render")
+
+_NO_SPAN = nullcontext()
+
+# inspect.CO_GENERATOR, without importing inspect on every start up
+CO_GENERATOR = 0x20
+
+class Tracer():
+    """
+    Records nested spans of time.
+
+    Each span's own time excludes the spans nested inside it, so the phase
+    totals add up to the traced time without counting anything twice.
+
+    Attributes:
+        enabled (bool): Whether spans are being recorded
+        spans (list): (phase, name, start, end, own seconds) of every finished span
+        profiler (cProfile.Profile): The profiler running alongside, if any
+        stats_path (str): Where the profiler's stats are saved
+    """
+
+    def __init__(self):
+        """
+        Initializes a tracer that isn't recording yet.
+        """
+        self.enabled = False
+        self.spans = []
+        self.profiler = None
+        self.stats_path = None
+        self._stack = []
+
+    def add(self, phase, start, end, name=None, own=None):
+        """
+        Records a span that was timed without span(), such as the imports.
+
+        Parameters:
+            own (float, optional): The span's own seconds, when they are less than end - start
+        """
+        self.spans.append((phase, name or phase, start, end, end - start if own is None else own))
+
+    def iterate(self, phase, name, iterator):
+        """
+        Yields the items of iterator, timing the work of producing them as
+        one span of phase.
+
+        Only the time spent inside next() is the span's own time, the time
+        the caller spends on each item between them is left out of it.
+        """
+        start = time.perf_counter()
+        own = 0.0
+        try:
+            while True:
+                nested = [0.0]
+                self._stack.append(nested)
+                step = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed = time.perf_counter() - step
+                    self._stack.pop()
+                    if self._stack:
+                        self._stack[-1][0] += elapsed
+                    own += elapsed - nested[0]
+                yield item
+        finally:
+            self.add(phase, start, time.perf_counter(), name, own)
+
+    @contextmanager
+    def span(self, phase, name=None):
+        """
+        Times the block as part of the given phase.
+
+        Parameters:
+            phase (str): One of PHASES
+            name (str, optional): What the span shows as in a Chrome trace
+        """
+        nested = [0.0]
+        self._stack.append(nested)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += end - start
+            self.spans.append((phase, name or phase, start, end, end - start - nested[0]))
+
+    def totals(self):
+        """
+        Returns the own time and number of spans of every phase that was recorded.
+
+        Returns:
+            dict: {phase: (seconds, calls)} in PHASES order.
+        """
+        totals = {}
+        for phase, _, _, _, own in self.spans:
+            seconds, calls = totals.get(phase, (0.0, 0))
+            totals[phase] = (seconds + own, calls + 1)
+        return {phase: totals[phase] for phase in sorted(totals, key=_phase_order)}
+
+    def summary(self):
+        """
+        Returns the phase totals as lines of a table.
+        """
+        lines = [f"{'Phase':<12} {'Time (ms)':>10} {'Calls':>6}"]
+        total = 0.0
+        for phase, (seconds, calls) in self.totals().items():
+            lines.append(f"{phase:<12} {seconds * 1000:>10.2f} {calls:>6}")
+            total += seconds
+        lines.append(f"{'total':<12} {total * 1000:>10.2f}")
+        return lines
+
+    def write_chrome_trace(self, path):
+        """
+        Saves every span in the Chrome trace event format.
+
+        Parameters:
+            path (str): The JSON file to write
+        """
+        import json
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": phase,
+                "ph": "X",
+                "ts": (start - STARTED) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": 0,
+            }
+            for phase, name, start, end, _ in sorted(self.spans, key=lambda span: span[2])
+        ]
+        with open(path, mode="w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+def _phase_order(phase):
+    return PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+tracer = Tracer()
+
+def mark_imported():
+    """
+    Marks the end of the import phase.
+    """
+    global IMPORTED
+    IMPORTED = time.perf_counter()
+
+def start(stats_path=None):
+    """
+    Starts recording spans, with the import phase as the first one.
+
+    Parameters:
+        stats_path (str, optional): Also run cProfile and save its stats here when stopped
+    """
+    tracer.enabled = True
+    tracer.spans = []
+    if IMPORTED is not None:
+        tracer.add("import", STARTED, IMPORTED)
+
+    tracer.profiler = None
+    tracer.stats_path = stats_path
+    if stats_path:
+        import cProfile
+        tracer.profiler = cProfile.Profile()
+        tracer.profiler.enable()
+
+def stop(trace_path=None):
+    """
+    Stops recording and saves the cProfile stats and Chrome trace if asked for.
+
+    Parameters:
+        trace_path (str, optional): Where to save the spans as a Chrome trace
+
+    Returns:
+        list: The summary table lines, see Tracer.summary().
+    """
+    tracer.enabled = False
+    if tracer.profiler is not None:
+        tracer.profiler.disable()
+        tracer.profiler.dump_stats(tracer.stats_path)
+        tracer.profiler = None
+    if trace_path:
+        tracer.write_chrome_trace(trace_path)
+    return tracer.summary()
+
+def span(phase, name=None):
+    """
+    Times the block as part of phase when tracing is on, see Tracer.span().
+    """
+    if not tracer.enabled:
+        return _NO_SPAN
+    return tracer.span(phase, name)
+
+def traced(phase):
+    """
+    Decorates a function so every call is timed as part of phase.
+
+    Calls of a generator function are timed while the generator runs, see
+    Tracer.iterate().
+
+    Parameters:
+        phase (str): One of PHASES
+    """
+    def decorator(function):
+        if function.__code__.co_flags & CO_GENERATOR:
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return function(*args, **kwargs)
+                return tracer.iterate(phase, function.__qualname__, function(*args, **kwargs))
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.span(phase, function.__qualname__):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,282 @@
+"""
+transfer.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Importing task files into a store and exporting a store to other formats.
+Rows are read and written one at a time (imports are written to the store
+in batches), so memory use is the same whether the store holds a hundred
+tasks or a hundred million.
+"""
+import csv
+import fnmatch
+import json
+import os
+from task_timer.task import Task
+from task_timer.storage.csv_store import HEADER
+
+# What to do when an imported task has the same name as one already stored
+MERGE_POLICIES = ("skip", "overwrite", "sum")
+
+BATCH_SIZE = 1000
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Field names used by the JSON Lines and Parquet files, in Task.to_row order
+FIELDS = ("task_name", "status", "time", "start_time", "end_time", "pre_pause_time", "elapsed_ns", "monotonic_start_ns", "clock")
+
+def read_rows(path, fmt=None):
+    """
+    Yields the rows of a task file one at a time, without the header.
+
+    Reads every format export_tasks() writes, so anything saved with
+    `task-timer save` can be loaded back.
+
+    Parameters:
+        path (str): A file written by `task-timer save` or the CSV store
+        fmt (str, optional): One of EXPORT_FORMATS, guessed from the extension if None
+
+    Yields:
+        list: One row per task, see Task.from_row for the columns.
+    """
+    fmt = export_format(path, fmt)
+    if fmt == "csv":
+        return _read_csv(path)
+    if fmt == "jsonl":
+        return _read_jsonl(path)
+    if fmt == "parquet":
+        return _read_parquet(path)
+    raise ValueError(f"unknown format '{fmt}', expected one of {', '.join(EXPORT_FORMATS)}")
+
+def _read_csv(path):
+    with open(path, mode="r", newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for row in reader:
+            if row:
+                yield row
+
+def _read_jsonl(path):
+    with open(path, mode="r") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield [record.get(field) for field in FIELDS]
+
+def _read_parquet(path):
+    pyarrow = _import_pyarrow()
+    # Read a row group at a time, like the batches they were written in
+    for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=BATCH_SIZE):
+        for record in batch.to_pylist():
+            yield [record.get(field) for field in FIELDS]
+
+def import_tasks(store, rows, policy="skip", batch_size=BATCH_SIZE):
+    """
+    Adds the tasks in rows to the store, merging tasks that already exist.
+
+    Stored names are kept in a set so each row is checked without reading
+    the store. New tasks are collected in a batch of at most batch_size
+    tasks and written with Store.update() whenever the batch is full, which
+    the CSV store appends to its file. Names that repeat inside the file
+    are merged with the same policy.
+
+    Changes to stored tasks are batched the same way, so memory use stays
+    the same however many imported tasks already exist.
+
+    Policies:
+        skip: Keep the stored task and ignore the imported one
+        overwrite: Replace the stored task with the imported one
+        sum: Keep the stored task and add the imported task's time to it
+
+    Parameters:
+        store (Store): The store to import into
+        rows (iterable): Task rows, see Task.from_row
+        policy (str): One of MERGE_POLICIES
+        batch_size (int): Tasks written per update
+
+    Returns:
+        dict: How many rows were added, skipped, overwritten and summed.
+    """
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"unknown merge policy '{policy}', expected one of {', '.join(MERGE_POLICIES)}")
+    if batch_size < 1:
+        raise ValueError("batch size must be at least 1")
+
+    counts = {"added": 0, "skipped": 0, "overwritten": 0, "summed": 0}
+
+    with store.transaction():
+        stored = set(store.names())
+        # Imported tasks waiting to be written: new ones, ones replacing or
+        # added onto a stored task, and which of those are added onto it
+        batch = {}
+        updates = {}
+        to_sum = set()
+
+        for row in rows:
+            task = Task.from_row(row)
+            name = task.task_name
+            pending = batch.get(name) or updates.get(name)
+
+            if pending is None and name not in stored:
+                task.record("create")
+                batch[name] = task
+                stored.add(name)
+                counts["added"] += 1
+            elif policy == "skip":
+                counts["skipped"] += 1
+                continue
+            elif policy == "overwrite":
+                task.record("create" if name in batch else "update")
+                (batch if name in batch else updates)[name] = task
+                to_sum.discard(name)
+                counts["overwritten"] += 1
+            elif pending is not None:
+                _add_time(pending, task)
+                counts["summed"] += 1
+            else:
+                task.record("update")
+                updates[name] = task
+                to_sum.add(name)
+                counts["summed"] += 1
+
+            if len(batch) >= batch_size:
+                _commit(store, batch)
+            if len(updates) >= batch_size:
+                _commit(store, updates, to_sum)
+
+        if batch:
+            _commit(store, batch)
+        if updates:
+            _commit(store, updates, to_sum)
+
+    return counts
+
+def _add_time(task, imported):
+    seconds = imported.elapsed()
+    task.elapsed_ns += imported.elapsed_total_ns()
+    task.record("adjust", seconds)
+
+def _commit(store, batch, to_sum=()):
+    if to_sum:
+        existing = store.get_many(to_sum)
+        for name in to_sum:
+            if name in existing:
+                _add_time(existing[name], batch[name])
+                batch[name] = existing[name]
+
+    store.update(list(batch.values()))
+    batch.clear()
+    if to_sum:
+        to_sum.clear()
+
+def export_format(path, fmt=None):
+    """
+    Returns the export format to use for path.
+
+    Parameters:
+        path (str): The file being written, "-" for stdout
+        fmt (str, optional): The format asked for, guessed from the extension if None
+
+    Returns:
+        str: One of EXPORT_FORMATS.
+    """
+    if fmt is not None:
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".parquet":
+        return "parquet"
+    return "csv"
+
+def select_tasks(tasks, statuses=(), pattern=None):
+    """
+    Yields the tasks with one of the given statuses whose name matches pattern.
+
+    Parameters:
+        tasks (iterable): The tasks to filter
+        statuses (iterable): Statuses to keep, every status if empty
+        pattern (str, optional): A shell style glob such as "client-*"
+    """
+    statuses = {status.capitalize() for status in statuses}
+    for task in tasks:
+        if statuses and task.status not in statuses:
+            continue
+        if pattern is not None and not fnmatch.fnmatchcase(task.task_name, pattern):
+            continue
+        yield task
+
+def export_tasks(tasks, file, fmt="csv"):
+    """
+    Writes tasks to an open file one at a time.
+
+    Parameters:
+        tasks (iterable): The tasks to write
+        file (file): A text file for csv and jsonl, a binary file for parquet
+        fmt (str): One of EXPORT_FORMATS
+
+    Returns:
+        int: The number of tasks written.
+    """
+    if fmt == "csv":
+        return _write_csv(tasks, file)
+    if fmt == "jsonl":
+        return _write_jsonl(tasks, file)
+    if fmt == "parquet":
+        return _write_parquet(tasks, file)
+    raise ValueError(f"unknown export format '{fmt}', expected one of {', '.join(EXPORT_FORMATS)}")
+
+def _write_csv(tasks, file):
+    writer = csv.writer(file)
+    writer.writerow(HEADER)
+    count = 0
+    for task in tasks:
+        writer.writerow(task.to_row())
+        count += 1
+    return count
+
+def _write_jsonl(tasks, file):
+    count = 0
+    for task in tasks:
+        file.write(json.dumps(dict(zip(FIELDS, task.to_row()))))
+        file.write("\n")
+        count += 1
+    return count
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("the parquet format needs pyarrow, install it with 'pip install pyarrow'")
+    return pyarrow
+
+def _write_parquet(tasks, file):
+    pyarrow = _import_pyarrow()
+
+    schema = pyarrow.schema([
+        ("task_name", pyarrow.string()),
+        ("status", pyarrow.string()),
+        ("time", pyarrow.float64()),
+        ("start_time", pyarrow.float64()),
+        ("end_time", pyarrow.float64()),
+        ("pre_pause_time", pyarrow.float64()),
+        ("elapsed_ns", pyarrow.int64()),
+        ("monotonic_start_ns", pyarrow.int64()),
+        ("clock", pyarrow.string()),
+    ])
+
+    count = 0
+    with pyarrow.parquet.ParquetWriter(file, schema) as writer:
+        # Each batch of rows becomes one row group
+        columns = [[] for _ in FIELDS]
+        for task in tasks:
+            for column, value in zip(columns, task.to_row()):
+                column.append(value)
+            count += 1
+            if len(columns[0]) >= BATCH_SIZE:
+                writer.write_batch(pyarrow.record_batch(columns, schema=schema))
+                columns = [[] for _ in FIELDS]
+        if columns[0]:
+            writer.write_batch(pyarrow.record_batch(columns, schema=schema))
+    return count
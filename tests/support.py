@@ -0,0 +1,131 @@
+"""
+support.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Helpers shared by the tests. Every test gets a store of its own in a
+temporary directory, so running the tests never touches a real tasks.csv.
+
+Run the tests from the repository root with:
+    python -m unittest discover -s tests -t .
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The repository root, put on PYTHONPATH for the task-timer processes tests start
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Settings read from the environment, cleared so the user's own can't leak into a test
+ENVIRONMENT = (
+    "TASK_TIMER_FILE",
+    "TASK_TIMER_BACKEND",
+    "TASK_TIMER_NAMESPACE",
+    "TASK_TIMER_SOCKET",
+    "TASK_TIMER_TRACE",
+    "TASK_TIMER_TRACE_FILE",
+    "TASK_TIMER_PROFILE_STATS",
+    "XDG_DATA_HOME",
+)
+
+def reset():
+    """
+    Forgets everything task-timer looked up once per process, such as the
+    store location and the cached task names.
+    """
+    from task_timer import cli, location, params
+
+    cli.TASK_FILE = None
+    cli.NAMESPACE = None
+    cli._store = None
+    location.clear_cache()
+    params.invalidate_names()
+
+class StoreTestCase(unittest.TestCase):
+    """
+    A test run against an empty store of its own.
+
+    Attributes:
+        backend (str): The storage backend the store uses, set by subclasses
+        directory (str): A temporary directory removed after the test
+        path (str): The store file, which TASK_TIMER_FILE points to
+    """
+
+    backend = "csv"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="task-timer-test-")
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = os.path.join(self.directory, "tasks.csv")
+
+        saved = {name: os.environ.get(name) for name in ENVIRONMENT}
+        self.addCleanup(self._restore, saved)
+        for name in ENVIRONMENT:
+            os.environ.pop(name, None)
+        os.environ["TASK_TIMER_FILE"] = self.path
+        os.environ["TASK_TIMER_BACKEND"] = self.backend
+        os.environ["XDG_DATA_HOME"] = self.directory
+
+        reset()
+        self.addCleanup(reset)
+
+    @staticmethod
+    def _restore(saved):
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    def store(self):
+        """
+        Returns a new Store object for the test's store.
+        """
+        from task_timer.storage import get_store
+        return get_store(self.path)
+
+    def manager(self):
+        """
+        Returns a new TaskManager over the test's store.
+        """
+        from task_timer.manager import TaskManager
+        return TaskManager(self.store())
+
+    def create(self, *names):
+        """
+        Adds tasks to the store.
+        """
+        manager = self.manager()
+        for name in names:
+            manager.create(name)
+        manager.flush()
+
+    def invoke(self, *args, input=None):
+        """
+        Runs a task-timer command in this process.
+
+        Returns:
+            click.testing.Result: The command's output and exit code.
+        """
+        from click.testing import CliRunner
+        from task_timer import cli
+
+        reset()
+        return CliRunner().invoke(cli.main, list(args), input=input)
+
+    def run_cli(self, *args, check=True, **kwargs):
+        """
+        Runs a task-timer command in a new process, as a user would.
+
+        Returns:
+            subprocess.CompletedProcess: The command's output and exit code.
+        """
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT, env.get("PYTHONPATH"))))
+        return subprocess.run(
+            [sys.executable, "-m", "task_timer", *args],
+            cwd=self.directory, env=env, capture_output=True, text=True, check=check, **kwargs,
+        )
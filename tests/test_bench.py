@@ -0,0 +1,46 @@
+"""
+test_bench.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the benchmark suite, run from outside the source checkout the
+way the benchmarks' own processes are.
+"""
+import os
+from task_timer import bench
+from tests.support import StoreTestCase
+
+class BenchTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        self.addCleanup(os.chdir, cwd)
+        # Only the benchmarks may put the package on the path of their processes
+        pythonpath = os.environ.pop("PYTHONPATH", None)
+        if pythonpath is not None:
+            self.addCleanup(os.environ.__setitem__, "PYTHONPATH", pythonpath)
+
+    def test_import_budgets(self):
+        for module in bench.IMPORT_BUDGETS:
+            result = bench.bench_import(module, repeat=3)
+            self.assertEqual(result["unexpected_modules"], [], module)
+            self.assertTrue(result["within_budget"], result)
+
+    def test_status_budget(self):
+        result = bench.bench_status(repeat=3)
+        self.assertTrue(result["answered_from_cache"])
+        self.assertEqual(result["unexpected_modules"], [])
+        self.assertTrue(result["within_budget"], result)
+
+    def test_store(self):
+        results = bench.bench_store("csv", 10, repeat=1)
+        names = {result["benchmark"] for result in results}
+        self.assertTrue({"load_tasks", "update_task", "manager_toggle"} <= names)
+        self.assertTrue({f"command_{name}" for name in bench.COMMANDS} <= names)
+
+    def test_failures_show_the_error(self):
+        with self.assertRaises(RuntimeError) as context:
+            bench.run_python(["-c", "import sys; sys.exit('broken on purpose')"])
+        self.assertIn("broken on purpose", str(context.exception))
@@ -0,0 +1,78 @@
+"""
+test_bulk.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for changing many tasks in one command and one store transaction.
+"""
+import os
+from unittest import mock
+from task_timer.storage.csv_store import CSVStore
+from tests.support import StoreTestCase
+
+class BulkTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("client-a", "client-b", "home", "Report")
+
+    def statuses(self):
+        return {task.task_name: task.status for task in self.store().load()}
+
+    def test_repeated_names(self):
+        result = self.invoke("toggle", "--name", "client-a", "--name", "home")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.statuses(), {"client-a": "Active", "client-b": "Off", "home": "Active", "Report": "Off"})
+
+    def test_glob(self):
+        result = self.invoke("toggle", "--name", "client-*")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.statuses(), {"client-a": "Active", "client-b": "Active", "home": "Off", "Report": "Off"})
+
+    def test_names_file(self):
+        path = os.path.join(self.directory, "names.txt")
+        with open(path, "w") as file:
+            file.write("# tasks\nhome\nreport\nmissing\n\n")
+        result = self.invoke("toggle", "--names-file", path)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("'missing'", result.output)
+        self.assertEqual(self.statuses(), {"client-a": "Off", "client-b": "Off", "home": "Active", "Report": "Active"})
+
+    def test_names_from_stdin(self):
+        # CliRunner's stdin raises EOFError at its end, so this runs in a new process
+        self.run_cli("delete", "--names-file", "-", input="home\nclient-b\n")
+        self.assertEqual(list(self.statuses()), ["client-a", "Report"])
+
+    def test_unknown_name_suggests_close_matches(self):
+        self.create(*(f"unrelated{number}" for number in range(50)))
+        result = self.invoke("toggle", "--name", "clent-a")
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("Did you mean 'client-a'", result.output)
+        self.assertNotIn("unrelated", result.output)
+
+    def test_unknown_name_without_close_matches(self):
+        result = self.invoke("toggle", "--name", "zzzz")
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("'zzzz' is not a task.", result.output)
+        self.assertNotIn("home", result.output)
+
+class SQLiteBulkTest(BulkTest):
+    backend = "sqlite"
+
+class SingleReadTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("client-a", "client-b", "home")
+
+    def test_one_write_per_command(self):
+        with mock.patch.object(CSVStore, "write", autospec=True, side_effect=CSVStore.write) as write:
+            self.invoke("reset", "--name", "client-*", "--name", "home")
+        self.assertEqual(write.call_count, 1)
+
+    def test_store_read_once(self):
+        with mock.patch.object(CSVStore, "load", autospec=True, side_effect=CSVStore.load) as load:
+            result = self.invoke("toggle", "--name", "client-a", "--name", "home", "--name", "client-*")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(self.store().get("client-b").status, "Active")
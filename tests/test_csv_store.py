@@ -0,0 +1,82 @@
+"""
+test_csv_store.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the CSV store, including files written by older versions.
+"""
+import os
+from task_timer.storage.csv_store import CSVStore
+from task_timer.task import NS_PER_SECOND
+from tests.support import StoreTestCase
+
+# A store written before durations were kept in nanoseconds
+OLD_CSV = (
+    "Task Name,Status,Time,Start_time,End_time,Pre_pause_time\n"
+    "cs2,Off,0.0,,,0.0\n"
+    "paused,Paused,90.0,1000.0,1090.0,0.0\n"
+    "active,Active,0.0,1000.0,,0.0\n"
+)
+
+class CSVStoreTest(StoreTestCase):
+
+    def write(self, text):
+        with open(self.path, mode="w", newline="") as file:
+            file.write(text)
+
+    def test_load_never_writes(self):
+        self.write(OLD_CSV)
+        before = os.stat(self.path)
+        tasks = CSVStore(self.path).load()
+        after = os.stat(self.path)
+
+        self.assertEqual(len(tasks), 3)
+        self.assertEqual((before.st_mtime_ns, before.st_ino), (after.st_mtime_ns, after.st_ino))
+        with open(self.path, newline="") as file:
+            self.assertEqual(file.read(), OLD_CSV)
+
+    def test_load_missing_file(self):
+        self.assertEqual(CSVStore(self.path).load(), [])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_old_rows(self):
+        self.write(OLD_CSV)
+        tasks = {task.task_name: task for task in CSVStore(self.path).load()}
+
+        self.assertEqual(tasks["cs2"].status, "Off")
+        self.assertEqual(tasks["paused"].elapsed_ns, 90 * NS_PER_SECOND)
+        self.assertIsNone(tasks["paused"].start_time)
+        self.assertEqual(tasks["active"].start_time, 1000.0)
+        self.assertIsNone(tasks["active"].mono_start_ns)
+        self.assertTrue(all(not task.dirty for task in tasks.values()))
+
+    def test_clean_save_writes_nothing(self):
+        self.write(OLD_CSV)
+        store = CSVStore(self.path)
+        store.save(store.load())
+        with open(self.path, newline="") as file:
+            self.assertEqual(file.read(), OLD_CSV)
+
+    def test_round_trip(self):
+        self.write(OLD_CSV)
+        store = CSVStore(self.path)
+        tasks = store.load()
+        tasks[1].adjust(10)
+        store.save(tasks)
+
+        reloaded = {task.task_name: task for task in store.load()}
+        self.assertEqual(reloaded["paused"].elapsed_ns, 100 * NS_PER_SECOND)
+        self.assertEqual(reloaded["cs2"].status, "Off")
+        with open(self.path, newline="") as file:
+            self.assertTrue(file.readline().startswith("Task Name,Status,Time,Start_time,End_time,Pre_pause_time,Elapsed_ns"))
+
+    def test_torn_last_row_is_skipped(self):
+        self.write(OLD_CSV + "half,Pau")
+        self.assertEqual([task.task_name for task in CSVStore(self.path).load()], ["cs2", "paused", "active"])
+
+    def test_list_leaves_the_file_alone(self):
+        self.write(OLD_CSV)
+        result = self.invoke("list")
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(self.path, newline="") as file:
+            self.assertEqual(file.read(), OLD_CSV)
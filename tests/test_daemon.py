@@ -0,0 +1,130 @@
+"""
+test_daemon.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the task-timer server, its in-memory store and its client.
+"""
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from task_timer import daemon
+from task_timer.manager import TaskManager
+from tests.support import ROOT, StoreTestCase
+
+class MemoryStoreTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("a", "b", "c")
+        self.memory = daemon.MemoryStore(self.store())
+
+    def test_update_never_reads_the_backend(self):
+        def load():
+            raise AssertionError("the backend was read again")
+        self.memory.backend.load = load
+
+        manager = TaskManager(self.memory)
+        manager.toggle("a")
+        manager.edit("b", new_name="z")
+        manager.delete("c")
+        manager.create("d")
+        manager.flush()
+
+        del self.memory.backend.load
+        tasks = {task.task_name: task.status for task in self.store().load()}
+        self.assertEqual(tasks, {"a": "Active", "z": "Off", "d": "Off"})
+        self.assertEqual(self.memory.names(), ["a", "z", "d"])
+
+    def test_tasks_handed_out_are_copies(self):
+        task = self.memory.get("a")
+        task.start()
+        self.assertEqual(self.memory.get("a").status, "Off")
+
+    def test_changes_made_outside_the_server(self):
+        manager = self.manager()
+        manager.toggle("b")
+        manager.flush()
+
+        self.assertEqual(self.memory.get("b").status, "Active")
+        manager = TaskManager(self.memory)
+        manager.toggle("a")
+        manager.flush()
+        self.assertEqual({task.task_name: task.status for task in self.store().load()}, {"a": "Active", "b": "Active", "c": "Off"})
+
+class ForwardTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.socket_path = os.path.join(self.directory, "test.sock")
+
+    def test_no_server(self):
+        self.assertIsNone(daemon.forward(["list"], self.socket_path))
+
+    def test_stale_socket(self):
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.close()
+        self.assertIsNone(daemon.forward(["list"], self.socket_path))
+
+    def test_server_closes_without_reply(self):
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen()
+
+        def hang_up():
+            client, _ = server.accept()
+            client.close()
+        thread = threading.Thread(target=hang_up)
+        thread.start()
+        try:
+            self.assertIsNone(daemon.forward(["list"], self.socket_path))
+        finally:
+            thread.join()
+            server.close()
+
+    def test_local_commands(self):
+        for command in daemon.LOCAL_COMMANDS:
+            self.assertIsNone(daemon.forward([command], self.socket_path))
+
+class ServerTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("a")
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        self.server = subprocess.Popen(
+            [sys.executable, "-m", "task_timer", "serve"],
+            cwd=self.directory, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(self.server.wait)
+        self.addCleanup(self.server.kill)
+
+        deadline = time.monotonic() + 30
+        while not os.path.exists(self.path + ".sock"):
+            if time.monotonic() > deadline or self.server.poll() is not None:
+                self.fail("the server didn't start")
+            time.sleep(0.05)
+
+    def test_commands_are_forwarded(self):
+        result = self.run_cli("toggle", "--name", "a")
+        self.assertIn("Started Successfully", result.stdout)
+        self.assertEqual(self.store().get("a").status, "Active")
+
+        reply = daemon.forward(["list"], self.path + ".sock", self.path)
+        self.assertEqual(reply["exit_code"], 0)
+        self.assertIn("a", reply["output"])
+
+    def test_other_store_is_refused(self):
+        reply = daemon.forward(["list"], self.path + ".sock", os.path.join(self.directory, "other.csv"))
+        self.assertEqual(reply["exit_code"], 1)
+        self.assertIn("can't run commands", reply["output"])
+
+    def test_server_sees_local_changes(self):
+        # Traced commands always run in their own process
+        self.run_cli("--profile", "toggle", "--name", "a")
+        result = self.run_cli("list")
+        self.assertIn("Active", result.stdout)
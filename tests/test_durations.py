@@ -0,0 +1,52 @@
+"""
+test_durations.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for formatting task times and rows.
+"""
+import time
+import unittest
+from task_timer import color, durations
+from task_timer.durations import format_time
+from task_timer.task import Task, row_prefix
+
+def strftime_format(seconds):
+    # How task times were formatted before the cached formatter
+    if seconds <= 60:
+        return f"{seconds:.0f}"
+    if seconds < 3600:
+        return time.strftime("%M:%S", time.gmtime(seconds))
+    return time.strftime("%H:%M:%S", time.gmtime(seconds))
+
+class FormatTimeTest(unittest.TestCase):
+
+    def test_same_as_strftime(self):
+        for seconds in (0, 0.4, 59.6, 60, 60.5, 61, 599.9, 3599, 3600, 3601.7, 86399):
+            self.assertEqual(format_time(seconds), strftime_format(seconds), seconds)
+
+    def test_more_than_a_day(self):
+        self.assertEqual(format_time(90000), "25:00:00")
+
+    def test_cache_is_bounded(self):
+        for seconds in range(61, 61 + durations.CACHE_SIZE + 10):
+            format_time(seconds)
+        self.assertLessEqual(len(durations._formatted), durations.CACHE_SIZE)
+        self.assertEqual(format_time(3601), "01:00:01")
+
+class RowTest(unittest.TestCase):
+
+    def tearDown(self):
+        color.use(False)
+
+    def test_row(self):
+        task = Task("report")
+        self.assertEqual(str(task), "report         | Off          | 0")
+
+    def test_colors_change_rows(self):
+        color.use(False)
+        plain = row_prefix("report", "Active")
+        color.use(True)
+        self.assertNotEqual(row_prefix("report", "Active"), plain)
+        color.use(False)
+        self.assertEqual(row_prefix("report", "Active"), plain)
@@ -0,0 +1,135 @@
+"""
+test_engine.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the timer engine following changes made to the store by other
+commands, and for the rename log in the status cache it reads them from.
+"""
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from task_timer import status
+from task_timer.engine import TimerEngine
+from tests.support import ROOT, StoreTestCase
+
+class FollowTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("x")
+        self.engine = TimerEngine()
+        self.fired = []
+        self.alarm = self.engine.add_alarm(self.store().get("x"), 0.1, callback=lambda task, alarm: self.fired.append(task.task_name))
+
+    def follow(self, change, added=None):
+        """
+        Runs the engine while change() changes the store, as another command would.
+        """
+        store = self.store()
+
+        async def main():
+            running = asyncio.gather(self.engine.run(), self.engine.sync(store, interval=0.01, added=added))
+            await asyncio.sleep(0.05)
+            change()
+            await asyncio.sleep(0.4)
+            self.engine.stop()
+            await running
+
+        asyncio.run(main())
+
+    def test_deleted_task_loses_its_alarms(self):
+        def change():
+            manager = self.manager()
+            manager.delete("x")
+            manager.create("unrelated")
+            manager.toggle("unrelated")
+            manager.flush()
+
+        added = []
+        self.follow(change, added=added.append)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(self.engine.alarms(), [])
+        self.assertEqual([task.task_name for task in added], ["unrelated"])
+
+    def test_renamed_task_keeps_its_alarms(self):
+        def change():
+            manager = self.manager()
+            manager.edit("x", new_name="y")
+            manager.toggle("y")
+            manager.flush()
+
+        added = []
+        self.follow(change, added=added.append)
+        self.assertEqual(self.engine.alarms("y"), [self.alarm])
+        self.assertEqual(self.alarm.task.task_name, "y")
+        self.assertEqual(self.fired, ["y"])
+        self.assertEqual(added, [])
+
+    def test_name_taken_after_a_rename(self):
+        def change():
+            manager = self.manager()
+            manager.edit("x", new_name="y")
+            manager.flush()
+            manager.create("x")
+            manager.toggle("x")
+            manager.flush()
+
+        added = []
+        self.follow(change, added=added.append)
+        self.assertEqual(self.engine.alarms("y"), [self.alarm])
+        self.assertEqual(self.fired, [])
+        self.assertEqual([task.task_name for task in added], ["x"])
+
+class RenameLogTest(StoreTestCase):
+
+    def test_renames_are_logged(self):
+        self.create("a", "b")
+        manager = self.manager()
+        manager.edit("a", new_name="c")
+        manager.edit("c", new_name="d")
+        manager.create("new")
+        manager.edit("new", new_name="newer")
+        manager.flush()
+        self.assertEqual(status.renames(self.path), [[1, "a", "d"]])
+
+        manager = self.manager()
+        manager.edit("b", new_name="e\tf")
+        manager.flush()
+        self.assertEqual(status.renames(self.path, after=1), [[2, "b", "e\tf"]])
+
+    def test_rebuild_keeps_the_log(self):
+        self.create("a")
+        manager = self.manager()
+        manager.edit("a", new_name="b")
+        manager.flush()
+        status.rebuild(self.store())
+        self.assertEqual(status.renames(self.path), [[1, "a", "b"]])
+
+    def test_log_is_bounded(self):
+        self.create("task0")
+        for number in range(status.RENAME_LOG + 5):
+            manager = self.manager()
+            manager.edit(f"task{number}", new_name=f"task{number + 1}")
+            manager.flush()
+        renames = status.renames(self.path)
+        self.assertEqual(len(renames), status.RENAME_LOG)
+        self.assertEqual(renames[-1], [status.RENAME_LOG + 5, f"task{status.RENAME_LOG + 4}", f"task{status.RENAME_LOG + 5}"])
+
+class WatchTest(StoreTestCase):
+
+    def test_counts_tasks(self):
+        self.create("a", "b", "c")
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        process = subprocess.Popen(
+            [sys.executable, "-m", "task_timer", "watch", "--after", "1h"],
+            cwd=self.directory, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        self.addCleanup(process.stdout.close)
+        line = process.stdout.readline()
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+        self.assertIn("Watching", line)
+        self.assertIn(" 3 ", line)
@@ -0,0 +1,67 @@
+"""
+test_imports.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests that task-timer only imports what a call needs. Each test imports in a
+new process, since this one has already imported everything.
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+from tests.support import ROOT
+
+def modules_after(code):
+    """
+    Runs code in a new Python process.
+
+    Parameters:
+        code (str): The code to run
+
+    Returns:
+        set: The names of the modules imported once the code has run
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT, env.get("PYTHONPATH"))))
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+class ImportTest(unittest.TestCase):
+
+    def test_package(self):
+        modules = modules_after("import task_timer")
+        self.assertNotIn("click", modules)
+        self.assertNotIn("task_timer.cli", modules)
+        self.assertNotIn("task_timer.manager", modules)
+
+    def test_manager_without_click(self):
+        modules = modules_after("from task_timer import TaskManager")
+        self.assertIn("task_timer.manager", modules)
+        self.assertNotIn("click", modules)
+
+    def test_cli(self):
+        modules = modules_after("import task_timer.cli")
+        self.assertIn("click", modules)
+        self.assertFalse({name for name in modules if name.startswith("task_timer.commands.")})
+        self.assertFalse({name for name in modules if name.startswith("task_timer.storage")})
+        self.assertNotIn("colorama", modules)
+
+    def test_command_on_demand(self):
+        modules = modules_after(
+            "import click\n"
+            "from task_timer import cli\n"
+            "cli.main.get_command(click.Context(cli.main), 'where')"
+        )
+        commands = {name for name in modules if name.startswith("task_timer.commands.")}
+        self.assertEqual(commands, {"task_timer.commands.where"})
+
+    def test_unknown_command(self):
+        import click
+        from task_timer import cli
+        self.assertIsNone(cli.main.get_command(click.Context(cli.main), "nonsense"))
+        self.assertEqual(cli.main.list_commands(click.Context(cli.main)), sorted(cli.COMMANDS))
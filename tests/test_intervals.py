@@ -0,0 +1,62 @@
+"""
+test_intervals.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the interval history of tasks.
+"""
+import os
+from task_timer.intervals import IntervalIndex, activity, clip
+from tests.support import StoreTestCase
+
+class IntervalIndexTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.index = IntervalIndex(os.path.join(self.directory, "intervals"))
+
+    def test_range_query(self):
+        self.index.add([("a", 0, 10), ("b", 20, 30), ("a", 40, 50), ("b", 60, 70)])
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(list(self.index.query(25, 45)), [("b", 20, 30), ("a", 40, 50)])
+        self.assertEqual(list(self.index.query(25, 45, names=["a"])), [("a", 40, 50)])
+        self.assertEqual(list(self.index.query()), [("a", 0, 10), ("b", 20, 30), ("a", 40, 50), ("b", 60, 70)])
+
+    def test_long_interval_overlapping_the_range(self):
+        self.index.add([("long", 0, 1000), ("short", 900, 910)])
+        self.assertEqual([name for name, _, _ in self.index.query(500, 600)], ["long"])
+
+    def test_out_of_order_run_is_inserted(self):
+        self.index.add([("a", 40, 50)])
+        self.index.add([("b", 10, 20)])
+        self.assertEqual([end for _, _, end in self.index.query()], [20, 50])
+
+    def test_rename(self):
+        self.index.add([("a", 0, 10)])
+        self.index.rename("a", "z")
+        self.assertEqual(list(self.index.query()), [("z", 0, 10)])
+
+    def test_clip(self):
+        self.assertEqual(clip(0, 10, 5, 20), 5)
+        self.assertEqual(clip(0, 10, 20, 30), 0)
+
+class StoreIntervalsTest(StoreTestCase):
+
+    def test_pauses_are_recorded(self):
+        self.create("a", "b")
+        manager = self.manager()
+        manager.toggle("a")
+        manager.toggle("a")
+        manager.edit("a", new_name="z")
+        manager.toggle("b")
+        manager.flush()
+
+        store = self.store()
+        self.assertEqual([name for name, _, _ in store.intervals.query()], ["z"])
+        self.assertEqual(sorted(name for name, _, _ in activity(store)), ["b", "z"])
+
+class JournalIntervalsTest(StoreIntervalsTest):
+    backend = "journal"
+
+class SQLiteIntervalsTest(StoreIntervalsTest):
+    backend = "sqlite"
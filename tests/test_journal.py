@@ -0,0 +1,80 @@
+"""
+test_journal.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the append-only journal store.
+"""
+import os
+from task_timer.storage.journal import RECORD, JournalStore
+from tests.support import StoreTestCase
+
+class JournalStoreTest(StoreTestCase):
+
+    backend = "journal"
+
+    def test_changes_are_appended(self):
+        self.create("a", "b")
+        size = os.path.getsize(self.path + ".journal")
+
+        manager = self.manager()
+        manager.toggle("a")
+        manager.flush()
+
+        self.assertEqual(os.path.getsize(self.path + ".journal"), size + RECORD.size)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.store().get("a").status, "Active")
+
+    def test_rename_and_delete_replay(self):
+        self.create("a", "b", "c")
+        manager = self.manager()
+        manager.edit("a", new_name="z")
+        manager.delete("b")
+        manager.flush()
+
+        self.assertEqual([task.task_name for task in self.store().load()], ["z", "c"])
+
+    def test_compaction(self):
+        store = JournalStore(self.path, compact_after=5)
+        manager = self.manager()
+        manager.store = store
+        for number in range(4):
+            manager.create(f"task{number}")
+        manager.flush()
+        for _ in range(3):
+            manager.toggle("task0")
+            manager.flush()
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertLess(os.path.getsize(store.journal_path) if os.path.exists(store.journal_path) else 0, 5 * RECORD.size)
+        tasks = {task.task_name: task for task in JournalStore(self.path).load()}
+        self.assertEqual(len(tasks), 4)
+        self.assertEqual(tasks["task0"].status, "Active")
+
+        events = [record["event"] for record in store.history("task0")]
+        self.assertEqual(events, ["create", "start", "pause", "resume"])
+
+    def test_torn_record_is_ignored(self):
+        self.create("a")
+        with open(self.path + ".journal", mode="ab") as file:
+            file.write(b"\0" * (RECORD.size // 2))
+        self.assertEqual([task.task_name for task in self.store().load()], ["a"])
+
+    def test_refresh_replays_new_records(self):
+        self.create("a", "b")
+        store = self.store()
+        tasks = store.load()
+
+        manager = self.manager()
+        manager.toggle("b")
+        manager.flush()
+
+        refreshed = store.refresh(tasks)
+        self.assertIs(refreshed[0], tasks[0])
+        self.assertEqual(refreshed[1].status, "Active")
+
+    def test_long_name(self):
+        manager = self.manager()
+        manager.create("x" * 100)
+        with self.assertRaises(ValueError):
+            manager.flush()
@@ -0,0 +1,80 @@
+"""
+test_location.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for finding the store a command uses, and for namespaces.
+"""
+import os
+from task_timer import location
+from tests.support import StoreTestCase
+
+class LocationTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        del os.environ["TASK_TIMER_FILE"]
+        self.project = os.path.join(self.directory, "project")
+        self.nested = os.path.join(self.project, "src", "deep")
+        os.makedirs(self.nested)
+        cwd = os.getcwd()
+        os.chdir(self.nested)
+        self.addCleanup(os.chdir, cwd)
+        location.clear_cache()
+
+    def resolve(self, namespace=None):
+        location.clear_cache()
+        return location.resolve(namespace)
+
+    def test_data_directory(self):
+        self.assertEqual(self.resolve(), (os.path.join(self.directory, "task-timer", "tasks.csv"), "data"))
+
+    def test_environment(self):
+        os.environ["TASK_TIMER_FILE"] = "relative.csv"
+        self.assertEqual(self.resolve(), (os.path.join(self.nested, "relative.csv"), "env"))
+
+    def test_project_in_a_parent(self):
+        os.chdir(self.project)
+        result = self.invoke("init")
+        self.assertEqual(result.exit_code, 0, result.output)
+        os.chdir(self.nested)
+        self.assertEqual(self.resolve(), (os.path.join(self.project, ".task-timer", "tasks.csv"), "project"))
+
+    def test_old_store_in_the_current_directory(self):
+        with open("tasks.csv", "w") as file:
+            file.write("Task Name,Status,Time,Start_time,End_time,Pre_pause_time\n")
+        self.assertEqual(self.resolve(), (os.path.join(self.nested, "tasks.csv"), "cwd"))
+
+    def test_namespaces(self):
+        path = self.resolve()[0]
+        self.assertEqual(self.resolve("client")[0], os.path.join(os.path.dirname(path), "client.csv"))
+        for namespace in ("../escape", ".hidden", "-option", "a/b", "a b", "caf\u00e9", ""):
+            with self.assertRaises(ValueError):
+                location.namespace_file(path, namespace)
+        for namespace in ("client", "client-2.old", "_1"):
+            self.assertTrue(location.valid_namespace(namespace), namespace)
+
+        self.invoke("--namespace", "client", "create", "--name", "a")
+        self.invoke("-N", "home", "create", "--name", "b")
+        self.invoke("create", "--name", "c")
+        self.assertEqual(location.namespaces(path), ["client", "home"])
+
+        result = self.invoke("--namespace", "client", "list")
+        self.assertIn("a", result.output)
+        self.assertNotIn("c", result.output.replace("Task", ""))
+
+    def test_invalid_namespace_option(self):
+        result = self.invoke("--namespace", "../x", "list")
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("invalid namespace", result.output)
+
+    def test_where(self):
+        os.environ["TASK_TIMER_NAMESPACE"] = "client"
+        result = self.invoke("where")
+        self.assertIn(os.path.join(self.directory, "task-timer", "client.csv"), result.output)
+        self.assertIn("user data directory", result.output)
+
+    def test_socket_path(self):
+        self.assertEqual(location.socket_path("tasks.csv"), os.path.abspath("tasks.csv") + ".sock")
+        os.environ["TASK_TIMER_SOCKET"] = "/tmp/other.sock"
+        self.assertEqual(location.socket_path("tasks.csv"), "/tmp/other.sock")
@@ -0,0 +1,93 @@
+"""
+test_lock.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for file locking and atomic replacement, and for several task-timer
+processes changing the same store at once.
+"""
+import os
+import stat
+import subprocess
+import sys
+from task_timer.storage.lock import atomic_write, file_lock
+from tests.support import ROOT, StoreTestCase
+
+class AtomicWriteTest(StoreTestCase):
+
+    def test_replaces_contents(self):
+        with open(self.path, "w") as file:
+            file.write("old")
+        with atomic_write(self.path) as file:
+            file.write("new")
+        with open(self.path) as file:
+            self.assertEqual(file.read(), "new")
+        self.assertEqual(os.listdir(self.directory), ["tasks.csv"])
+
+    def test_error_keeps_old_contents(self):
+        with open(self.path, "w") as file:
+            file.write("old")
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as file:
+                file.write("half")
+                raise RuntimeError
+        with open(self.path) as file:
+            self.assertEqual(file.read(), "old")
+        self.assertEqual(os.listdir(self.directory), ["tasks.csv"])
+
+    def test_keeps_permissions(self):
+        with open(self.path, "w") as file:
+            file.write("old")
+        os.chmod(self.path, 0o640)
+        with atomic_write(self.path) as file:
+            file.write("new")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_new_file_follows_umask(self):
+        umask = os.umask(0o022)
+        os.umask(umask)
+        with atomic_write(self.path) as file:
+            file.write("new")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o666 & ~umask)
+
+class FileLockTest(StoreTestCase):
+
+    def test_other_process_waits(self):
+        lock_path = self.path + ".lock"
+        script = (
+            "import sys\n"
+            "from task_timer.storage.lock import file_lock\n"
+            "with file_lock(sys.argv[1]):\n"
+            "    print('locked', flush=True)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        with file_lock(lock_path):
+            process = subprocess.Popen([sys.executable, "-c", script, lock_path], env=env, stdout=subprocess.PIPE, text=True)
+            with self.assertRaises(subprocess.TimeoutExpired):
+                process.wait(timeout=0.5)
+        output, _ = process.communicate(timeout=30)
+        self.assertEqual(output, "locked\n")
+
+class ConcurrentCommandsTest(StoreTestCase):
+
+    def start(self, *args):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        return subprocess.Popen(
+            [sys.executable, "-m", "task_timer", *args],
+            cwd=self.directory, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+
+    def wait(self, processes):
+        for process in processes:
+            _, error = process.communicate(timeout=60)
+            self.assertEqual(process.returncode, 0, error)
+
+    def test_concurrent_creates(self):
+        self.wait([self.start("create", "--name", f"task{number}") for number in range(8)])
+        self.assertEqual(sorted(self.store().names()), sorted(f"task{number}" for number in range(8)))
+
+    def test_concurrent_toggles(self):
+        names = [f"task{number}" for number in range(8)]
+        self.create(*names)
+        self.wait([self.start("toggle", "--name", name) for name in names])
+        self.assertEqual({task.status for task in self.store().load()}, {"Active"})
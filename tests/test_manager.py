@@ -0,0 +1,125 @@
+"""
+test_manager.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for TaskManager, the library API the commands make their changes
+through, including writers that read the store before taking its lock.
+"""
+import os
+import subprocess
+import sys
+from task_timer.manager import TaskManager
+from tests.support import ROOT, StoreTestCase
+
+# Toggles the task named on the command line, reading it before the lock is taken
+TOGGLE = (
+    "import sys\n"
+    "from task_timer import TaskManager\n"
+    "manager = TaskManager()\n"
+    "manager.toggle(sys.argv[1])\n"
+    "manager.flush()\n"
+)
+
+class ManagerTest(StoreTestCase):
+
+    def test_changes(self):
+        manager = self.manager()
+        manager.create("a")
+        manager.create()
+        self.assertEqual(manager.toggle("a"), "start")
+        manager.edit("task2", new_name="b")
+        manager.flush()
+
+        manager = self.manager()
+        self.assertEqual(manager.names(), ["a", "b"])
+        self.assertEqual(manager["a"].status, "Active")
+        self.assertEqual(manager.pause("a"), "pause")
+        manager.edit("a", seconds=60)
+        manager.delete("b")
+        manager.flush()
+
+        task = self.store().get("a")
+        self.assertEqual(task.status, "Paused")
+        self.assertGreaterEqual(task.elapsed_ns, 60 * 10**9)
+        self.assertEqual(self.store().names(), ["a"])
+
+    def test_errors(self):
+        self.create("a", "b")
+        manager = self.manager()
+        with self.assertRaises(ValueError):
+            manager.create("a")
+        with self.assertRaises(ValueError):
+            manager.edit("a", new_name="b")
+        with self.assertRaises(ValueError):
+            manager.edit("a", seconds=10)
+        with self.assertRaises(ValueError):
+            manager.pause("a")
+        with self.assertRaises(KeyError):
+            manager.toggle("missing")
+        self.assertNotIn("missing", manager)
+
+    def test_context_manager(self):
+        self.create("a")
+        with self.manager() as manager:
+            manager.toggle("a")
+        self.assertEqual(self.store().get("a").status, "Active")
+
+        with self.assertRaises(RuntimeError):
+            with self.manager() as manager:
+                manager.toggle("a")
+                raise RuntimeError
+        self.assertEqual(self.store().get("a").status, "Active")
+
+    def test_query(self):
+        self.create("client-a", "client-b", "home")
+        manager = self.manager()
+        manager.toggle("client-b")
+        self.assertEqual([task.task_name for task in manager.query(pattern="client-*")], ["client-a", "client-b"])
+        self.assertEqual([task.task_name for task in manager.query(statuses=["Active"])], ["client-b"])
+
+    def test_namespace(self):
+        manager = TaskManager(namespace="client")
+        manager.create("a")
+        manager.flush()
+        self.assertEqual(TaskManager(namespace="client").names(), ["a"])
+        self.assertEqual(TaskManager().names(), [])
+
+class StaleReadTest(StoreTestCase):
+    """
+    A manager that read the store before another process changed it must
+    not undo that change when it flushes.
+    """
+
+    def test_change_between_read_and_flush(self):
+        self.create("a", "b")
+        manager = self.manager()
+        manager.toggle("a")
+        self.run_cli("toggle", "--name", "b")
+        manager.flush()
+
+        self.assertEqual(self.store().get("a").status, "Active")
+        self.assertEqual(self.store().get("b").status, "Active")
+
+    def test_concurrent_writers(self):
+        names = [f"task{number}" for number in range(8)]
+        self.create(*names)
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        processes = [
+            subprocess.Popen([sys.executable, "-c", TOGGLE, name], env=env, stderr=subprocess.PIPE, text=True)
+            for name in names
+        ]
+        for process in processes:
+            _, error = process.communicate(timeout=60)
+            self.assertEqual(process.returncode, 0, error)
+        self.assertEqual({task.task_name: task.status for task in self.store().load()}, dict.fromkeys(names, "Active"))
+
+class JournalStaleReadTest(StaleReadTest):
+    backend = "journal"
+
+class ShardedStaleReadTest(StaleReadTest):
+
+    def setUp(self):
+        super().setUp()
+        result = self.invoke("shard", "--by", "hash", "--count", "2")
+        self.assertEqual(result.exit_code, 0, result.output)
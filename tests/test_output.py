@@ -0,0 +1,82 @@
+"""
+test_output.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the machine readable output of `list --format` and `display --stream`.
+"""
+import io
+import json
+from task_timer import output
+from task_timer.task import Task
+from tests.support import StoreTestCase
+
+class ListFormatTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("a", "a much longer name than the table pads to", "tab\there")
+        self.invoke("toggle", "--name", "a")
+
+    def list(self, fmt):
+        result = self.invoke("list", "--format", fmt)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertNotIn("\x1b", result.output)
+        return result.output
+
+    def test_json(self):
+        records = json.loads(self.list("json"))
+        self.assertEqual([record["name"] for record in records], ["a", "a much longer name than the table pads to", "tab\there"])
+        self.assertEqual(records[0]["status"], "Active")
+        self.assertIsInstance(records[0]["started"], float)
+        self.assertEqual(records[1], {"name": "a much longer name than the table pads to", "status": "Off", "seconds": 0, "started": None})
+
+    def test_jsonl(self):
+        records = [json.loads(line) for line in self.list("jsonl").splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(set(records[0]), set(output.FIELDS))
+
+    def test_tsv(self):
+        lines = self.list("tsv").splitlines()
+        self.assertEqual(lines[0], "\t".join(output.FIELDS))
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[3].split("\t"), ["tab\\there", "Off", "0.0", ""])
+
+    def test_empty_store(self):
+        manager = self.manager()
+        for name in manager.names():
+            manager.delete(name)
+        manager.flush()
+        self.assertEqual(json.loads(self.list("json")), [])
+        self.assertEqual(self.list("jsonl"), "")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            output.write_tasks([], io.StringIO(), "xml")
+        self.assertEqual(self.invoke("list", "--format", "xml").exit_code, 2)
+
+class StreamTest(StoreTestCase):
+
+    def stream(self, ticks, full=False):
+        file = io.StringIO()
+        output.stream_tasks(self.next_list, file, interval=0.01, full=full, ticks=ticks)
+        return [json.loads(line) for line in file.getvalue().splitlines()]
+
+    def test_diffs(self):
+        a, b = Task("a"), Task("b")
+        started = Task("a")
+        started.start()
+        lists = iter([[a, b], [a, b], [started]])
+        self.next_list = lambda: next(lists)
+
+        snapshot, unchanged, changed = self.stream(3)
+        self.assertEqual(snapshot["type"], "snapshot")
+        self.assertEqual([record["name"] for record in snapshot["tasks"]], ["a", "b"])
+        self.assertEqual((unchanged["type"], unchanged["changed"], unchanged["removed"]), ("diff", [], []))
+        self.assertEqual([record["status"] for record in changed["changed"]], ["Active"])
+        self.assertEqual(changed["removed"], ["b"])
+
+    def test_full(self):
+        tasks = [Task("a")]
+        self.next_list = lambda: tasks
+        self.assertEqual([line["type"] for line in self.stream(2, full=True)], ["snapshot", "snapshot"])
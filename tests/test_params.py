@@ -0,0 +1,78 @@
+"""
+test_params.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the task name parameter types in task_timer.params.
+"""
+import importlib
+import click
+from task_timer import cli, params
+from tests.support import StoreTestCase
+
+class CountingStore():
+    """
+    Wraps a store and counts how often every task name is read.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.indexed = store.indexed
+        self.reads = 0
+
+    def names(self):
+        self.reads += 1
+        return self.store.names()
+
+    def find(self, name, case_sensitive=True):
+        self.reads += 1
+        return self.store.find(name, case_sensitive)
+
+class TaskNameTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("Report", "review", "email")
+        self.counting = CountingStore(self.store())
+        self.task_name = params.TaskName(lambda: self.counting, case_sensitive=False)
+
+    def test_importing_commands_reads_nothing(self):
+        for command in cli.COMMANDS:
+            importlib.import_module(f"task_timer.commands.{command}")
+        self.assertIsNone(params._cached_names)
+
+    def test_convert_returns_stored_spelling(self):
+        self.assertEqual(self.task_name.convert("report", None, None), "Report")
+
+    def test_unknown_name_fails(self):
+        with self.assertRaises(click.BadParameter):
+            self.task_name.convert("missing", None, None)
+
+    def test_names_read_once(self):
+        for _ in range(20):
+            self.task_name.convert("email", None, None)
+        self.assertEqual(self.counting.reads, 1)
+
+    def test_completion(self):
+        completions = self.task_name.shell_complete(None, None, "re")
+        self.assertEqual([item.value for item in completions], ["Report", "review"])
+
+    def test_pattern(self):
+        pattern = params.TaskPattern(lambda: self.counting, case_sensitive=False)
+        self.assertEqual(pattern.convert("re*", None, None), ("Report", "review"))
+        with self.assertRaises(click.BadParameter):
+            pattern.convert("x*", None, None)
+
+    def test_command_validates_name(self):
+        result = self.invoke("toggle", "--name", "missing")
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("missing", result.output)
+
+class DurationTest(StoreTestCase):
+
+    def test_convert(self):
+        duration = params.Duration()
+        self.assertEqual(duration.convert("1h30m", None, None), 5400)
+        self.assertEqual(duration.convert("90", None, None), 90)
+        with self.assertRaises(click.BadParameter):
+            duration.convert("soon", None, None)
@@ -0,0 +1,71 @@
+"""
+test_reload.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for noticing and reading changes other processes made to the store,
+which the display uses to stay up to date.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from tests.support import ROOT, StoreTestCase
+
+class ReloadTest(StoreTestCase):
+
+    def change(self):
+        manager = self.manager()
+        manager.toggle("b")
+        manager.flush()
+
+    def test_version_changes_on_write(self):
+        self.create("a", "b")
+        store = self.store()
+        version = store.version()
+        self.assertEqual(store.version(), version)
+        self.change()
+        self.assertNotEqual(store.version(), version)
+
+    def test_refresh_keeps_unchanged_tasks(self):
+        self.create("a", "b")
+        store = self.store()
+        tasks = store.load()
+        self.change()
+
+        refreshed = store.refresh(tasks)
+        self.assertIs(refreshed[0], tasks[0])
+        self.assertIsNot(refreshed[1], tasks[1])
+        self.assertEqual(refreshed[1].status, "Active")
+
+    def test_display_stream_follows_changes(self):
+        self.create("a", "b")
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        process = subprocess.Popen(
+            [sys.executable, "-m", "task_timer", "display", "--stream", "--interval", "0.05"],
+            cwd=self.directory, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        self.addCleanup(process.stdout.close)
+
+        snapshot = json.loads(process.stdout.readline())
+        self.assertEqual(snapshot["type"], "snapshot")
+        self.assertEqual([task["name"] for task in snapshot["tasks"]], ["a", "b"])
+
+        self.change()
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            line = json.loads(process.stdout.readline())
+            changed = {task["name"]: task["status"] for task in line.get("changed", [])}
+            if changed.get("b") == "Active":
+                break
+        else:
+            self.fail("the change wasn't streamed")
+
+class JournalReloadTest(ReloadTest):
+    backend = "journal"
+
+class SQLiteReloadTest(ReloadTest):
+    backend = "sqlite"
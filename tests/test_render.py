@@ -0,0 +1,81 @@
+"""
+test_render.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the in-place terminal rendering of the display loop.
+"""
+import io
+import os
+import time
+import unittest
+from contextlib import redirect_stdout
+from task_timer.render import CSI, Screen, clip, live
+
+GREEN = f"{CSI}32m"
+RESET = f"{CSI}39m"
+
+class ClipTest(unittest.TestCase):
+
+    def test_short_line(self):
+        self.assertEqual(clip("abc", 5), "abc")
+
+    def test_plain_line(self):
+        self.assertEqual(clip("abcdef", 4), f"abcd{CSI}0m")
+
+    def test_colors_take_no_room(self):
+        line = f"{GREEN}abc{RESET}"
+        self.assertEqual(clip(line, 3), line)
+        self.assertEqual(clip(f"{GREEN}abcdef{RESET}", 2), f"{GREEN}ab{CSI}0m")
+
+class ScreenTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.screen = Screen(self.stream, lambda: os.terminal_size((20, 5)))
+
+    def test_only_changed_lines_are_written(self):
+        self.screen.draw(["one", "two", "three"])
+        self.stream.truncate(0)
+        self.stream.seek(0)
+
+        self.screen.draw(["one", "TWO", "three"])
+        output = self.stream.getvalue()
+        self.assertIn(f"{CSI}2;1HTWO", output)
+        self.assertNotIn("one", output)
+        self.assertNotIn("three", output)
+
+    def test_unchanged_frame_writes_nothing(self):
+        self.screen.draw(["one"])
+        self.stream.truncate(0)
+        self.stream.seek(0)
+        self.screen.draw(["one"])
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_fit(self):
+        lines = self.screen.fit([f"line {number} is longer than the terminal" for number in range(10)], os.terminal_size((10, 5)))
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[-1], "+7 more")
+        self.assertEqual(lines[0], f"line 0 is {CSI}0m")
+
+    def test_never_clears_with_a_shell_command(self):
+        self.screen.start()
+        self.screen.draw(["one"])
+        self.screen.stop()
+        self.assertTrue(self.stream.getvalue().startswith(f"{CSI}2J"))
+
+class LiveTest(unittest.TestCase):
+
+    def test_exit_key(self):
+        reader, writer = os.pipe()
+        os.write(writer, b"c\n")
+        frames = []
+        output = io.StringIO()
+        with open(reader) as stdin, redirect_stdout(output):
+            started = time.monotonic()
+            live(lambda: frames.append(1) or ["frame"], interval=5, stdin=stdin)
+        os.close(writer)
+
+        self.assertEqual(len(frames), 1)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertIn("frame", output.getvalue())
@@ -0,0 +1,88 @@
+"""
+test_rollup.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the daily rollups behind the report command.
+"""
+import os
+from datetime import date, datetime
+from task_timer import rollup
+from tests.support import StoreTestCase
+
+def at(day, hour):
+    return datetime.combine(date.fromisoformat(day), datetime.min.time()).timestamp() + hour * 3600
+
+class RollupsTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.rollups = rollup.Rollups(os.path.join(self.directory, "daily"))
+        self.rollups.rebuild([])
+
+    def test_one_file_per_month(self):
+        self.rollups.add([("a", at("2026-09-30", 10), at("2026-09-30", 11)), ("a", at("2026-10-17", 9), at("2026-10-17", 10))])
+        self.assertEqual(sorted(os.listdir(self.rollups.path)), ["2026-09.json", "2026-10.json"])
+
+        before = os.stat(os.path.join(self.rollups.path, "2026-09.json")).st_mtime_ns
+        self.rollups.add([("b", at("2026-10-18", 9), at("2026-10-18", 10))])
+        self.assertEqual(os.stat(os.path.join(self.rollups.path, "2026-09.json")).st_mtime_ns, before)
+
+    def test_runs_split_at_midnight(self):
+        self.rollups.add([("a", at("2026-10-17", 23), at("2026-10-18", 1))])
+        days = self.rollups.days()
+        self.assertEqual(days, {date(2026, 10, 17): {"a": 3600.0}, date(2026, 10, 18): {"a": 3600.0}})
+
+    def test_days_in_range(self):
+        self.rollups.add([("a", at(day, 9), at(day, 10)) for day in ("2026-08-01", "2026-09-15", "2026-10-17")])
+        self.assertEqual(list(self.rollups.days(date(2026, 9, 1), date(2026, 9, 30))), [date(2026, 9, 15)])
+
+    def test_rename(self):
+        self.rollups.add([("a", at("2026-10-17", 9), at("2026-10-17", 10)), ("b", at("2026-10-17", 11), at("2026-10-17", 12))])
+        self.rollups.rename("a", "b")
+        self.assertEqual(self.rollups.days(), {date(2026, 10, 17): {"b": 7200.0}})
+
+    def test_rebuild(self):
+        self.rollups.add([("old", at("2026-10-17", 9), at("2026-10-17", 10))])
+        self.rollups.rebuild([("new", at("2026-10-18", 9), at("2026-10-18", 10))])
+        self.assertEqual(self.rollups.days(), {date(2026, 10, 18): {"new": 3600.0}})
+        self.assertEqual(os.listdir(self.directory), ["daily"])
+
+    def test_periods(self):
+        self.assertEqual(rollup.period(date(2026, 10, 17), "day"), "2026-10-17")
+        self.assertEqual(rollup.period(date(2026, 10, 17), "week"), "2026-W42")
+        self.assertEqual(rollup.period(date(2026, 10, 17), "month"), "2026-10")
+
+class ReportTest(StoreTestCase):
+
+    def test_report(self):
+        store = self.store()
+        store.intervals.add([("a", at("2026-10-12", 9), at("2026-10-12", 10)), ("b", at("2026-10-17", 9), at("2026-10-17", 11))])
+
+        self.assertEqual(rollup.report(store, by="week"), {"2026-W42": {"a": 3600.0, "b": 7200.0}})
+        self.assertEqual(rollup.report(store, since=date(2026, 10, 13)), {"2026-10-17": {"b": 7200.0}})
+        self.assertEqual(rollup.report(store, names=["a"]), {"2026-10-12": {"a": 3600.0}})
+
+    def test_running_tasks_are_included(self):
+        self.create("a")
+        manager = self.manager()
+        manager.toggle("a")
+        manager.flush()
+        report = rollup.report(self.store())
+        self.assertEqual([list(totals) for totals in report.values()], [["a"]])
+
+    def test_old_history_is_rolled_up(self):
+        store = self.store()
+        store.intervals.add([("a", at("2026-10-17", 9), at("2026-10-17", 10))])
+        rollups = store.intervals.rollups()
+        for entry in os.listdir(rollups.path):
+            os.remove(os.path.join(rollups.path, entry))
+        os.rmdir(rollups.path)
+
+        self.assertEqual(rollup.report(self.store()), {"2026-10-17": {"a": 3600.0}})
+
+    def test_command(self):
+        self.store().intervals.add([("a", at("2026-10-17", 9), at("2026-10-17", 10))])
+        result = self.invoke("report", "--by", "month")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("2026-10", result.output)
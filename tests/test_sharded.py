@@ -0,0 +1,78 @@
+"""
+test_sharded.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for splitting a store into shards.
+"""
+import os
+from unittest import mock
+from task_timer.storage.sharded import ShardedStore, reshard
+from tests.support import StoreTestCase
+
+class ShardedStoreTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("client/report", "client/email", "home/dishes", "inbox")
+
+    def shard(self, *options):
+        result = self.invoke("shard", *options)
+        self.assertEqual(result.exit_code, 0, result.output)
+        return self.store()
+
+    def test_by_prefix(self):
+        store = self.shard("--by", "prefix")
+        self.assertIsInstance(store, ShardedStore)
+        self.assertEqual(sorted(key for key, _ in store.shards()), ["", "client", "home"])
+        self.assertEqual(sorted(store.names()), ["client/email", "client/report", "home/dishes", "inbox"])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_one_task_reads_one_shard(self):
+        store = self.shard("--by", "prefix")
+        shards = dict(store.shards())
+        with mock.patch.object(type(shards["client"]), "load", autospec=True, side_effect=type(shards["client"]).load) as load:
+            self.assertEqual(store.get("home/dishes").task_name, "home/dishes")
+        self.assertEqual([call.args[0] for call in load.call_args_list], [shards["home"]])
+
+    def test_rename_into_another_shard(self):
+        self.shard("--by", "prefix")
+        manager = self.manager()
+        manager.toggle("client/report")
+        manager.edit("client/report", new_name="home/report")
+        manager.delete("inbox")
+        manager.flush()
+
+        store = self.store()
+        shards = dict(store.shards())
+        self.assertEqual(shards["client"].names(), ["client/email"])
+        self.assertEqual(sorted(shards["home"].names()), ["home/dishes", "home/report"])
+        self.assertEqual(shards[""].names(), [])
+        self.assertEqual(store.get("home/report").status, "Active")
+
+    def test_by_hash_and_back(self):
+        store = self.shard("--by", "hash", "--count", "4")
+        self.assertLessEqual(len(store.shards()), 4)
+        self.assertEqual(len(store.load()), 4)
+
+        store = self.shard("--by", "none")
+        self.assertNotIsInstance(store, ShardedStore)
+        self.assertEqual(sorted(store.names()), ["client/email", "client/report", "home/dishes", "inbox"])
+        self.assertFalse(os.path.exists(self.path + ".shards"))
+
+    def test_new_shard_is_created(self):
+        self.shard("--by", "prefix")
+        self.create("work/plan")
+        self.assertIn("work", dict(self.store().shards()))
+
+    def test_unsharded_store_cant_be_merged(self):
+        with self.assertRaises(ValueError):
+            reshard(self.store(), "csv", "none")
+
+class SQLiteShardedStoreTest(ShardedStoreTest):
+    backend = "sqlite"
+
+    def test_one_task_reads_one_shard(self):
+        store = self.shard("--by", "prefix")
+        self.assertTrue(store.indexed)
+        self.assertEqual(store.get("home/dishes").task_name, "home/dishes")
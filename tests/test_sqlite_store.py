@@ -0,0 +1,61 @@
+"""
+test_sqlite_store.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the SQLite store and its name index.
+"""
+import os
+from task_timer.storage.sqlite_store import SQLiteStore
+from tests.support import StoreTestCase
+
+class SQLiteStoreTest(StoreTestCase):
+
+    backend = "sqlite"
+
+    def test_database_beside_task_file(self):
+        self.create("a")
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "tasks.db")))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_lookups(self):
+        self.create("Alpha", "beta", "gamma")
+        store = self.store()
+
+        self.assertIsInstance(store, SQLiteStore)
+        self.assertTrue(store.indexed)
+        self.assertEqual(store.get("beta").task_name, "beta")
+        self.assertIsNone(store.get("delta"))
+        self.assertEqual(sorted(store.get_many(["Alpha", "gamma", "delta"])), ["Alpha", "gamma"])
+        self.assertEqual(store.find("alpha", case_sensitive=False), "Alpha")
+        self.assertIsNone(store.find("alpha"))
+        self.assertEqual(store.names(), ["Alpha", "beta", "gamma"])
+
+    def test_get_many_past_parameter_limit(self):
+        names = [f"task{number}" for number in range(1200)]
+        self.create(*names)
+        self.assertEqual(len(self.store().get_many(names)), 1200)
+
+    def test_only_changed_rows_are_written(self):
+        self.create("a", "b")
+        manager = self.manager()
+        manager.toggle("a")
+        manager.edit("b", new_name="c")
+        manager.flush()
+
+        tasks = {task.task_name: task for task in self.store().load()}
+        self.assertEqual(sorted(tasks), ["a", "c"])
+        self.assertEqual(tasks["a"].status, "Active")
+
+    def test_delete(self):
+        self.create("a", "b")
+        manager = self.manager()
+        manager.delete("a")
+        manager.flush()
+        self.assertEqual(self.store().names(), ["b"])
+
+    def test_empty_store(self):
+        store = self.store()
+        self.assertEqual(store.load(), [])
+        self.assertEqual(store.names(), [])
+        self.assertFalse(os.path.exists(store.db_path))
@@ -0,0 +1,124 @@
+"""
+test_status.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the status cache and the `task-timer status` fast path.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from task_timer import status
+from tests.support import ROOT, StoreTestCase
+
+class StatusTestCase(StoreTestCase):
+    """
+    A store with tasks a and b active, and c off.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.create("a", "b", "c")
+        manager = self.manager()
+        manager.toggle("a")
+        manager.toggle("b")
+        manager.flush()
+
+    def active(self):
+        data = status.read_cache(self.path)
+        return None if data is None else sorted(entry[0] for entry in data["active"])
+
+class StatusCacheTest(StatusTestCase):
+
+    def test_record(self):
+        self.assertEqual(self.active(), ["a", "b"])
+        manager = self.manager()
+        manager.toggle("a")
+        manager.edit("b", new_name="renamed")
+        manager.toggle("c")
+        manager.flush()
+        self.assertEqual(self.active(), ["c", "renamed"])
+
+        manager = self.manager()
+        manager.delete("c")
+        manager.flush()
+        self.assertEqual(self.active(), ["renamed"])
+
+    def test_rebuild(self):
+        os.remove(status.cache_path(self.path))
+        self.assertIsNone(status.read_cache(self.path))
+        status.rebuild(self.store())
+        self.assertEqual(self.active(), ["a", "b"])
+
+    def test_other_writes_make_the_cache_stale(self):
+        store = self.store()
+        task_list = store.load()
+        task_list[2].start()
+        store.save(task_list)
+        self.assertIsNone(status.read_cache(self.path))
+
+        # The next change through a TaskManager rebuilds it from the store
+        manager = self.manager()
+        manager.toggle("a")
+        manager.flush()
+        self.assertEqual(self.active(), ["b", "c"])
+
+    def test_lines(self):
+        data = {"files": {}, "active": [["a", 30 * 10**9, 1000.0], ["b", 0, 1000.0]], "renames": []}
+        self.assertEqual(status.status_lines(data), ["2"])
+        self.assertEqual(status.status_lines(data, active=True, now=1090.0), ["a 02:00", "b 01:30"])
+
+    def test_command(self):
+        self.assertEqual(self.invoke("status").output, "2\n")
+        os.remove(status.cache_path(self.path))
+        self.assertEqual(self.invoke("status", "--active").output.split()[::2], ["a", "b"])
+        self.assertEqual(self.active(), ["a", "b"])
+
+class FastPathTest(StatusTestCase):
+
+    def fast_path(self, *args):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = status.fast_path(list(args))
+        return code, output.getvalue()
+
+    def test_answers_from_the_cache(self):
+        self.assertEqual(self.fast_path(), (0, "2\n"))
+        code, output = self.fast_path("--active")
+        self.assertEqual([line.split()[0] for line in output.splitlines()], ["a", "b"])
+
+    def test_falls_back(self):
+        self.assertEqual(self.fast_path("--help"), (None, ""))
+        os.environ["TASK_TIMER_TRACE"] = "1"
+        self.assertEqual(self.fast_path(), (None, ""))
+        os.environ.pop("TASK_TIMER_TRACE")
+
+        os.environ["TASK_TIMER_NAMESPACE"] = "../escape"
+        self.assertEqual(self.fast_path(), (None, ""))
+        os.environ.pop("TASK_TIMER_NAMESPACE")
+        os.remove(status.cache_path(self.path))
+        self.assertEqual(self.fast_path(), (None, ""))
+
+    def test_new_process_imports_only_the_cache_reader(self):
+        code = (
+            "import json, sys\n"
+            "before = set(sys.modules)\n"
+            "from task_timer.__main__ import main\n"
+            "sys.argv = ['task-timer', 'status', '--active']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit as e:\n"
+            "    print(json.dumps([e.code, sorted(set(sys.modules) - before)]))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+        exit_code, loaded = json.loads(output.splitlines()[-1])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output.splitlines()[0].split()[0], "a")
+        self.assertEqual(sorted(name for name in loaded if name.startswith("task_timer")),
+                         ["task_timer", "task_timer.__main__", "task_timer.durations", "task_timer.location", "task_timer.status"])
+        for name in ("click", "re", "functools", "csv", "json"):
+            self.assertNotIn(name, loaded)
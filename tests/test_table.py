@@ -0,0 +1,64 @@
+"""
+test_table.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the compact Task representation and the columnar TaskTable.
+"""
+import unittest
+from unittest import mock
+from task_timer import table
+from task_timer.table import TaskTable
+from task_timer.task import NS_PER_SECOND, Task
+
+def tasks():
+    off = Task("off")
+    paused = Task("paused")
+    paused.status = "Paused"
+    paused.elapsed_ns = 90 * NS_PER_SECOND
+    active = Task("active")
+    active.status = "Active"
+    active.elapsed_ns = 10 * NS_PER_SECOND
+    active.start_time = 1000.0
+    return [off, paused, active]
+
+class TaskTest(unittest.TestCase):
+
+    def test_slots(self):
+        task = Task("a")
+        self.assertFalse(hasattr(task, "__dict__"))
+        with self.assertRaises(AttributeError):
+            task.note = "no room for this"
+
+    def test_row_round_trip(self):
+        for task in tasks():
+            copy = Task.from_row([str(value) if value is not None else "" for value in task.to_row()])
+            self.assertEqual(
+                (copy.task_name, copy.status, copy.elapsed_ns, copy.start_time),
+                (task.task_name, task.status, task.elapsed_ns, task.start_time),
+            )
+
+class TaskTableTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        table = TaskTable.from_tasks(tasks())
+        self.assertEqual(len(table), 3)
+        self.assertEqual([task.task_name for task in table], ["off", "paused", "active"])
+        self.assertEqual(table[1].elapsed_ns, 90 * NS_PER_SECOND)
+        self.assertIsNone(table[0].start_time)
+        self.assertEqual(table[2].start_time, 1000.0)
+        self.assertFalse(table[2].dirty)
+
+    def test_from_rows(self):
+        rows = [task.to_row() for task in tasks()]
+        rows[0] = ["off", "Off", "0.0", "", "", "0.0"]
+        self.assertEqual([task.status for task in TaskTable.from_rows(rows)], ["Off", "Paused", "Active"])
+
+    def test_total(self):
+        table = TaskTable.from_tasks(tasks())
+        self.assertEqual(list(table.elapsed(now=1005.0)), [0.0, 90.0, 15.0])
+        self.assertEqual(table.total(now=1005.0), 105.0)
+
+    def test_total_without_numpy(self):
+        with mock.patch.object(table, "numpy", None):
+            self.test_total()
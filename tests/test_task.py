@@ -0,0 +1,65 @@
+"""
+test_task.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the monotonic timing of tasks.
+"""
+import time
+import unittest
+from unittest import mock
+from task_timer.task import NS_PER_SECOND, Task, clock_id
+
+class TimingTest(unittest.TestCase):
+
+    def test_wall_clock_jump_is_ignored(self):
+        task = Task("a")
+        task.start()
+        with mock.patch("time.time", return_value=time.time() + 3600):
+            self.assertLess(task.elapsed(), 60)
+            task.pause()
+        self.assertLess(task.elapsed_ns, 60 * NS_PER_SECOND)
+
+    def test_other_boot_uses_wall_clock(self):
+        task = Task("a")
+        task.status = "Active"
+        task.start_time = time.time() - 30
+        task.mono_start_ns = time.monotonic_ns() - 10 * NS_PER_SECOND
+        task.clock = "00000000" if clock_id() != "00000000" else "11111111"
+        self.assertAlmostEqual(task.elapsed(), 30, delta=5)
+
+    def test_monotonic_reading_from_the_future(self):
+        task = Task("a")
+        task.status = "Active"
+        task.start_time = time.time() - 30
+        task.mono_start_ns = time.monotonic_ns() + 3600 * NS_PER_SECOND
+        task.clock = clock_id()
+        self.assertAlmostEqual(task.elapsed(), 30, delta=5)
+
+    def test_pauses_add_up_exactly(self):
+        task = Task("a")
+        task.start()
+        for _ in range(100):
+            task.pause()
+            task.resume()
+        task.pause()
+        self.assertIsInstance(task.elapsed_ns, int)
+        self.assertEqual(task.elapsed(), task.elapsed_ns / NS_PER_SECOND)
+
+    def test_adjust_never_goes_negative(self):
+        task = Task("a")
+        task.start()
+        task.pause()
+        task.adjust(-60)
+        self.assertEqual(task.elapsed_ns, 0)
+        task.adjust(90)
+        self.assertEqual(task.elapsed_ns, 90 * NS_PER_SECOND)
+
+    def test_events(self):
+        task = Task("a")
+        task.start()
+        task.pause()
+        task.rename("b")
+        self.assertEqual([event for event, _ in task.events], ["create", "start", "pause", "rename"])
+        self.assertEqual(task.events[-1], ("rename", "a"))
+        self.assertTrue(task.dirty)
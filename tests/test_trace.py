@@ -0,0 +1,77 @@
+"""
+test_trace.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for the phase timings recorded by --profile and --trace-file.
+"""
+import json
+import os
+import pstats
+import time
+import unittest
+from task_timer import trace
+from tests.support import StoreTestCase
+
+class TracerTest(unittest.TestCase):
+
+    def setUp(self):
+        trace.start()
+        self.addCleanup(trace.stop)
+
+    def test_nested_spans_count_once(self):
+        with trace.span("command"):
+            time.sleep(0.01)
+            with trace.span("store.read"):
+                time.sleep(0.02)
+        totals = trace.tracer.totals()
+        self.assertLess(totals["command"][0], 0.02)
+        self.assertGreaterEqual(totals["store.read"][0], 0.02)
+
+    def test_generators_are_timed_while_they_run(self):
+        @trace.traced("store.read")
+        def rows():
+            for number in range(3):
+                time.sleep(0.01)
+                yield number
+
+        with trace.span("command"):
+            for _ in rows():
+                time.sleep(0.01)
+        totals = trace.tracer.totals()
+        self.assertEqual(totals["store.read"][1], 1)
+        self.assertGreaterEqual(totals["store.read"][0], 0.03)
+        self.assertGreaterEqual(totals["command"][0], 0.03)
+
+    def test_disabled_spans_record_nothing(self):
+        trace.stop()
+        with trace.span("command"):
+            pass
+        self.assertFalse(any(phase == "command" for phase, *_ in trace.tracer.spans))
+
+class ProfileOptionsTest(StoreTestCase):
+
+    def test_profile_summary(self):
+        self.create("a")
+        result = self.run_cli("--profile", "toggle", "--name", "a")
+        phases = [line.split()[0] for line in result.stderr.splitlines()]
+        self.assertEqual(phases[0], "Phase")
+        self.assertTrue({"import", "store.read", "parse", "command", "store.write", "total"} <= set(phases), result.stderr)
+
+    def test_trace_and_stats_files(self):
+        self.create("a")
+        trace_path = os.path.join(self.directory, "trace.json")
+        stats_path = os.path.join(self.directory, "list.prof")
+        self.run_cli("--trace-file", trace_path, "--profile-stats", stats_path, "list")
+
+        with open(trace_path) as file:
+            events = json.load(file)["traceEvents"]
+        self.assertTrue({"import", "store.read", "command"} <= {event["cat"] for event in events})
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertGreater(pstats.Stats(stats_path).total_calls, 0)
+
+    def test_environment(self):
+        self.create("a")
+        os.environ["TASK_TIMER_TRACE"] = "1"
+        result = self.run_cli("list")
+        self.assertIn("store.read", result.stderr)
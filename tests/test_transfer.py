@@ -0,0 +1,144 @@
+"""
+test_transfer.py
+Brodie Rogers <brodie.rogers@students.cune.edu>
+2026-10-17
+
+Tests for importing task files with load and exporting them with save.
+"""
+import importlib.util
+import io
+import os
+import unittest
+from task_timer import transfer
+from task_timer.storage import get_store
+from task_timer.task import NS_PER_SECOND
+from tests.support import StoreTestCase
+
+def state(tasks):
+    return {task.task_name: (task.status, task.elapsed_ns, task.start_time, task.end_time) for task in tasks}
+
+class RoundTripTest(StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create("off", "paused", "active")
+        manager = self.manager()
+        manager.toggle("paused")
+        manager.toggle("paused")
+        manager.edit("paused", seconds=90)
+        manager.toggle("active")
+        manager.flush()
+        self.saved = state(self.store().load())
+
+    def round_trip(self, filename, *options):
+        export = os.path.join(self.directory, filename)
+        result = self.invoke("save", "--filename", export, *options)
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        os.environ["TASK_TIMER_FILE"] = os.path.join(self.directory, "copy.csv")
+        result = self.invoke("load", "--filename", export, *options)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("3", result.output)
+        self.assertEqual(state(get_store(os.environ["TASK_TIMER_FILE"]).load()), self.saved)
+
+    def test_csv(self):
+        self.round_trip("export.csv")
+
+    def test_jsonl(self):
+        self.round_trip("export.jsonl")
+
+    def test_jsonl_by_option(self):
+        self.round_trip("export.txt", "--format", "jsonl")
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow isn't installed")
+    def test_parquet(self):
+        self.round_trip("export.parquet")
+
+class ImportTest(StoreTestCase):
+
+    def rows(self, count, seconds=1):
+        return [[f"task{number}", "Paused", "", "", "", "", seconds * NS_PER_SECOND, "", ""] for number in range(count)]
+
+    def test_policies(self):
+        store = self.store()
+        transfer.import_tasks(store, self.rows(3))
+
+        counts = transfer.import_tasks(store, self.rows(3, seconds=5), "skip")
+        self.assertEqual(counts["skipped"], 3)
+        self.assertEqual(store.get("task0").elapsed_ns, NS_PER_SECOND)
+
+        counts = transfer.import_tasks(store, self.rows(3, seconds=5), "sum")
+        self.assertEqual(counts["summed"], 3)
+        self.assertEqual(store.get("task0").elapsed_ns, 6 * NS_PER_SECOND)
+
+        counts = transfer.import_tasks(store, self.rows(3, seconds=2), "overwrite")
+        self.assertEqual(counts["overwritten"], 3)
+        self.assertEqual(store.get("task0").elapsed_ns, 2 * NS_PER_SECOND)
+        self.assertEqual(len(store.load()), 3)
+
+    def test_repeated_names_in_the_file(self):
+        store = self.store()
+        counts = transfer.import_tasks(store, self.rows(2) + self.rows(2), "sum")
+        self.assertEqual((counts["added"], counts["summed"]), (2, 2))
+        self.assertEqual(store.get("task1").elapsed_ns, 2 * NS_PER_SECOND)
+
+    def test_updates_are_written_in_batches(self):
+        store = self.store()
+        transfer.import_tasks(store, self.rows(50))
+
+        sizes = []
+        update = store.update
+        def counting_update(changed, removed=()):
+            sizes.append(len(changed))
+            update(changed, removed)
+        store.update = counting_update
+
+        for policy in ("overwrite", "sum"):
+            sizes.clear()
+            transfer.import_tasks(store, self.rows(50, seconds=3), policy, batch_size=10)
+            self.assertEqual(sizes, [10] * 5, policy)
+        self.assertEqual(store.get("task0").elapsed_ns, 6 * NS_PER_SECOND)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            transfer.import_tasks(self.store(), [], "merge")
+
+class ExportTest(StoreTestCase):
+
+    def test_filters(self):
+        self.create("client-a", "client-b", "home")
+        manager = self.manager()
+        manager.toggle("client-a")
+        manager.flush()
+
+        result = self.invoke("save", "--filename", "-", "--format", "jsonl", "--status", "active", "--match", "client-*")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output.count("\n"), 1)
+        self.assertIn('"task_name": "client-a"', result.output)
+
+    def test_streams_tasks(self):
+        self.create("a", "b")
+        store = self.store()
+        def load():
+            raise AssertionError("the whole store was loaded")
+        store.load = load
+
+        output = io.StringIO()
+        self.assertEqual(transfer.export_tasks(store.iter_tasks(), output, "csv"), 2)
+        self.assertEqual(output.getvalue().splitlines()[1:], ["a,Off,0.0,,,0.0,0,,", "b,Off,0.0,,,0.0,0,,"])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            transfer.export_tasks([], io.StringIO(), "xml")
+
+    def test_format_from_extension(self):
+        self.assertEqual(transfer.export_format("tasks.ndjson"), "jsonl")
+        self.assertEqual(transfer.export_format("tasks.parquet"), "parquet")
+        self.assertEqual(transfer.export_format("-"), "csv")
+        self.assertEqual(transfer.export_format("tasks.csv", "jsonl"), "jsonl")
+
+class JournalRoundTripTest(RoundTripTest):
+    backend = "journal"
+
+class SQLiteImportTest(ImportTest):
+    backend = "sqlite"